@@ -2,17 +2,33 @@
 Analysis API Endpoints
 """
 from fastapi import APIRouter, HTTPException, Depends
+from ...core.config import get_settings
 from ...models.schemas import (
     MessageAnalysisRequest,
     MessageAnalysisResponse,
     ConversationAnalysisRequest,
     ConversationAnalysisResponse,
     EmotionScore,
+    LSMScore,
+    RollingLSMSeries,
+    ResponseLatencyStats,
 )
-from ...services.emotion_analyzer import analyze_text_emotion
+from ...services.emotion_analyzer import analyze_text_emotion, analyze_conversation_emotion
+from ...services.emotion_cache import get_emotion_cache
+from ...services.emotion_coalescer import get_emotion_coalescer
+from ...services.emotion_hedging import hedging_stats
+from ...services.lexicon_emotion_analyzer import routing_stats
+from ...services.provider_executor import get_provider_executor
+from ...services.keyphrase_extractor import get_keyphrase_extractor, merge_keyphrases
+from ...services.keyword_extractor import get_keyword_extractor
+from ...services.lsm_accumulator import get_lsm_count_store
 from ...services.lsm_analyzer import LSMAnalyzer
+from ...services.message_triage import triage_stats
+from ...services.response_latency import ResponseLatencyAnalyzer, get_response_latency_store
+from ...services.tokenizer_service import get_tokenizer_service
 from ...services.turn_taking_analyzer import TurnTakingAnalyzer
-from datetime import datetime
+from datetime import date, datetime
+import asyncio
 
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
@@ -26,8 +42,11 @@ async def analyze_message(request: MessageAnalysisRequest):
     - 주제 추출 (TODO)
     """
     try:
-        # 감정 분석
-        emotion = await analyze_text_emotion(request.content)
+        # 감정 분석 (동시 요청은 마이크로 배칭으로 묶어서 호출)
+        if get_settings().emotion_coalesce_enabled:
+            emotion = await get_emotion_coalescer().submit(request.content)
+        else:
+            emotion = await analyze_text_emotion(request.content)
 
         # TODO: 주제 분석 추가
         topics = []
@@ -54,11 +73,8 @@ async def analyze_conversation(request: ConversationAnalysisRequest):
     - 관계 건강도 계산
     """
     try:
-        # 1. 감정 분석 (모든 메시지)
-        emotions = []
-        for msg in request.messages:
-            emotion = await analyze_text_emotion(msg['content'])
-            emotions.append(emotion)
+        # 1. 감정 분석 (대화 맥락을 포함한 윈도우 단위 배치)
+        emotions = await analyze_conversation_emotion(request.messages)
 
         # 감정 요약 계산
         emotion_summary = _calculate_emotion_summary(emotions)
@@ -82,8 +98,8 @@ async def analyze_conversation(request: ConversationAnalysisRequest):
         conflict_detected = emotion_summary.get('부정', 0) > 0.3
         conflict_intensity = emotion_summary.get('부정', 0) if conflict_detected else None
 
-        # 6. 키워드 추출 (TODO: 개선 필요)
-        keywords = _extract_keywords(request.messages)
+        # 6. 키워드 추출 (TextRank 키프레이즈 + 누적 df 기반 TF-IDF)
+        keywords = await asyncio.to_thread(_extract_keywords, request.messages, request.couple_id)
 
         return ConversationAnalysisResponse(
             couple_id=request.couple_id,
@@ -101,6 +117,73 @@ async def analyze_conversation(request: ConversationAnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Conversation analysis failed: {str(e)}")
 
 
+@router.post("/lsm/rolling", response_model=RollingLSMSeries)
+async def rolling_lsm(
+    request: ConversationAnalysisRequest,
+    window: int = 20,
+    window_seconds: float | None = None,
+):
+    """
+    롤링 LSM 시계열 (턴별 + 슬라이딩 윈도우)
+
+    - window: 메시지 수 기준 윈도우
+    - window_seconds: 시간 기준 윈도우 (예: 3600 → 시간 단위 흐름)
+    """
+    if window < 1:
+        raise HTTPException(status_code=400, detail="window must be >= 1")
+
+    try:
+        return await asyncio.to_thread(
+            LSMAnalyzer().rolling_lsm, request.messages, window, window_seconds
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Rolling LSM failed: {str(e)}")
+
+
+@router.get("/lsm/{couple_id}", response_model=LSMScore)
+async def lsm_for_period(couple_id: str, start_date: date, end_date: date | None = None):
+    """
+    기간 LSM 점수 (일/주/임의 기간)
+
+    일별 배치가 저장한 기능어 개수를 합산하므로 과거 메시지를 다시 분석하지 않습니다.
+    end_date를 생략하면 start_date 하루만 계산합니다.
+    """
+    end_date = end_date or start_date
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date must not be before start_date")
+
+    try:
+        return await asyncio.to_thread(get_lsm_count_store().score, couple_id, start_date, end_date)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"LSM lookup failed: {str(e)}")
+
+
+@router.post("/response-latency", response_model=ResponseLatencyStats)
+async def response_latency(request: ConversationAnalysisRequest):
+    """
+    응답 지연 분포 (분위수 + 발신자별 + 요일 × 시간 히트맵)
+    """
+    try:
+        return await asyncio.to_thread(ResponseLatencyAnalyzer().analyze, request.messages)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Response latency analysis failed: {str(e)}")
+
+
+@router.get("/response-latency/{couple_id}", response_model=ResponseLatencyStats)
+async def stored_response_latency(couple_id: str):
+    """
+    일별 배치가 저장한 커플 응답 지연 분포 (원본 메시지를 읽지 않음)
+    """
+    try:
+        stats = await asyncio.to_thread(get_response_latency_store().load, couple_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Response latency lookup failed: {str(e)}")
+
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Response latency stats not computed yet")
+    return stats
+
+
 # ===== Helper Functions =====
 
 def _calculate_emotion_summary(emotions: list[EmotionScore]) -> dict[str, float]:
@@ -176,14 +259,53 @@ def _calculate_relationship_health(
     return round(health, 2)
 
 
-def _extract_keywords(messages: list[dict]) -> list[str]:
+def _extract_keywords(messages: list[dict], couple_id: str | None = None) -> list[str]:
     """
-    간단한 키워드 추출 (TODO: 개선 필요)
+    TextRank 키프레이즈 + TF-IDF 키워드 추출 (커플 / 전체 누적 df 기준, 색인은 변경하지 않음)
+
+    Args:
+        messages: [{sender_id, content}, ...] 형태의 메시지 리스트
+        couple_id: 커플 ID
 
-    현재는 더미 구현. 추후 TF-IDF나 TextRank로 개선
+    Returns:
+        list[str]: 여러 단어 키프레이즈 → TF-IDF 키워드 순
     """
-    # 임시 키워드
-    return ['데이트', '영화', '맛집', '주말', '여행']
+    texts = [msg['content'] for msg in messages if msg.get('content')]
+    tagged = get_tokenizer_service().tokenize_tagged(texts)
+
+    keyphrases = get_keyphrase_extractor().extract(tagged)
+    keywords = get_keyword_extractor().extract(texts, couple_id=couple_id, tagged=tagged)
+    return merge_keyphrases(keyphrases, keywords)
+
+
+@router.get("/cache/stats")
+async def emotion_cache_stats():
+    """감정 분석 결과 캐시 hit/miss/eviction 통계 (+ 하이브리드 라우팅 건수)"""
+    return {
+        **get_emotion_cache().stats(),
+        'routing': dict(routing_stats),
+    }
+
+
+@router.get("/coalescer/stats")
+async def emotion_coalescer_stats():
+    """단건 메시지 마이크로 배칭 통계"""
+    return get_emotion_coalescer().stats()
+
+
+@router.get("/triage/stats")
+async def message_triage_stats():
+    """트리아지 규칙별로 절약한 LLM 호출 수 (analyzed: LLM으로 보낸 메시지 수)"""
+    return dict(triage_stats)
+
+
+@router.get("/rate-limit/stats")
+async def rate_limit_stats():
+    """제공자별 rate limit 대기열, 지연 시간, 서킷 상태, hedging 지표"""
+    return {
+        'providers': get_provider_executor().stats(),
+        'hedging': dict(hedging_stats),
+    }
 
 
 @router.get("/health")
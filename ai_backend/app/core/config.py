@@ -1,6 +1,7 @@
 """
 Configuration settings for AI backend
 """
+from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -25,9 +26,85 @@ class Settings(BaseSettings):
     openai_api_key: str | None = None
     anthropic_api_key: str | None = None
 
+    # LLM provider calls (제공자별 동시 요청 한도, 타임아웃)
+    gemini_max_concurrency: int = 8
+    openai_max_concurrency: int = 8
+    anthropic_max_concurrency: int = 4
+    llm_request_timeout_seconds: float = 30.0
+    llm_batch_timeout_seconds: float = 90.0
+    llm_max_retries: int = 4  # 429/5xx/타임아웃 재시도 횟수
+    llm_backoff_base_seconds: float = 0.5
+    llm_backoff_max_seconds: float = 20.0
+    llm_http2: bool = True  # OpenAI/Anthropic 공유 커넥션 풀 HTTP/2 사용
+    llm_max_connections: int = 20
+    llm_max_keepalive_connections: int = 10
+
+    # LLM rate limits (분당 요청 수 / 분당 토큰 수)
+    gemini_rpm: int = 1000
+    gemini_tpm: int = 1_000_000
+    openai_rpm: int = 500
+    openai_tpm: int = 200_000
+    anthropic_rpm: int = 50
+    anthropic_tpm: int = 50_000
+
+    # Hedging / failover
+    emotion_hedging_enabled: bool = False
+    emotion_hedge_providers: list[str] = []  # 보조 제공자 (비어 있으면 같은 제공자로 중복 요청)
+    emotion_hedge_min_delay_seconds: float = 1.0  # p95 표본이 부족할 때 사용하는 hedging 지연
+    emotion_hedge_max_per_minute: int = 30  # 분당 최대 중복 요청 수 (제공자 지연/스로틀 시 부하 증폭 방지)
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_window: int = 50
+    circuit_breaker_min_calls: int = 20
+    circuit_breaker_open_seconds: float = 30.0
+
+    # Pre-LLM triage (미디어/시스템/단순 반응 메시지는 규칙으로 처리)
+    emotion_triage_enabled: bool = True
+
+    # Emotion routing
+    emotion_routing: str = "llm"  # llm, local, hybrid (로컬 신뢰도 낮을 때만 LLM)
+    emotion_local_confidence_threshold: float = 0.5
+
+    # Response latency analytics
+    analysis_utc_offset_hours: int = 9  # 요일/시간 히트맵 기준 시간대 (KST)
+    response_latency_history_days: int = 90  # 일별 배치가 집계하는 기간
+
+    # Keyword extraction
+    keyword_top_k: int = 10
+    keyword_index_ttl_seconds: float = 600.0  # df 색인 캐시를 DB에서 다시 읽는 주기 (다른 워커가 더한 문서 반영)
+    keyphrase_top_k: int = 5  # TextRank 여러 단어 키프레이즈 최대 개수 (keywords 앞쪽에 배치)
+    textrank_window: int = Field(3, ge=2)  # 동시출현 간선을 만드는 후보 명사 거리 (2 이상, 2 = 바로 옆 명사만)
+
+    # Chat export parsing (대용량 txt/csv 병렬 파싱)
+    file_parse_workers: int = 0  # 파싱 프로세스 수 (0: CPU 코어 수, 1: 병렬 파싱 안 함)
+    parallel_parse_min_bytes: int = 16 * 1024 * 1024  # 이 크기 이상 파일만 구간 병렬 파싱
+
+    # PDF text extraction (페이지 구간을 파싱 프로세스 풀에서 추출)
+    pdf_page_workers: int = 0  # 동시에 추출하는 페이지 구간 수 (0: file_parse_workers와 같음)
+    pdf_page_timeout_seconds: float = 30.0  # 페이지 1장 추출 제한 시간, 넘기면 그 페이지만 건너뜀 (0: 제한 없음)
+
+    # Tokenizer (Kiwi)
+    kiwi_num_workers: int = -1  # 배치 형태소 분석 워커 수 (-1: 전체 코어, 0: 단일 스레드)
+
+    # Emotion batch analysis
+    emotion_batch_max_chars: int = 6000  # 배치 프롬프트당 메시지 문자 예산 (토큰 근사치)
+    emotion_batch_max_items: int = 50  # 배치당 최대 메시지 수
+    emotion_context_messages: int = 5  # 대화 분석 윈도우마다 앞에 붙이는 맥락 메시지 수
+
+    # /analysis/message 요청 마이크로 배칭
+    emotion_coalesce_enabled: bool = True
+    emotion_coalesce_max_wait_ms: float = 10.0  # 요청을 모으는 최대 대기 시간
+    emotion_coalesce_max_batch_size: int = 32
+
     # Redis (Optional)
     redis_url: str = "redis://localhost:6379"
 
+    # Emotion result cache
+    emotion_cache_enabled: bool = True
+    emotion_cache_max_entries: int = 10000  # 프로세스 내 LRU 최대 항목 수
+    emotion_cache_ttl_seconds: int = 60 * 60 * 24 * 7  # 7일
+    emotion_cache_sqlite_path: str | None = None  # 설정 시 SQLite 디스크 캐시 사용
+    emotion_cache_use_redis: bool = False  # True면 redis_url로 Redis 캐시 사용
+
     # CORS
     allowed_origins: list[str] = [
         "http://localhost:3000",
@@ -3,6 +3,7 @@ GemOphia AI Backend
 FastAPI Main Application
 """
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from fastapi import FastAPI
@@ -10,6 +11,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from .core.config import get_settings
 from .api.v1 import analysis
 from .listeners.file_upload_listener import get_file_upload_listener
+from .services.emotion_cache import get_emotion_cache
+from .services.file_processors.parallel_parser import shutdown_parse_executor
+from .services.provider_registry import get_provider_registry
+from .services.tokenizer_service import get_tokenizer_service
 
 # Logging
 logging.basicConfig(
@@ -27,12 +32,19 @@ async def lifespan(app: FastAPI):
     """
     FastAPI 앱 생명주기 관리
 
-    시작 시: Realtime Listener 시작
-    종료 시: Realtime Listener 중지
+    시작 시: LLM 클라이언트 / Kiwi 형태소 분석기 warm-up, Realtime Listener 시작
+    종료 시: Realtime Listener 중지, 파싱 프로세스 풀 / LLM 커넥션 풀 종료
     """
     # Startup
     logger.info("🚀 Starting GemOphia AI Backend...")
 
+    # LLM 제공자 클라이언트 미리 생성 (요청마다 재생성하지 않음)
+    provider_registry = get_provider_registry()
+    await provider_registry.warm_up()
+
+    # Kiwi 모델 로드 (요청마다 로드하지 않도록 시작 시 한 번, 이벤트 루프 밖에서)
+    await asyncio.to_thread(get_tokenizer_service().warm_up)
+
     file_listener = None
     try:
         # File Upload Realtime Listener 시작 (async)
@@ -55,6 +67,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping File Upload Realtime Listener: {e}")
 
+    # 파일 파싱 프로세스 풀 종료
+    await asyncio.to_thread(shutdown_parse_executor)
+
+    # 감정 분석 캐시 연결 정리 (SQLite, Redis)
+    await get_emotion_cache().close()
+
+    # LLM 커넥션 풀 종료
+    await provider_registry.aclose()
+    logger.info("✅ LLM provider clients closed")
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -5,9 +5,56 @@ from datetime import datetime
 
 # ===== Analysis Core Models =====
 
+class PairwiseLSM(BaseModel):
+    """참여자 쌍별 LSM 행렬 (단톡방 등 3명 이상 대화)"""
+    participants: List[str]
+    matrix: List[List[float]]  # matrix[i][j] = participants[i]와 participants[j]의 LSM 점수
+
+
 class LSMScore(BaseModel):
     lsm_score: float
     category_breakdown: Dict[str, float]
+    pairwise: Optional[PairwiseLSM] = None
+
+
+class RollingLSMSeries(BaseModel):
+    """대화 흐름에 따른 LSM 시계열 (배열 기반)"""
+    window: int  # 윈도우 크기 (메시지 수, 시간 윈도우 사용 시 0)
+    window_seconds: Optional[float] = None  # 시간 윈도우 크기 (초)
+    message_index: List[int]  # 각 윈도우의 마지막 메시지 인덱스
+    window_scores: List[float]  # 윈도우별 LSM 점수 (0~1)
+    turn_index: List[int]  # 각 턴의 첫 메시지 인덱스 (두 번째 턴부터)
+    turn_scores: List[float]  # 턴별 직전 상대 턴과의 LSM 점수 (0~1)
+
+
+class ParticipantTurnStats(BaseModel):
+    """참여자별 턴테이킹 통계"""
+    sender_id: str
+    message_count: int
+    message_share: float  # 전체 메시지 중 비율
+    turn_count: int  # 연속 메시지 묶음(턴) 수
+    avg_message_length: float
+    avg_response_time: float  # 다른 참여자 메시지에 응답하기까지 평균 시간 (초)
+
+
+class SenderLatency(BaseModel):
+    """발신자별 응답 지연 분위수 (초)"""
+    sender_id: str
+    response_count: int
+    p50: float
+    p90: float
+    p99: float
+
+
+class ResponseLatencyStats(BaseModel):
+    """응답 지연 분포 (분위수 + 요일 × 시간 히트맵)"""
+    response_count: int
+    p50: float  # 초
+    p90: float
+    p99: float
+    per_sender: List[SenderLatency]
+    heatmap_counts: List[List[int]]  # [요일(0=월)][시(0-23)] 응답 수
+    heatmap_median: List[List[float]]  # [요일][시] 응답 지연 중앙값 (초, 응답 없으면 0)
 
 
 class TurnTakingAnalysis(BaseModel):
@@ -15,6 +62,7 @@ class TurnTakingAnalysis(BaseModel):
     turn_ratio: float
     avg_response_time: float
     interruption_rate: float
+    participants: Optional[List[ParticipantTurnStats]] = None
 
 
 class EmotionScore(BaseModel):
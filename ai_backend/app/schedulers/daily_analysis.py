@@ -1,17 +1,23 @@
+import asyncio
 import logging
 from datetime import date, datetime
 from collections import Counter
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from ..core.supabase import get_supabase_client
-from ..services.lsm_analyzer import LSMAnalyzer
+from ..services.keyphrase_extractor import get_keyphrase_extractor, merge_keyphrases
+from ..services.keyword_extractor import get_keyword_extractor
+from ..services.lsm_accumulator import get_lsm_count_store
 from ..services.turn_taking_analyzer import TurnTakingAnalyzer
-from ..services.emotion_analyzer import analyze_text_emotion
+from ..services.turn_taking_store import get_turn_taking_store
+from ..services.emotion_analyzer import get_emotion_analyzer
+from ..services.rate_limiter import bulk_priority
+from ..services.response_latency import get_response_latency_store
+from ..services.tokenizer_service import get_tokenizer_service
 
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
-lsm_analyzer = LSMAnalyzer()
 turn_taking_analyzer = TurnTakingAnalyzer()
 
 def calculate_emotion_summary(messages: list[dict]) -> dict:
@@ -53,6 +59,49 @@ def calculate_emotion_summary(messages: list[dict]) -> dict:
         "부정": round(emotion_counts["부정"] / total_messages, 2)
     }
 
+async def fill_missing_sentiment(messages: list[dict]) -> list[dict]:
+    """
+    sentiment가 비어 있는 메시지를 대화 맥락과 함께 분석해 채웁니다.
+    (이미 분석된 메시지는 맥락으로만 사용)
+
+    Returns:
+        sentiment를 새로 채운 메시지 행 목록
+    """
+    targets = [i for i, msg in enumerate(messages) if not msg.get('sentiment') and msg.get('content')]
+    if not targets:
+        return []
+
+    try:
+        results = await get_emotion_analyzer().analyze_conversation_emotions(messages, targets)
+    except Exception as e:
+        logger.warning(f"Emotion analysis for {len(targets)} messages failed: {e}")
+        return []
+
+    filled = []
+    for i, score in zip(targets, results):
+        messages[i]['sentiment'] = score.emotion
+        filled.append(messages[i])
+    return filled
+
+
+def save_filled_sentiment(supabase, filled: list[dict]):
+    """
+    채운 sentiment를 conversations에 한 번의 upsert로 저장 (동기 함수, 배치에서는 스레드에서 실행)
+
+    다음 날 배치나 API가 같은 메시지를 다시 분석하지 않도록 합니다.
+    조회한 행 전체를 보내므로 NOT NULL 컬럼이 빠지지 않습니다.
+    """
+    rows = [row for row in filled if row.get('id') is not None]
+    if not rows:
+        return
+
+    try:
+        supabase.table('conversations').upsert(rows, on_conflict='id').execute()
+        logger.info(f"💾 Saved sentiment for {len(rows)} messages")
+    except Exception as e:
+        logger.warning(f"Saving sentiment for {len(rows)} messages failed: {e}")
+
+
 def calculate_health_score(emotion_summary: dict, lsm_score: float, balance_score: float) -> float:
     """
     관계 건강도 계산
@@ -69,6 +118,23 @@ def calculate_health_score(emotion_summary: dict, lsm_score: float, balance_scor
     )
     return min(health_score, 100.0)
 
+def extract_day_keywords(couple_id: str, analysis_date: date, messages: list[dict]) -> list:
+    """
+    그 날 대화의 키워드 (동기 함수, 배치에서는 스레드에서 실행)
+
+    형태소 분석은 한 번만 하고 TextRank 키프레이즈와 누적 df 색인 TF-IDF 키워드에 함께 사용합니다.
+    """
+    texts = [msg['content'] for msg in messages if msg.get('content')]
+    tagged = get_tokenizer_service().tokenize_tagged(texts)
+    keyphrases = get_keyphrase_extractor().extract(tagged)
+    keywords = get_keyword_extractor().extract_and_update(
+        couple_id,
+        str(analysis_date),
+        texts,
+        tagged=tagged,
+    )
+    return merge_keyphrases(keyphrases, keywords)
+
 async def analyze_couple_day(couple_id: str, analysis_date: date):
     """특정 커플의 하루 대화 분석"""
     supabase = get_supabase_client()
@@ -85,6 +151,7 @@ async def analyze_couple_day(couple_id: str, analysis_date: date):
             .eq('couple_id', couple_id)\
             .gte('created_at', start_time)\
             .lte('created_at', end_time)\
+            .order('created_at')\
             .execute()
         
         messages = response.data
@@ -93,17 +160,24 @@ async def analyze_couple_day(couple_id: str, analysis_date: date):
             logger.info(f"Couple {couple_id}: Not enough messages ({len(messages)})")
             return
 
-        # 2. 감정 요약
+        # 2. 감정 요약 (미분석 메시지는 맥락 윈도우로 분석)
+        filled = await fill_missing_sentiment(messages)
+        await asyncio.to_thread(save_filled_sentiment, supabase, filled)
         emotion_summary = calculate_emotion_summary(messages)
         
         # 지배적인 감정 찾기 (단순화: 가장 높은 비율)
         dominant_emotion = max(emotion_summary.items(), key=lambda x: x[1])[0]
 
-        # 3. LSM 분석
-        lsm_result = lsm_analyzer.analyze_conversation(messages)
+        # 3. LSM 분석 (새 메시지만 누적 후 저장된 일별 개수로 계산)
+        #    (형태소 분석 / Supabase 호출은 동기라 스레드에서 실행해 이벤트 루프를 막지 않음)
+        lsm_store = get_lsm_count_store()
+        await asyncio.to_thread(lsm_store.update, couple_id, messages)
+        lsm_result = await asyncio.to_thread(lsm_store.score, couple_id, analysis_date, analysis_date)
 
-        # 4. 턴테이킹 분석
+        # 4. 턴테이킹 분석 (그 날 대화 + 커플 누적 상태에 새 메시지만 반영)
         turn_taking_result = turn_taking_analyzer.analyze_conversation(messages)
+        turn_taking_state = await asyncio.to_thread(get_turn_taking_store().update, couple_id, messages)
+        cumulative_turn_taking = turn_taking_state.snapshot()
 
         # 5. 관계 건강도 계산
         relationship_health = calculate_health_score(
@@ -116,8 +190,8 @@ async def analyze_couple_day(couple_id: str, analysis_date: date):
         conflict_detected = emotion_summary.get('부정', 0) > 0.3
         conflict_intensity = emotion_summary.get('부정', 0) if conflict_detected else 0.0
 
-        # 7. 키워드 추출 (TODO: TextRank 구현 필요, 현재는 빈 리스트)
-        keywords = []
+        # 7. 키워드 추출 (TextRank 키프레이즈 + 그 날 문서를 누적 df 색인에 더한 뒤 TF-IDF)
+        keywords = await asyncio.to_thread(extract_day_keywords, couple_id, analysis_date, messages)
 
         # 8. conversation_analysis 저장
         analysis_data = {
@@ -131,7 +205,14 @@ async def analyze_couple_day(couple_id: str, analysis_date: date):
                 'balance_score': turn_taking_result.balance_score,
                 'turn_ratio': turn_taking_result.turn_ratio,
                 'avg_response_time': turn_taking_result.avg_response_time,
-                'interruption_rate': turn_taking_result.interruption_rate
+                'interruption_rate': turn_taking_result.interruption_rate,
+                # 커플 전체 기간 누적 (응답 시간 분위수는 스케치 추정값, 초)
+                'cumulative': {
+                    'balance_score': cumulative_turn_taking.balance_score,
+                    'avg_response_time': cumulative_turn_taking.avg_response_time,
+                    'response_time_p50': turn_taking_state.response_time_quantile(0.5),
+                    'response_time_p90': turn_taking_state.response_time_quantile(0.9),
+                }
             },
             'relationship_health': float(relationship_health),
             'conflict_detected': conflict_detected,
@@ -143,6 +224,9 @@ async def analyze_couple_day(couple_id: str, analysis_date: date):
             .upsert(analysis_data, on_conflict='couple_id,analysis_date')\
             .execute()
 
+        # 9. 응답 지연 분포 갱신 (차트용, 새 메시지만 조회해 일별 표본에 반영 후 최근 기간 분포 계산)
+        await asyncio.to_thread(get_response_latency_store().refresh, couple_id, analysis_date)
+
         logger.info(
             f"✅ Daily analysis complete for couple {couple_id}: "
             f"Health={relationship_health:.1f}, Conflict={conflict_detected}"
@@ -164,8 +248,13 @@ async def daily_conversation_analysis():
         response = supabase.table('couples').select('id').execute()
         couples = response.data
 
-        for couple in couples:
-            await analyze_couple_day(couple['id'], today)
-            
+        # 배치 작업의 LLM 호출은 API 요청보다 뒤로 (BULK 우선순위)
+        with bulk_priority():
+            for couple in couples:
+                await analyze_couple_day(couple['id'], today)
+
+        # 전체 df 색인은 배치 끝에 한 번만 저장
+        await asyncio.to_thread(get_keyword_extractor().flush)
+
     except Exception as e:
         logger.error(f"Error in daily analysis job: {e}", exc_info=True)
@@ -0,0 +1,129 @@
+"""
+Circuit Breaker
+
+최근 호출의 오류율이 임계값을 넘은 제공자를 일정 시간 차단합니다.
+
+상태:
+- closed: 정상 호출
+- open: 즉시 실패 (open_seconds 동안)
+- half_open: 시험 호출 1건 허용 → 성공 시 closed, 실패 시 다시 open
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """차단된 제공자 호출 시 발생"""
+    pass
+
+
+class CircuitBreaker:
+    """슬라이딩 윈도우 오류율 기반 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float,
+        window_size: int,
+        min_calls: int,
+        open_seconds: float,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self._outcomes: deque = deque(maxlen=window_size)
+        self._lock = threading.Lock()
+        self.state = "closed"
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        """지금 호출해도 되는지 여부 (half_open 전환 시 시험 호출 1건만 허용)"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    return False
+                self.state = "half_open"
+                self._probe_in_flight = False
+
+            # half_open
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def is_open(self) -> bool:
+        """호출을 시도하지 않고 차단 상태인지만 확인"""
+        with self._lock:
+            return self.state == "open" and time.monotonic() - self._opened_at < self.open_seconds
+
+    def record_success(self):
+        with self._lock:
+            self._outcomes.append(True)
+            if self.state == "half_open":
+                logger.info(f"✅ Circuit closed for {self.name}")
+                self.state = "closed"
+                self._outcomes.clear()
+
+    def record_failure(self):
+        with self._lock:
+            self._outcomes.append(False)
+
+            if self.state == "half_open":
+                self._open()
+                return
+
+            if self.state == "closed" and len(self._outcomes) >= self.min_calls:
+                failure_rate = self._outcomes.count(False) / len(self._outcomes)
+                if failure_rate >= self.failure_rate_threshold:
+                    self._open()
+
+    def cancel_probe(self):
+        """시험 호출이 결과 없이 취소된 경우 다음 시험 호출 허용"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _open(self):
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        logger.warning(f"🚫 Circuit opened for {self.name} ({self.open_seconds}s)")
+
+    def stats(self) -> dict:
+        with self._lock:
+            calls = len(self._outcomes)
+            return {
+                'state': self.state,
+                'window_calls': calls,
+                'failure_rate': round(self._outcomes.count(False) / calls, 3) if calls else 0.0,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """제공자별 서킷 브레이커 반환"""
+    with _breakers_lock:
+        if provider not in _breakers:
+            settings = get_settings()
+            _breakers[provider] = CircuitBreaker(
+                name=provider,
+                failure_rate_threshold=settings.circuit_breaker_failure_rate,
+                window_size=settings.circuit_breaker_window,
+                min_calls=settings.circuit_breaker_min_calls,
+                open_seconds=settings.circuit_breaker_open_seconds,
+            )
+        return _breakers[provider]
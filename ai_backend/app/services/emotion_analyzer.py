@@ -4,10 +4,17 @@ Supports multiple AI providers: Gemini, OpenAI, Claude
 """
 from abc import ABC, abstractmethod
 from typing import Literal
+import asyncio
 import json
+import logging
 import google.generativeai as genai
 from ..core.config import get_settings
 from ..models.schemas import EmotionScore
+from .provider_executor import get_provider_executor
+from .rate_limiter import estimate_tokens
+from .provider_registry import get_provider_registry
+
+logger = logging.getLogger(__name__)
 
 
 # ===== Abstract Base Class =====
@@ -17,20 +24,416 @@ class BaseEmotionAnalyzer(ABC):
 
     EMOTIONS = ["기쁨", "슬픔", "화남", "불안", "중립", "사랑", "피곤"]
 
+    # 캐시 키 구성 요소 (프롬프트를 바꾸면 PROMPT_VERSION을 올려 기존 캐시 무효화)
+    PROMPT_VERSION = "v1"
+    provider: str = "unknown"
+    model_name: str = "unknown"
+
     @abstractmethod
     async def analyze_emotion(self, text: str) -> EmotionScore:
         """Analyze emotion of the given text"""
         pass
 
+    async def analyze_emotions_batch(self, texts: list[str]) -> list[EmotionScore]:
+        """
+        여러 메시지의 감정을 한 번에 분석
+
+        기본 구현은 메시지마다 analyze_emotion을 호출합니다.
+        LLM 기반 분석기는 여러 메시지를 하나의 프롬프트로 묶어 처리합니다.
+
+        Args:
+            texts: 분석할 텍스트 리스트
+
+        Returns:
+            list[EmotionScore]: 입력 순서와 동일한 감정 분석 결과
+        """
+        return [await self.analyze_emotion(text) for text in texts]
+
+    async def analyze_conversation_emotions(
+        self,
+        messages: list[dict],
+        targets: list[int] | None = None,
+    ) -> list[EmotionScore]:
+        """
+        대화 맥락을 고려한 메시지별 감정 분석
+
+        기본 구현은 맥락 없이 배치 분석합니다.
+        LLM 기반 분석기는 앞뒤 메시지를 함께 보여주는 윈도우 단위로 분석합니다.
+
+        Args:
+            messages: [{sender_id, content}, ...] 형태의 대화 메시지 (시간순)
+            targets: 점수를 매길 메시지 인덱스 (None이면 전체). 나머지는 맥락으로만 사용
+
+        Returns:
+            list[EmotionScore]: targets 순서와 동일한 감정 분석 결과
+        """
+        if targets is None:
+            targets = list(range(len(messages)))
+        return await self.analyze_emotions_batch([messages[i]['content'] for i in targets])
+
+    def _build_emotion_score(self, scores: dict) -> EmotionScore:
+        """점수 딕셔너리에서 EmotionScore 생성 (지배적 감정 선택)"""
+        dominant_emotion = max(scores.items(), key=lambda x: x[1])
+
+        return EmotionScore(
+            emotion=dominant_emotion[0],
+            confidence=dominant_emotion[1],
+            all_scores=scores
+        )
+
+
+# ===== Prompt-packing Batch Base =====
+
+def _strip_code_block(response_text: str) -> str:
+    """LLM 응답에서 markdown 코드 블록 제거"""
+    response_text = response_text.strip()
+
+    if response_text.startswith("```json"):
+        response_text = response_text.replace("```json", "").replace("```", "").strip()
+    elif response_text.startswith("```"):
+        response_text = response_text.replace("```", "").strip()
+
+    return response_text
+
+
+def split_into_batches(texts: list[str], max_chars: int, max_items: int) -> list[list[int]]:
+    """
+    문자 예산과 최대 개수에 맞춰 메시지 인덱스를 배치로 분할
+
+    예산보다 긴 단일 메시지는 혼자 하나의 배치가 됩니다.
+
+    Args:
+        texts: 메시지 텍스트 리스트
+        max_chars: 배치당 최대 문자 수 (토큰 예산 근사치)
+        max_items: 배치당 최대 메시지 수
+
+    Returns:
+        list[list[int]]: 배치별 원본 인덱스 리스트
+    """
+    batches = []
+    current = []
+    current_chars = 0
+
+    for i, text in enumerate(texts):
+        length = len(text)
+        if current and (current_chars + length > max_chars or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append(i)
+        current_chars += length
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+class LLMEmotionAnalyzer(BaseEmotionAnalyzer):
+    """
+    여러 메시지를 번호가 매겨진 하나의 프롬프트로 묶어 분석하는 LLM 분석기 베이스
+
+    하위 클래스는 _generate_batch로 프롬프트에 대한 원본 응답만 돌려주면 됩니다.
+    """
+
+    @abstractmethod
+    async def _generate_batch(self, prompt: str) -> str:
+        """배치 프롬프트를 LLM에 보내고 원본 응답 텍스트 반환"""
+        pass
+
+    async def _call_provider(self, make_call, prompt: str, batch: bool = False):
+        """제공자별 rate limit, 동시성 한도, 타임아웃, 재시도를 적용해 SDK 비동기 호출 실행"""
+        return await get_provider_executor().run(
+            self.provider,
+            make_call,
+            timeout=get_settings().llm_batch_timeout_seconds if batch else None,
+            estimated_tokens=estimate_tokens(prompt),
+            latency_key=f"{self.provider}:batch" if batch else self.provider,
+        )
+
+    async def analyze_emotions_batch(self, texts: list[str]) -> list[EmotionScore]:
+        """
+        여러 메시지를 문자 예산에 맞춰 배치로 묶어 분석
+
+        응답에서 누락되거나 형식이 잘못된 메시지는 단건 분석으로 다시 요청합니다.
+
+        Args:
+            texts: 분석할 텍스트 리스트
+
+        Returns:
+            list[EmotionScore]: 입력 순서와 동일한 감정 분석 결과
+        """
+        if not texts:
+            return []
+
+        settings = get_settings()
+        batches = split_into_batches(
+            texts,
+            max_chars=settings.emotion_batch_max_chars,
+            max_items=settings.emotion_batch_max_items,
+        )
+
+        batch_results = await asyncio.gather(
+            *(self._analyze_batch([texts[i] for i in batch]) for batch in batches)
+        )
+
+        results: list[EmotionScore | None] = [None] * len(texts)
+        for batch, scores in zip(batches, batch_results):
+            for i, score in zip(batch, scores):
+                results[i] = score
+
+        return results
+
+    async def _analyze_batch(self, texts: list[str]) -> list[EmotionScore]:
+        """단일 배치 분석 (누락된 결과는 단건 분석으로 보완)"""
+        if len(texts) == 1:
+            return [await self.analyze_emotion(texts[0])]
+
+        return await self._analyze_prompt(self._build_batch_prompt(texts), texts)
+
+    async def _analyze_prompt(self, prompt: str, texts: list[str]) -> list[EmotionScore]:
+        """
+        번호가 매겨진 프롬프트를 한 번 호출하고 결과를 재정렬
+
+        Args:
+            prompt: [0]..[n-1] 번호가 매겨진 배치 프롬프트
+            texts: 번호 순서의 대상 텍스트 (단건 재시도용)
+
+        Returns:
+            list[EmotionScore]: texts 순서와 동일한 결과
+        """
+        try:
+            response_text = await self._generate_batch(prompt)
+            parsed = self._parse_batch_response(response_text, len(texts))
+        except Exception as e:
+            logger.warning(f"Batch emotion analysis failed ({len(texts)} messages), falling back: {e}")
+            parsed = {}
+
+        missing = [i for i in range(len(texts)) if i not in parsed]
+        if missing:
+            logger.warning(f"Batch response missing {len(missing)}/{len(texts)} results, retrying individually")
+            retried = await asyncio.gather(*(self.analyze_emotion(texts[i]) for i in missing))
+            for i, score in zip(missing, retried):
+                parsed[i] = score
+
+        return [parsed[i] for i in range(len(texts))]
+
+    def _build_batch_prompt(self, texts: list[str]) -> str:
+        """번호가 매겨진 배치 프롬프트 생성"""
+        numbered = '\n'.join(
+            f"[{i}] {json.dumps(text, ensure_ascii=False)}" for i, text in enumerate(texts)
+        )
+
+        return f"""다음은 번호가 매겨진 한국어 메시지 {len(texts)}개입니다. 각 메시지의 감정을 분석해주세요.
+
+{numbered}
+
+{self._batch_instructions()}"""
+
+    def _batch_instructions(self) -> str:
+        """배치/대화 프롬프트 공통 감정 설명 + 응답 형식"""
+        example = ', '.join(f'"{emotion}": 0.0' for emotion in self.EMOTIONS)
+
+        return f"""각 메시지마다 다음 7가지 감정에 대해 0~1 사이의 점수를 매겨주세요:
+- 기쁨: 행복, 즐거움, 기쁨
+- 슬픔: 슬픔, 우울, 외로움
+- 화남: 화, 짜증, 분노
+- 불안: 걱정, 불안, 긴장
+- 중립: 평범함, 사실 전달
+- 사랑: 애정, 사랑, 호감
+- 피곤: 피곤함, 지침, 무기력
+
+반드시 아래 JSON 형식으로만 응답해주세요 (다른 텍스트 없이, 모든 번호에 대해 하나씩):
+{{"results": [{{"index": 0, {example}}}]}}"""
+
+    async def analyze_conversation_emotions(
+        self,
+        messages: list[dict],
+        targets: list[int] | None = None,
+    ) -> list[EmotionScore]:
+        """
+        대화를 겹치는 윈도우로 나눠 맥락과 함께 분석
+
+        각 윈도우는 문자 예산(emotion_batch_max_chars) 안에서 대상 메시지를 담고,
+        첫 대상 앞의 메시지 emotion_context_messages개를 맥락으로 함께 보여줍니다.
+        (앞 윈도우와 겹치는 구간) 윈도우들은 동시에 처리됩니다.
+
+        Args:
+            messages: [{sender_id, content}, ...] 형태의 대화 메시지 (시간순)
+            targets: 점수를 매길 메시지 인덱스 (None이면 전체). 나머지는 맥락으로만 사용
+
+        Returns:
+            list[EmotionScore]: targets 순서와 동일한 감정 분석 결과
+        """
+        if targets is None:
+            targets = list(range(len(messages)))
+        if not targets:
+            return []
+
+        settings = get_settings()
+        speakers = self._speaker_labels(messages)
+        windows = self._build_context_windows(
+            messages,
+            targets,
+            max_chars=settings.emotion_batch_max_chars,
+            max_items=settings.emotion_batch_max_items,
+            context_messages=settings.emotion_context_messages,
+        )
+
+        window_results = await asyncio.gather(*(
+            self._analyze_prompt(
+                self._build_conversation_prompt(messages, speakers, start, window_targets),
+                [messages[i]['content'] for i in window_targets],
+            )
+            for start, window_targets in windows
+        ))
+
+        scores = {}
+        for (_, window_targets), results in zip(windows, window_results):
+            scores.update(zip(window_targets, results))
+
+        return [scores[i] for i in targets]
+
+    def _speaker_labels(self, messages: list[dict]) -> dict:
+        """발신자 ID를 짧은 라벨(A, B, C...)로 치환 (토큰 절약 + 익명화)"""
+        labels = {}
+        for msg in messages:
+            sender = msg.get('sender_id', msg.get('sender'))
+            if sender not in labels:
+                index = len(labels)
+                labels[sender] = chr(ord('A') + index) if index < 26 else f"P{index}"
+        return labels
+
+    def _build_context_windows(
+        self,
+        messages: list[dict],
+        targets: list[int],
+        max_chars: int,
+        max_items: int,
+        context_messages: int,
+    ) -> list[tuple[int, list[int]]]:
+        """
+        대상 메시지를 문자 예산에 맞는 윈도우로 분할
+
+        Returns:
+            list[tuple[int, list[int]]]: (맥락 시작 인덱스, 윈도우 대상 인덱스들)
+        """
+        windows = []
+        current: list[int] = []
+        start = 0
+        used = 0
+
+        for i in sorted(targets):
+            if current:
+                # 이전 대상과 현재 대상 사이 맥락 메시지까지 예산에 반영
+                added = sum(len(messages[j]['content']) for j in range(current[-1] + 1, i + 1))
+                if used + added > max_chars or len(current) >= max_items:
+                    windows.append((start, current))
+                    current = []
+
+            if not current:
+                start, used = self._context_start(messages, i, context_messages, max_chars // 2)
+                added = len(messages[i]['content'])
+
+            current.append(i)
+            used += added
+
+        if current:
+            windows.append((start, current))
+
+        return windows
+
+    def _context_start(
+        self,
+        messages: list[dict],
+        first: int,
+        context_messages: int,
+        max_chars: int,
+    ) -> tuple[int, int]:
+        """윈도우 첫 대상 앞에 붙일 맥락 시작 인덱스와 맥락 글자 수 (맥락은 max_chars 이내)"""
+        start = first
+        used = 0
+        while start > 0 and first - start < context_messages:
+            length = len(messages[start - 1]['content'])
+            if used + length > max_chars:
+                break
+            start -= 1
+            used += length
+        return start, used
+
+    def _build_conversation_prompt(
+        self,
+        messages: list[dict],
+        speakers: dict,
+        start: int,
+        targets: list[int],
+    ) -> str:
+        """맥락 메시지([맥락])와 대상 메시지([번호])를 시간순으로 나열한 프롬프트 생성"""
+        numbers = {i: n for n, i in enumerate(targets)}
+        lines = []
+        for j in range(start, targets[-1] + 1):
+            msg = messages[j]
+            speaker = speakers[msg.get('sender_id', msg.get('sender'))]
+            marker = f"[{numbers[j]}]" if j in numbers else "[맥락]"
+            lines.append(f"{marker} {speaker}: {json.dumps(msg['content'], ensure_ascii=False)}")
+        conversation = '\n'.join(lines)
+
+        return f"""다음은 연인 간 한국어 대화의 일부입니다. A, B는 화자입니다.
+[맥락] 메시지는 참고용이며, 번호가 매겨진 메시지 {len(targets)}개만 앞뒤 대화 흐름을 고려해 감정을 분석해주세요.
+(예: 다툼 직후의 "ㅇㅇ"은 중립이 아닐 수 있습니다)
+
+{conversation}
+
+{self._batch_instructions()}"""
+
+    def _parse_batch_response(self, response_text: str, expected: int) -> dict[int, EmotionScore]:
+        """
+        배치 응답을 검증하고 원래 인덱스에 맞게 재정렬
+
+        Args:
+            response_text: LLM 원본 응답
+            expected: 배치 내 메시지 수
+
+        Returns:
+            dict[int, EmotionScore]: 유효한 결과만 담은 {인덱스: 결과}
+        """
+        data = json.loads(_strip_code_block(response_text))
+        items = data.get('results', []) if isinstance(data, dict) else data
+
+        parsed = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get('index'))
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < expected or index in parsed:
+                continue
+
+            scores = {}
+            for emotion in self.EMOTIONS:
+                try:
+                    value = float(item.get(emotion, 0.0))
+                except (TypeError, ValueError):
+                    value = 0.0
+                scores[emotion] = max(0.0, min(1.0, value))
+
+            parsed[index] = self._build_emotion_score(scores)
+
+        return parsed
+
 
 # ===== Gemini Implementation =====
 
-class GeminiEmotionAnalyzer(BaseEmotionAnalyzer):
+class GeminiEmotionAnalyzer(LLMEmotionAnalyzer):
     """Gemini API를 사용한 감정 분석"""
 
-    def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')  # 가장 빠르고 저렴
+    provider = "gemini"
+    model_name = "gemini-1.5-flash"  # 가장 빠르고 저렴
+
+    def __init__(self, model: genai.GenerativeModel):
+        self.model = model
 
     async def analyze_emotion(self, text: str) -> EmotionScore:
         """Gemini를 사용한 감정 분석"""
@@ -59,42 +462,40 @@ class GeminiEmotionAnalyzer(BaseEmotionAnalyzer):
   "피곤": 0.0
 }}"""
 
-        response = self.model.generate_content(
+        response = await self._call_provider(lambda: self.model.generate_content_async(
             prompt,
             generation_config=genai.types.GenerationConfig(
                 temperature=0.3,
             )
-        )
-
-        # Parse JSON response
-        response_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json", "").replace("```", "").strip()
-        elif response_text.startswith("```"):
-            response_text = response_text.replace("```", "").strip()
+        ), prompt)
 
-        scores = json.loads(response_text)
+        # Parse JSON response (markdown 코드 블록 제거)
+        scores = json.loads(_strip_code_block(response.text))
 
-        # Find dominant emotion
-        dominant_emotion = max(scores.items(), key=lambda x: x[1])
+        return self._build_emotion_score(scores)
 
-        return EmotionScore(
-            emotion=dominant_emotion[0],
-            confidence=dominant_emotion[1],
-            all_scores=scores
-        )
+    async def _generate_batch(self, prompt: str) -> str:
+        """Gemini 배치 호출"""
+        response = await self._call_provider(lambda: self.model.generate_content_async(
+            prompt,
+            generation_config=genai.types.GenerationConfig(
+                temperature=0.3,
+                response_mime_type="application/json",
+            )
+        ), prompt, batch=True)
+        return response.text
 
 
 # ===== OpenAI Implementation (Optional) =====
 
-class OpenAIEmotionAnalyzer(BaseEmotionAnalyzer):
+class OpenAIEmotionAnalyzer(LLMEmotionAnalyzer):
     """OpenAI GPT를 사용한 감정 분석"""
 
-    def __init__(self, api_key: str):
-        from openai import OpenAI
-        self.client = OpenAI(api_key=api_key)
+    provider = "openai"
+    model_name = "gpt-4o-mini"
+
+    def __init__(self, client):
+        self.client = client  # AsyncOpenAI (ProviderRegistry에서 공유)
 
     async def analyze_emotion(self, text: str) -> EmotionScore:
         """OpenAI GPT를 사용한 감정 분석"""
@@ -109,34 +510,44 @@ class OpenAIEmotionAnalyzer(BaseEmotionAnalyzer):
 JSON 형식으로만 응답:
 {{"기쁨": 0.0, "슬픔": 0.0, "화남": 0.0, "불안": 0.0, "중립": 0.0, "사랑": 0.0, "피곤": 0.0}}"""
 
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
+        response = await self._call_provider(lambda: self.client.chat.completions.create(
+            model=self.model_name,
             messages=[
                 {"role": "system", "content": "당신은 한국어 감정 분석 전문가입니다. JSON 형식으로만 응답하세요."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
             response_format={"type": "json_object"}
-        )
+        ), prompt)
 
         scores = json.loads(response.choices[0].message.content)
-        dominant_emotion = max(scores.items(), key=lambda x: x[1])
 
-        return EmotionScore(
-            emotion=dominant_emotion[0],
-            confidence=dominant_emotion[1],
-            all_scores=scores
-        )
+        return self._build_emotion_score(scores)
+
+    async def _generate_batch(self, prompt: str) -> str:
+        """OpenAI 배치 호출"""
+        response = await self._call_provider(lambda: self.client.chat.completions.create(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": "당신은 한국어 감정 분석 전문가입니다. JSON 형식으로만 응답하세요."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        ), prompt, batch=True)
+        return response.choices[0].message.content
 
 
 # ===== Claude Implementation (Optional) =====
 
-class ClaudeEmotionAnalyzer(BaseEmotionAnalyzer):
+class ClaudeEmotionAnalyzer(LLMEmotionAnalyzer):
     """Claude API를 사용한 감정 분석"""
 
-    def __init__(self, api_key: str):
-        from anthropic import Anthropic
-        self.client = Anthropic(api_key=api_key)
+    provider = "anthropic"
+    model_name = "claude-3-5-haiku-20241022"
+
+    def __init__(self, client):
+        self.client = client  # AsyncAnthropic (ProviderRegistry에서 공유)
 
     async def analyze_emotion(self, text: str) -> EmotionScore:
         """Claude를 사용한 감정 분석"""
@@ -151,58 +562,100 @@ class ClaudeEmotionAnalyzer(BaseEmotionAnalyzer):
 JSON 형식으로만 응답:
 {{"기쁨": 0.0, "슬픔": 0.0, "화남": 0.0, "불안": 0.0, "중립": 0.0, "사랑": 0.0, "피곤": 0.0}}"""
 
-        response = self.client.messages.create(
-            model="claude-3-5-haiku-20241022",
+        response = await self._call_provider(lambda: self.client.messages.create(
+            model=self.model_name,
             max_tokens=300,
             temperature=0.3,
             messages=[{"role": "user", "content": prompt}]
-        )
+        ), prompt)
 
         content = response.content[0].text.strip()
         scores = json.loads(content)
-        dominant_emotion = max(scores.items(), key=lambda x: x[1])
 
-        return EmotionScore(
-            emotion=dominant_emotion[0],
-            confidence=dominant_emotion[1],
-            all_scores=scores
-        )
+        return self._build_emotion_score(scores)
+
+    async def _generate_batch(self, prompt: str) -> str:
+        """Claude 배치 호출 (메시지당 출력 토큰을 고려해 max_tokens 확장)"""
+        response = await self._call_provider(lambda: self.client.messages.create(
+            model=self.model_name,
+            max_tokens=4096,
+            temperature=0.3,
+            messages=[{"role": "user", "content": prompt}]
+        ), prompt, batch=True)
+        return response.content[0].text
 
 
 # ===== Factory Function =====
 
 def get_emotion_analyzer(
-    provider: Literal["gemini", "openai", "anthropic"] | None = None
+    provider: Literal["gemini", "openai", "anthropic", "local"] | None = None,
+    use_cache: bool = True,
 ) -> BaseEmotionAnalyzer:
     """
     Factory function to get emotion analyzer based on provider
 
+    emotion_hedging_enabled 설정 시 p95 지연을 넘긴 제공자 요청(단건 또는 배치 프롬프트 1개)은
+    emotion_hedge_providers(없으면 같은 제공자)로 중복 요청하고, 서킷이 열린 제공자는 우회합니다.
+    (중복 요청은 분당 emotion_hedge_max_per_minute건까지)
+
+    emotion_triage_enabled 설정 시 의미 판단이 필요 없는 메시지는 규칙으로 바로 처리합니다.
+
+    emotion_routing 설정:
+        - llm: 모든 메시지를 LLM으로 분석 (기본값)
+        - local: 로컬 어휘 분석기만 사용
+        - hybrid: 로컬 신뢰도가 임계값보다 낮은 메시지만 LLM으로 분석
+
     Args:
         provider: AI provider name. If None, uses config setting.
+        use_cache: 결과 캐시로 감쌀지 여부 (emotion_cache_enabled 설정이 켜져 있을 때)
 
     Returns:
         BaseEmotionAnalyzer: Emotion analyzer instance
     """
     settings = get_settings()
     provider = provider or settings.ai_provider
+    registry = get_provider_registry()
+
+    if provider == "local" or settings.emotion_routing == "local":
+        return _with_triage(registry.emotion_analyzer("local"))
+
+    # 레지스트리에서 재사용 (이벤트 루프별 클라이언트/커넥션 풀 공유)
+    analyzer = registry.emotion_analyzer(provider)
+
+    if settings.emotion_hedging_enabled:
+        from .emotion_hedging import HedgedEmotionAnalyzer
+        analyzer = HedgedEmotionAnalyzer(
+            primary=analyzer,
+            secondaries=[
+                registry.emotion_analyzer(name)
+                for name in settings.emotion_hedge_providers
+                if name not in (provider, "local")  # 프롬프트 단위 hedging은 LLM 제공자끼리만
+            ],
+            min_delay=settings.emotion_hedge_min_delay_seconds,
+        )
 
-    if provider == "gemini":
-        if not settings.gemini_api_key:
-            raise ValueError("GEMINI_API_KEY not set in environment")
-        return GeminiEmotionAnalyzer(settings.gemini_api_key)
+    if use_cache and settings.emotion_cache_enabled:
+        from .emotion_cache import CachedEmotionAnalyzer, get_emotion_cache
+        analyzer = CachedEmotionAnalyzer(analyzer, get_emotion_cache())
+
+    if settings.emotion_routing == "hybrid":
+        from .lexicon_emotion_analyzer import HybridEmotionAnalyzer
+        analyzer = HybridEmotionAnalyzer(
+            local=registry.emotion_analyzer("local"),
+            remote=analyzer,
+            threshold=settings.emotion_local_confidence_threshold,
+        )
 
-    elif provider == "openai":
-        if not settings.openai_api_key:
-            raise ValueError("OPENAI_API_KEY not set in environment")
-        return OpenAIEmotionAnalyzer(settings.openai_api_key)
+    return _with_triage(analyzer)
 
-    elif provider == "anthropic":
-        if not settings.anthropic_api_key:
-            raise ValueError("ANTHROPIC_API_KEY not set in environment")
-        return ClaudeEmotionAnalyzer(settings.anthropic_api_key)
 
-    else:
-        raise ValueError(f"Unknown provider: {provider}")
+def _with_triage(analyzer: BaseEmotionAnalyzer) -> BaseEmotionAnalyzer:
+    """미디어/시스템/단순 반응 메시지를 규칙으로 먼저 처리 (emotion_triage_enabled)"""
+    if not get_settings().emotion_triage_enabled:
+        return analyzer
+
+    from .message_triage import TriagedEmotionAnalyzer, get_message_triage
+    return TriagedEmotionAnalyzer(analyzer, get_message_triage())
 
 
 # ===== Convenience Function =====
@@ -218,3 +671,32 @@ async def analyze_text_emotion(text: str, provider: str | None = None) -> Emotio
     """
     analyzer = get_emotion_analyzer(provider)
     return await analyzer.analyze_emotion(text)
+
+
+async def analyze_conversation_emotion(
+    messages: list[dict],
+    provider: str | None = None,
+) -> list[EmotionScore]:
+    """
+    대화 맥락을 고려해 메시지별 감정 분석 (/analysis/conversation, 일별 배치용)
+
+    Usage:
+        results = await analyze_conversation_emotion([
+            {"sender_id": "a", "content": "왜 연락 안 했어?"},
+            {"sender_id": "b", "content": "ㅇㅇ"},
+        ])
+    """
+    analyzer = get_emotion_analyzer(provider)
+    return await analyzer.analyze_conversation_emotions(messages)
+
+
+async def analyze_texts_emotion(texts: list[str], provider: str | None = None) -> list[EmotionScore]:
+    """
+    여러 텍스트의 감정을 배치로 분석 (대화 분석, 배치 작업용)
+
+    Usage:
+        results = await analyze_texts_emotion(["좋아!", "피곤하다"])
+        print(results[1].emotion)  # "피곤"
+    """
+    analyzer = get_emotion_analyzer(provider)
+    return await analyzer.analyze_emotions_batch(texts)
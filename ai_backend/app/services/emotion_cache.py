@@ -0,0 +1,403 @@
+"""
+Emotion Result Cache
+
+정규화된 텍스트 해시 + 제공자 + 모델 + 프롬프트 버전을 키로 감정 분석 결과를 캐싱합니다.
+
+계층 구조:
+- L1: 프로세스 내 LRU (TTL)
+- L2: SQLite 디스크 캐시 (선택)
+- L3: Redis (선택, Settings.redis_url)
+"""
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from ..core.config import get_settings
+from ..models.schemas import EmotionScore
+from .emotion_analyzer import BaseEmotionAnalyzer
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC, 앞뒤 공백 제거, 연속 공백 축약)"""
+    text = unicodedata.normalize('NFC', text or '')
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def make_cache_key(text: str, provider: str, model_name: str, prompt_version: str) -> str:
+    """
+    감정 분석 결과 캐시 키 생성
+
+    Args:
+        text: 원본 텍스트
+        provider: AI 제공자 이름
+        model_name: 모델 이름
+        prompt_version: 프롬프트 버전
+
+    Returns:
+        str: "emotion:{provider}:{model}:{version}:{sha256}" 형식의 키
+    """
+    digest = hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+    return f"emotion:{provider}:{model_name}:{prompt_version}:{digest}"
+
+
+# ===== Backends =====
+
+class BaseCacheBackend(ABC):
+    """캐시 백엔드 추상 클래스"""
+
+    name = "base"
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """키에 해당하는 값 반환 (없거나 만료되면 None)"""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Dict[str, Any]):
+        """값 저장"""
+        pass
+
+    async def close(self):
+        """리소스 정리"""
+        pass
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """프로세스 내 LRU + TTL 캐시"""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """
+    SQLite 디스크 캐시 (프로세스 재시작 후에도 유지)
+
+    sqlite3 호출은 블로킹이므로 asyncio.to_thread로 실행해 이벤트 루프를 막지 않습니다.
+    (연결 1개를 스레드 간에 공유하므로 lock으로 직렬화)
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS emotion_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        await asyncio.to_thread(self._set_sync, key, value)
+
+    async def close(self):
+        await asyncio.to_thread(self._close_sync)
+
+    def _get_sync(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM emotion_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at < time.time():
+                self._conn.execute("DELETE FROM emotion_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            return json.loads(value)
+
+    def _set_sync(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO emotion_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time() + self.ttl_seconds)
+            )
+            self._conn.commit()
+
+    def _close_sync(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """Redis 공유 캐시 (여러 워커 간 공유)"""
+
+    name = "redis"
+
+    def __init__(self, redis_url: str, ttl_seconds: int):
+        import redis.asyncio as redis
+
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.from_url(redis_url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = await self._client.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        await self._client.set(key, json.dumps(value, ensure_ascii=False), ex=self.ttl_seconds)
+
+    async def close(self):
+        await self._client.aclose()
+
+
+# ===== Tiered Cache =====
+
+class EmotionResultCache:
+    """
+    계층형 감정 분석 결과 캐시
+
+    상위 계층부터 조회하고, 하위 계층에서 찾은 값은 상위 계층에 다시 채웁니다.
+    하위 계층 오류는 캐시 미스로 처리합니다 (분석은 계속 진행).
+    """
+
+    def __init__(self, backends: List[BaseCacheBackend]):
+        self.backends = backends
+        self.hits = {backend.name: 0 for backend in backends}
+        self.misses = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[EmotionScore]:
+        for level, backend in enumerate(self.backends):
+            try:
+                value = await backend.get(key)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Emotion cache get failed ({backend.name}): {e}")
+                continue
+
+            if value is not None:
+                self.hits[backend.name] += 1
+                for upper in self.backends[:level]:
+                    await self._safe_set(upper, key, value)
+                return EmotionScore(**value)
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, score: EmotionScore):
+        value = score.model_dump()
+        for backend in self.backends:
+            await self._safe_set(backend, key, value)
+
+    async def _safe_set(self, backend: BaseCacheBackend, key: str, value: Dict[str, Any]):
+        try:
+            await backend.set(key, value)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Emotion cache set failed ({backend.name}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 크기 조정을 위한 hit/miss/eviction 카운터"""
+        total_hits = sum(self.hits.values())
+        lookups = total_hits + self.misses
+        memory = next((b for b in self.backends if isinstance(b, MemoryCacheBackend)), None)
+
+        return {
+            'backends': [backend.name for backend in self.backends],
+            'hits': dict(self.hits),
+            'misses': self.misses,
+            'hit_rate': round(total_hits / lookups, 4) if lookups else 0.0,
+            'evictions': memory.evictions if memory else 0,
+            'expirations': memory.expirations if memory else 0,
+            'memory_entries': len(memory) if memory else 0,
+            'errors': self.errors,
+        }
+
+    async def close(self):
+        for backend in self.backends:
+            try:
+                await backend.close()
+            except Exception as e:
+                logger.error(f"Error closing emotion cache backend ({backend.name}): {e}")
+
+
+# ===== Cached Analyzer =====
+
+# 현재 호출 경로에서 캐시로 처리된 메시지 수 (호출한 쪽이 count_cache_hits로 설정, 하위 task에도 전달됨)
+_cache_hit_counter: contextvars.ContextVar[Optional[Counter]] = contextvars.ContextVar(
+    '_cache_hit_counter', default=None
+)
+
+
+@contextmanager
+def count_cache_hits():
+    """
+    이 블록 안의 CachedEmotionAnalyzer 캐시 적중 수 집계
+
+    Usage:
+        with count_cache_hits() as hits:
+            await analyzer.analyze_emotions_batch(texts)
+        hits['hits']  # 캐시에서 처리된 메시지 수
+    """
+    counter = Counter()
+    token = _cache_hit_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _cache_hit_counter.reset(token)
+
+
+def _record_cache_hits(count: int):
+    counter = _cache_hit_counter.get()
+    if counter is not None and count:
+        counter['hits'] += count
+
+
+class CachedEmotionAnalyzer(BaseEmotionAnalyzer):
+    """감정 분석기 앞단에 결과 캐시를 두는 래퍼"""
+
+    def __init__(self, analyzer: BaseEmotionAnalyzer, cache: EmotionResultCache):
+        self.analyzer = analyzer
+        self.cache = cache
+        self.provider = analyzer.provider
+        self.model_name = analyzer.model_name
+        self.PROMPT_VERSION = analyzer.PROMPT_VERSION
+
+    def _key(self, text: str) -> str:
+        return make_cache_key(text, self.provider, self.model_name, self.PROMPT_VERSION)
+
+    async def analyze_emotion(self, text: str) -> EmotionScore:
+        key = self._key(text)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            _record_cache_hits(1)
+            return cached
+
+        score = await self.analyzer.analyze_emotion(text)
+        await self.cache.set(key, score)
+        return score
+
+    async def analyze_emotions_batch(self, texts: list[str]) -> list[EmotionScore]:
+        """
+        캐시에 없는 텍스트만 모아 한 번에 분석 (같은 배치 내 중복도 한 번만 요청)
+        """
+        keys = [self._key(text) for text in texts]
+        results: list[EmotionScore | None] = [None] * len(texts)
+
+        # 캐시 미스를 키 기준으로 묶기
+        pending: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            if key in pending:
+                pending[key].append(i)
+                continue
+
+            cached = await self.cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[key] = [i]
+
+        _record_cache_hits(sum(1 for score in results if score is not None))
+
+        if pending:
+            miss_keys = list(pending.keys())
+            scores = await self.analyzer.analyze_emotions_batch(
+                [texts[pending[key][0]] for key in miss_keys]
+            )
+            for key, score in zip(miss_keys, scores):
+                await self.cache.set(key, score)
+                for i in pending[key]:
+                    results[i] = score
+
+        return results
+
+    async def analyze_conversation_emotions(
+        self,
+        messages: list[dict],
+        targets: list[int] | None = None,
+    ) -> list[EmotionScore]:
+        """맥락에 따라 결과가 달라지므로 텍스트 단위 캐시를 거치지 않음"""
+        return await self.analyzer.analyze_conversation_emotions(messages, targets)
+
+
+# 싱글톤 인스턴스
+_cache_instance = None
+
+
+def get_emotion_cache() -> EmotionResultCache:
+    """설정에 따라 구성된 감정 결과 캐시 싱글톤 반환"""
+    global _cache_instance
+    if _cache_instance is None:
+        settings = get_settings()
+        ttl = settings.emotion_cache_ttl_seconds
+
+        backends: List[BaseCacheBackend] = [
+            MemoryCacheBackend(settings.emotion_cache_max_entries, ttl)
+        ]
+
+        if settings.emotion_cache_sqlite_path:
+            try:
+                backends.append(SQLiteCacheBackend(settings.emotion_cache_sqlite_path, ttl))
+            except Exception as e:
+                logger.warning(f"⚠️ SQLite emotion cache disabled: {e}")
+
+        if settings.emotion_cache_use_redis:
+            try:
+                backends.append(RedisCacheBackend(settings.redis_url, ttl))
+            except ImportError:
+                logger.warning("⚠️ redis not installed. Redis emotion cache disabled.")
+
+        _cache_instance = EmotionResultCache(backends)
+        logger.info(f"✅ Emotion cache enabled: {[b.name for b in backends]}")
+
+    return _cache_instance
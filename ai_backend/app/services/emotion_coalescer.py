@@ -0,0 +1,124 @@
+"""
+Emotion Request Coalescer
+
+동시에 들어오는 단건 감정 분석 요청을 수 밀리초 동안 모아 한 번의 배치 호출로 보내고,
+결과를 각 요청에 나눠 돌려줍니다. (약간의 지연 ↔ 처리량 증가 / 429 감소)
+"""
+import asyncio
+import logging
+import weakref
+from typing import List, Optional, Tuple
+
+from ..core.config import get_settings
+from ..models.schemas import EmotionScore
+from .emotion_analyzer import get_emotion_analyzer
+
+logger = logging.getLogger(__name__)
+
+
+class _LoopState:
+    """이벤트 루프별 대기열 상태"""
+
+    def __init__(self):
+        self.pending: List[Tuple[str, asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class EmotionRequestCoalescer:
+    """
+    마이크로 배칭 디스패처
+
+    - max_wait_ms 동안 요청을 모으거나, max_batch_size에 도달하면 즉시 전송
+    - 배치 호출이 실패하면 해당 배치의 모든 요청에 같은 예외 전달
+    """
+
+    def __init__(self, max_wait_ms: float, max_batch_size: int, provider: Optional[str] = None):
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.provider = provider
+        self._states: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.request_count = 0
+        self.batch_count = 0
+
+    def _state(self, loop: asyncio.AbstractEventLoop) -> _LoopState:
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+        return state
+
+    async def submit(self, text: str) -> EmotionScore:
+        """
+        단건 분석 요청 등록 후 배치 결과 대기
+
+        Args:
+            text: 분석할 텍스트
+
+        Returns:
+            EmotionScore: 감정 분석 결과
+        """
+        loop = asyncio.get_running_loop()
+        state = self._state(loop)
+        future = loop.create_future()
+
+        state.pending.append((text, future))
+        self.request_count += 1
+
+        if len(state.pending) >= self.max_batch_size:
+            self._dispatch(loop, state)
+        elif state.timer is None:
+            state.timer = loop.call_later(self.max_wait, self._dispatch, loop, state)
+
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, state: _LoopState):
+        """대기열을 비우고 배치 전송 태스크 시작"""
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+
+        batch, state.pending = state.pending, []
+        if batch:
+            self.batch_count += 1
+            loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            analyzer = get_emotion_analyzer(self.provider)
+            results = await analyzer.analyze_emotions_batch([text for text, _ in batch])
+        except Exception as e:
+            logger.error(f"Coalesced emotion batch failed ({len(batch)} requests): {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            # 클라이언트 연결 종료 등으로 취소된 요청은 건너뜀
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        """요청 수, 배치 수, 평균 배치 크기"""
+        return {
+            'requests': self.request_count,
+            'batches': self.batch_count,
+            'avg_batch_size': round(self.request_count / self.batch_count, 2) if self.batch_count else 0.0,
+            'max_wait_ms': self.max_wait * 1000,
+            'max_batch_size': self.max_batch_size,
+        }
+
+
+# 싱글톤 인스턴스
+_coalescer_instance = None
+
+
+def get_emotion_coalescer() -> EmotionRequestCoalescer:
+    """Emotion Request Coalescer 싱글톤 인스턴스 반환"""
+    global _coalescer_instance
+    if _coalescer_instance is None:
+        settings = get_settings()
+        _coalescer_instance = EmotionRequestCoalescer(
+            max_wait_ms=settings.emotion_coalesce_max_wait_ms,
+            max_batch_size=settings.emotion_coalesce_max_batch_size,
+        )
+    return _coalescer_instance
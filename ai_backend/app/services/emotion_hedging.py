@@ -0,0 +1,186 @@
+"""
+Hedged Emotion Analyzer
+
+제공자 요청 1건(단건 분석 또는 배치/대화 윈도우 프롬프트 1개)이 최근 p95 지연 시간 안에 끝나지 않으면
+같은 제공자 또는 보조 제공자로 그 요청만 중복해서 보내고 먼저 도착한 유효한 결과를 사용합니다.
+서킷이 열린 제공자는 후보에서 제외되며, 호출이 실패하면 즉시 다음 후보로 넘어갑니다(failover).
+
+- hedging 타이머는 요청이 rate limit 대기열을 지나 실제로 시작된 시점부터 잽니다.
+  (스로틀로 대기열이 길어졌을 때 중복 요청이 부하를 더 키우지 않도록)
+- 중복 요청은 분당 emotion_hedge_max_per_minute건으로 제한합니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import Counter, deque
+from typing import Awaitable, Callable, Dict, List, TypeVar
+
+from ..core.config import get_settings
+from ..models.schemas import EmotionScore
+from .circuit_breaker import get_circuit_breaker
+from .emotion_analyzer import LLMEmotionAnalyzer
+from .provider_executor import call_started, get_provider_executor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# hedging 누적 통계
+# (fired: 중복 요청 수, hedge_wins: 중복 요청이 이긴 횟수, failovers: 실패 후 전환 수, suppressed: 한도 초과로 생략한 중복 요청 수)
+hedging_stats: Counter = Counter()
+
+
+class HedgeBudget:
+    """슬라이딩 윈도우 중복 요청 한도 (프로세스 전체 공유)"""
+
+    def __init__(self, max_hedges: int, window_seconds: float = 60.0):
+        self.max_hedges = max_hedges
+        self.window_seconds = window_seconds
+        self._fired: deque = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """한도 안이면 1건 사용하고 True"""
+        now = time.monotonic()
+        with self._lock:
+            while self._fired and now - self._fired[0] >= self.window_seconds:
+                self._fired.popleft()
+            if len(self._fired) >= self.max_hedges:
+                return False
+            self._fired.append(now)
+            return True
+
+
+class HedgedEmotionAnalyzer(LLMEmotionAnalyzer):
+    """
+    요청 hedging + 제공자 failover 분석기
+
+    배치 분할 / 대화 윈도우 구성은 LLMEmotionAnalyzer를 그대로 쓰고,
+    제공자 요청 단위(analyze_emotion, _generate_batch)만 후보들 사이에서 경쟁시킵니다.
+    캐시 키 등 외부에서 보는 provider/model은 주 제공자 기준입니다.
+    """
+
+    def __init__(
+        self,
+        primary: LLMEmotionAnalyzer,
+        secondaries: List[LLMEmotionAnalyzer],
+        min_delay: float,
+        percentile: float = 95,
+        budget: HedgeBudget | None = None,
+    ):
+        self.primary = primary
+        self.secondaries = secondaries
+        self.min_delay = min_delay
+        self.percentile = percentile
+        self.budget = budget or get_hedge_budget()
+        self.provider = primary.provider
+        self.model_name = primary.model_name
+        self.PROMPT_VERSION = primary.PROMPT_VERSION
+
+    def _candidates(self) -> List[LLMEmotionAnalyzer]:
+        """서킷이 열리지 않은 후보 목록 (보조 제공자가 없으면 주 제공자로 한 번 더)"""
+        candidates = [self.primary] + (self.secondaries or [self.primary])
+        available = [a for a in candidates if not get_circuit_breaker(a.provider).is_open()]
+        return available or [self.primary]
+
+    def _hedge_delay(self, latency_key: str) -> float:
+        p95 = get_provider_executor().latency_percentile(latency_key, self.percentile)
+        return max(self.min_delay, p95) if p95 is not None else self.min_delay
+
+    @staticmethod
+    async def _attempt(run: Callable[[LLMEmotionAnalyzer], Awaitable[T]], analyzer, started: asyncio.Event) -> T:
+        # task마다 context가 복사되므로 이 task의 제공자 호출에서만 started가 set됨
+        call_started.set(started)
+        return await run(analyzer)
+
+    async def _race(self, run: Callable[[LLMEmotionAnalyzer], Awaitable[T]], batch: bool = False) -> T:
+        candidates = self._candidates()
+        provider = candidates[0].provider
+        delay = self._hedge_delay(f"{provider}:batch" if batch else provider)
+        loop = asyncio.get_running_loop()
+
+        tasks: Dict[asyncio.Future, int] = {}
+        start_waiters: List[asyncio.Future] = []
+        next_index = 0
+        deadline: float | None = None
+        can_hedge = True
+        last_error: Exception | None = None
+
+        def launch():
+            nonlocal next_index, deadline
+            started = asyncio.Event()
+            tasks[asyncio.ensure_future(self._attempt(run, candidates[next_index], started))] = next_index
+            start_waiters.append(asyncio.ensure_future(started.wait()))
+            next_index += 1
+            deadline = None
+
+        launch()
+        try:
+            while tasks:
+                waiting = set(tasks)
+                timeout = None
+                if can_hedge and next_index < len(candidates):
+                    if deadline is None:
+                        # 마지막 요청이 대기열을 지나 시작될 때까지는 타이머를 돌리지 않음
+                        waiting.add(start_waiters[-1])
+                    else:
+                        timeout = max(0.0, deadline - loop.time())
+
+                done, _ = await asyncio.wait(waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if start_waiters[-1] in done:
+                    done.discard(start_waiters[-1])
+                    deadline = loop.time() + delay
+
+                failed = False
+                for task in done:
+                    index = tasks.pop(task)
+                    if task.exception() is None:
+                        if index > 0:
+                            hedging_stats['hedge_wins'] += 1
+                        return task.result()
+                    last_error = task.exception()
+                    failed = True
+                    logger.warning(f"Emotion call via {candidates[index].provider} failed: {last_error}")
+
+                if next_index >= len(candidates):
+                    continue
+
+                if failed:
+                    hedging_stats['failovers'] += 1
+                    launch()
+                elif deadline is not None and loop.time() >= deadline:
+                    # p95 초과: 한도 안에서만 중복 요청
+                    if self.budget.try_acquire():
+                        hedging_stats['fired'] += 1
+                        launch()
+                    else:
+                        hedging_stats['suppressed'] += 1
+                        can_hedge = False
+        finally:
+            for future in list(tasks) + start_waiters:
+                future.cancel()
+
+        raise last_error
+
+    async def analyze_emotion(self, text: str) -> EmotionScore:
+        return await self._race(lambda analyzer: analyzer.analyze_emotion(text))
+
+    async def _generate_batch(self, prompt: str) -> str:
+        """배치 / 대화 윈도우 프롬프트 1개를 hedging (프롬프트와 응답 형식은 모든 LLM 분석기가 공유)"""
+        return await self._race(lambda analyzer: analyzer._generate_batch(prompt), batch=True)
+
+
+# 싱글톤 인스턴스
+_budget_instance = None
+_budget_lock = threading.Lock()
+
+
+def get_hedge_budget() -> HedgeBudget:
+    """프로세스 공유 hedging 한도 반환"""
+    global _budget_instance
+    with _budget_lock:
+        if _budget_instance is None:
+            _budget_instance = HedgeBudget(get_settings().emotion_hedge_max_per_minute)
+        return _budget_instance
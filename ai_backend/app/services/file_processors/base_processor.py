@@ -4,7 +4,7 @@ Base File Processor
 모든 파일 프로세서의 추상 클래스
 """
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -26,7 +26,7 @@ class ProcessedFile:
 
     # 추출된 데이터
     raw_text: Optional[str] = None  # 원본 텍스트
-    conversations: Optional[List[ConversationMessage]] = None  # 파싱된 대화
+    conversations: Optional[Sequence[ConversationMessage]] = None  # 파싱된 대화 (MessageTable 또는 리스트)
 
     # 메타데이터
     total_messages: int = 0
@@ -93,12 +93,12 @@ class BaseFileProcessor(ABC):
         extension = file_path.split('.')[-1].lower()
         return f".{extension}" in self.supported_extensions
 
-    def extract_participants(self, conversations: List[ConversationMessage]) -> List[str]:
+    def extract_participants(self, conversations: Sequence[ConversationMessage]) -> List[str]:
         """
         대화에서 참여자 목록 추출
 
         Args:
-            conversations: 대화 메시지 리스트
+            conversations: 대화 메시지 리스트 또는 MessageTable
 
         Returns:
             List[str]: 중복 제거된 참여자 목록
@@ -106,6 +106,10 @@ class BaseFileProcessor(ABC):
         if not conversations:
             return []
 
+        # MessageTable은 발신자 코드 배열로 바로 계산
+        if hasattr(conversations, 'participants'):
+            return conversations.participants()
+
         participants = set()
         for msg in conversations:
             if msg.sender:
@@ -113,12 +117,12 @@ class BaseFileProcessor(ABC):
 
         return sorted(list(participants))
 
-    def extract_date_range(self, conversations: List[ConversationMessage]) -> Optional[Dict[str, datetime]]:
+    def extract_date_range(self, conversations: Sequence[ConversationMessage]) -> Optional[Dict[str, datetime]]:
         """
         대화의 날짜 범위 추출
 
         Args:
-            conversations: 대화 메시지 리스트
+            conversations: 대화 메시지 리스트 또는 MessageTable
 
         Returns:
             Dict[str, datetime]: {'start': ..., 'end': ...}
@@ -126,6 +130,10 @@ class BaseFileProcessor(ABC):
         if not conversations:
             return None
 
+        # MessageTable은 타임스탬프 배열로 바로 계산
+        if hasattr(conversations, 'date_range'):
+            return conversations.date_range()
+
         timestamps = [msg.timestamp for msg in conversations if msg.timestamp]
 
         if not timestamps:
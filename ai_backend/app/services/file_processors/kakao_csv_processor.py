@@ -5,15 +5,66 @@
 형식: Date,User,Message
 """
 import csv
-from datetime import datetime
-from typing import List
+from typing import Dict, Iterable, List
 import logging
 
-from .base_processor import BaseFileProcessor, ProcessedFile, ConversationMessage
+import numpy as np
+
+from .base_processor import BaseFileProcessor, ProcessedFile
+from .message_table import MessageTable
+from .parallel_parser import parse_csv_chunk, parse_in_parallel, should_parse_in_parallel
+from .timestamp_parser import parse_csv_datetime_column
 
 logger = logging.getLogger(__name__)
 
 
+def parse_csv_rows(rows: Iterable[Dict[str, str]]) -> MessageTable:
+    """
+    CSV 행들 → 메시지 테이블 (병렬 파싱 워커와 공유)
+
+    날짜 컬럼은 행마다 strptime을 부르지 않고 모아서 NumPy로 한 번에 변환하고,
+    변환된 datetime64 배열을 그대로 MessageTable의 타임스탬프 컬럼으로 사용합니다.
+
+    Args:
+        rows: csv.DictReader 행들 (Date, User, Message 컬럼)
+
+    Returns:
+        MessageTable: 파일 순서의 메시지 (필드가 비었거나 날짜 형식이 잘못된 행은 제외)
+    """
+    dates = []
+    users = []
+    messages = []
+    for row in rows:
+        try:
+            # Date, User, Message 컬럼 읽기
+            date_str = row.get('Date', '').strip()
+            user = row.get('User', '').strip()
+            message = row.get('Message', '').strip()
+        except Exception as e:
+            logger.warning(f"Failed to parse row: {row}, error: {e}")
+            continue
+
+        if not date_str or not user or not message:
+            logger.warning(f"Skipping row with missing fields: {row}")
+            continue
+        dates.append(date_str)
+        users.append(user)
+        messages.append(message)
+
+    # 날짜 파싱 (YYYY-MM-DD HH:MM:SS), 실패는 NaT
+    timestamps = parse_csv_datetime_column(dates)
+    parsed = ~np.isnat(timestamps)
+    if not parsed.all():
+        for i in np.flatnonzero(~parsed).tolist():
+            logger.warning(f"Failed to parse row date: {dates[i]!r} ({users[i]})")
+        keep = parsed.tolist()
+        users = [user for user, ok in zip(users, keep) if ok]
+        messages = [message for message, ok in zip(messages, keep) if ok]
+        timestamps = timestamps[parsed]
+
+    return MessageTable.from_columns(timestamps, users, messages)
+
+
 class KakaoCsvProcessor(BaseFileProcessor):
     """카카오톡 CSV 파일 프로세서"""
 
@@ -26,65 +77,45 @@ class KakaoCsvProcessor(BaseFileProcessor):
 
         Args:
             file_path: CSV 파일 경로
+            **kwargs:
+                - encoding: 파일 인코딩 (기본값: 'utf-8-sig', BOM 자동 제거)
+                - keep_raw_text: 대화 내용을 이어 붙인 텍스트를 결과에 담을지 여부 (기본값: False)
+                  True면 메시지 전체 크기만큼 문자열을 하나 더 만듦
+                - parallel: 구간 병렬 파싱 사용 여부 (기본값: 파일 크기 / 인코딩으로 자동 결정)
 
         Returns:
             ProcessedFile: 처리 결과
         """
+        encoding = kwargs.get('encoding', 'utf-8-sig')
+        keep_raw_text = kwargs.get('keep_raw_text', False)
+        parallel = kwargs.get('parallel')
+
         try:
             logger.info(f"Processing CSV file: {file_path}")
 
-            # CSV 파일 읽기
-            conversations = []
-            participants = set()
-
-            # utf-8-sig: BOM(Byte Order Mark) 자동 제거
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
-                    try:
-                        # Date, User, Message 컬럼 읽기
-                        date_str = row.get('Date', '').strip()
-                        user = row.get('User', '').strip()
-                        message = row.get('Message', '').strip()
-
-                        if not date_str or not user or not message:
-                            logger.warning(f"Skipping row with missing fields: {row}")
-                            continue
-
-                        # 날짜 파싱 (YYYY-MM-DD HH:MM:SS)
-                        timestamp = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-
-                        # 대화 메시지 생성
-                        conv_msg = ConversationMessage(
-                            timestamp=timestamp,
-                            sender=user,
-                            message=message
-                        )
-                        conversations.append(conv_msg)
-
-                        # 참여자 추가
-                        participants.add(user)
-
-                    except Exception as e:
-                        logger.warning(f"Failed to parse row: {row}, error: {e}")
-                        continue
-
-            # 날짜 범위 계산
-            date_range = None
-            if conversations:
-                timestamps = [msg.timestamp for msg in conversations if msg.timestamp]
-                if timestamps:
-                    date_range = {
-                        'start': min(timestamps),
-                        'end': max(timestamps)
-                    }
-
-            # 전체 텍스트 (대화 내용 연결)
+            if parallel is None:
+                parallel = should_parse_in_parallel(file_path, encoding)
+
+            if parallel:
+                # 헤더만 읽고 나머지는 행 경계 구간으로 나눠 프로세스 풀에서 파싱
+                with open(file_path, 'r', encoding=encoding) as f:
+                    fieldnames = next(csv.reader(f), [])
+                result = await parse_in_parallel(
+                    file_path, parse_csv_chunk, encoding, fieldnames, csv_rows=True
+                )
+                conversations = result.messages
+                participants = result.participants
+                date_range = {'start': result.start, 'end': result.end} if result.start else None
+            else:
+                conversations, participants, date_range = self._parse_file(file_path, encoding)
+
+            # 전체 텍스트 (대화 내용 연결, 요청한 경우만)
             raw_text = '\n'.join([
-                f"[{msg.timestamp}] {msg.sender}: {msg.message}"
-                for msg in conversations
-            ])
+                f"[{timestamp}] {sender}: {message}"
+                for timestamp, sender, message in zip(
+                    conversations.datetimes(), conversations.sender_names(), conversations.messages()
+                )
+            ]) if keep_raw_text else None
 
             logger.info(f"✅ CSV parsing completed: {len(conversations)} messages, {len(participants)} participants")
 
@@ -106,3 +137,17 @@ class KakaoCsvProcessor(BaseFileProcessor):
                 file_type='csv',
                 error_message=str(e)
             )
+
+    def _parse_file(self, file_path: str, encoding: str) -> tuple:
+        """
+        한 프로세스에서 순서대로 파싱
+
+        Returns:
+            tuple: (MessageTable, 참여자 set, 날짜 범위)
+        """
+        # utf-8-sig: BOM(Byte Order Mark) 자동 제거
+        with open(file_path, 'r', encoding=encoding) as f:
+            conversations = parse_csv_rows(csv.DictReader(f))
+
+        # 참여자 / 날짜 범위 (컬럼 배열로 계산)
+        return conversations, set(conversations.participants()), conversations.date_range()
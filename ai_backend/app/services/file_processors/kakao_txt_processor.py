@@ -4,14 +4,109 @@
 카카오톡 대화 내보내기로 생성된 txt 파일 파싱
 """
 import re
-from typing import List
-from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
 import logging
 
 from .base_processor import BaseFileProcessor, ProcessedFile, ConversationMessage
+from .message_table import MessageTable
+from .parallel_parser import parse_in_parallel, parse_txt_chunk, should_parse_in_parallel
+from .timestamp_parser import kakao_datetime, parse_english_date, parse_korean_date
 
 logger = logging.getLogger(__name__)
 
+# 형식 감지에 쓰는 파일 앞부분 길이
+FORMAT_DETECT_CHARS = 1000
+
+# 메시지 줄 패턴 (모듈 로드 시 한 번만 컴파일)
+# 한글: "2025년 2월 14일 오후 2:07, 딱복 🍑 : 소영님 몸은 괜찮으신가여.."
+KOREAN_MESSAGE_PATTERN = re.compile(
+    r'(\d{4}년\s+\d{1,2}월\s+\d{1,2}일)\s+(오전|오후)\s+(\d{1,2}):(\d{2}),\s*(.+?)\s*:\s*(.+)'
+)
+
+# 영문: "January 3, 2022 at 5:59 PM, ♥그만개겨김송♥ : 헤이헤이헤이헤이헤이"
+ENGLISH_MESSAGE_PATTERN = re.compile(
+    r'([A-Z][a-z]+\s+\d{1,2},\s+\d{4})\s+at\s+(\d{1,2}):(\d{2})\s+([AP])M,\s*(.+?)\s*:\s*(.+)'
+)
+
+
+class KakaoLineParser:
+    """
+    카카오톡 txt 한 줄 단위 파서 (스트리밍용)
+
+    - 정규식은 미리 컴파일하고, 메시지 줄일 수 없는 줄은 앞부분 검사로 정규식 없이 건너뜁니다.
+      (한글: 5번째 글자가 '년', 영문: 대문자로 시작하고 'M,' 포함)
+    - 날짜 부분("2025년 2월 14일", "January 3, 2022")은 timestamp_parser의 캐시로 한 번만 해석하고,
+      같은 날의 메시지는 시/분만 새로 계산합니다.
+    """
+
+    def __init__(self, is_english: bool = False):
+        self.is_english = is_english
+        # 형식별 파서를 미리 골라 줄마다 형식 분기를 하지 않음
+        self._parse = self._parse_english_line if is_english else self._parse_korean_line
+
+    def parse_line(self, line: str) -> Optional[ConversationMessage]:
+        """
+        한 줄 파싱
+
+        Args:
+            line: 원본 줄 (앞뒤 공백 / 줄바꿈 포함 가능)
+
+        Returns:
+            Optional[ConversationMessage]: 메시지 줄이 아니거나 날짜가 잘못되면 None
+        """
+        line = line.strip()
+        if not line:
+            return None
+
+        try:
+            return self._parse(line)
+        except ValueError as e:
+            logger.warning(f"Failed to parse {'English' if self.is_english else 'Korean'} format line: {line[:100]}, error: {e}")
+            return None
+
+    def parse_lines(self, lines: Iterable[str]) -> Iterator[ConversationMessage]:
+        """줄 iterable을 메시지 제너레이터로 변환 (메시지 줄만 yield)"""
+        parse_line = self.parse_line
+        for line in lines:
+            msg = parse_line(line)
+            if msg is not None:
+                yield msg
+
+    def _parse_korean_line(self, line: str) -> Optional[ConversationMessage]:
+        if line[4:5] != '년':
+            return None
+        match = KOREAN_MESSAGE_PATTERN.match(line)
+        if not match:
+            return None
+
+        date_str, period, hour, minute, sender, message = match.groups()
+
+        return ConversationMessage(
+            timestamp=kakao_datetime(parse_korean_date(date_str), int(hour), int(minute), period == '오후'),
+            sender=sender.strip(),
+            message=message.strip()
+        )
+
+    def _parse_english_line(self, line: str) -> Optional[ConversationMessage]:
+        if not ('A' <= line[0] <= 'Z' and 'M,' in line):
+            return None
+        match = ENGLISH_MESSAGE_PATTERN.match(line)
+        if not match:
+            return None
+
+        date_str, hour, minute, period, sender, message = match.groups()
+        hour = int(hour)
+
+        # strptime("%I:%M %p")와 같은 범위 검사
+        if not 1 <= hour <= 12:
+            raise ValueError(f"hour out of range: {hour}")
+
+        return ConversationMessage(
+            timestamp=kakao_datetime(parse_english_date(date_str), hour, int(minute), period == 'P'),
+            sender=sender.strip(),
+            message=message.strip()
+        )
+
 
 class KakaoTxtProcessor(BaseFileProcessor):
     """
@@ -36,30 +131,59 @@ class KakaoTxtProcessor(BaseFileProcessor):
         """
         카카오톡 txt 파일 처리
 
+        파일은 한 줄씩 읽어 파싱하므로 원본 전체를 리스트로 나누지 않습니다.
+        parallel_parse_min_bytes 이상인 파일은 구간으로 나눠 여러 프로세스에서 파싱합니다.
+
+        원본 텍스트(raw_text)는 기본적으로 결과에 담지 않습니다.
+        담으면 파일 크기만큼 메모리를 더 쓰므로 (병렬 / 순차 경로 모두) 작은 파일에서 필요할 때만 켭니다.
+        원본은 입력 파일 자체이므로 필요하면 파일에서 다시 읽으면 됩니다.
+
         Args:
             file_path: 파일 경로
             **kwargs:
                 - encoding: 파일 인코딩 (기본값: 'utf-8')
+                - keep_raw_text: 원본 텍스트를 결과에 담을지 여부 (기본값: False)
+                  True면 파일 전체를 메모리에 보관 (메모리 사용이 파일 크기에 비례)
+                - parallel: 구간 병렬 파싱 사용 여부 (기본값: 파일 크기 / 인코딩으로 자동 결정)
 
         Returns:
             ProcessedFile: 처리 결과
         """
         encoding = kwargs.get('encoding', 'utf-8')
+        keep_raw_text = kwargs.get('keep_raw_text', False)
+        parallel = kwargs.get('parallel')
 
         try:
             logger.info(f"📄 Processing Kakao txt file: {file_path}")
 
-            # 파일 읽기
-            with open(file_path, 'r', encoding=encoding) as f:
-                raw_text = f.read()
-
-            # 형식 감지 (한글 vs 영문)
-            is_english = self._detect_format(raw_text)
-            format_type = "English" if is_english else "Korean"
-            logger.info(f"   Detected format: {format_type}")
+            if parallel is None:
+                parallel = should_parse_in_parallel(file_path, encoding)
 
-            # 대화 파싱
-            conversations = self._parse_conversations(raw_text, is_english)
+            with open(file_path, 'r', encoding=encoding) as f:
+                # 형식 감지 (한글 vs 영문) - 앞부분만 읽고 처음으로 되돌림
+                is_english = self._detect_format(f.read(FORMAT_DETECT_CHARS))
+                f.seek(0)
+                format_type = "English" if is_english else "Korean"
+                logger.info(f"   Detected format: {format_type}")
+
+                if parallel:
+                    raw_text = f.read() if keep_raw_text else None
+                else:
+                    # 대화 파싱 (원본 줄은 필요할 때만 보관)
+                    raw_lines = [] if keep_raw_text else None
+                    lines = _tee_lines(f, raw_lines) if keep_raw_text else f
+                    conversations = MessageTable.from_messages(KakaoLineParser(is_english).parse_lines(lines))
+                    raw_text = ''.join(raw_lines) if keep_raw_text else None
+
+            if parallel:
+                # 참여자 / 날짜 범위는 구간별 결과를 합쳐 계산
+                result = await parse_in_parallel(file_path, parse_txt_chunk, encoding, is_english)
+                conversations = result.messages
+                participants = sorted(result.participants)
+                date_range = {'start': result.start, 'end': result.end} if result.start else None
+            else:
+                participants = self.extract_participants(conversations)
+                date_range = self.extract_date_range(conversations)
 
             if not conversations:
                 logger.warning("No conversations found in file")
@@ -70,10 +194,6 @@ class KakaoTxtProcessor(BaseFileProcessor):
                     error_message="대화 메시지를 찾을 수 없습니다"
                 )
 
-            # 메타데이터 추출
-            participants = self.extract_participants(conversations)
-            date_range = self.extract_date_range(conversations)
-
             logger.info(
                 f"✅ Parsed {len(conversations)} messages from {len(participants)} participants"
             )
@@ -96,6 +216,25 @@ class KakaoTxtProcessor(BaseFileProcessor):
                 error_message=str(e)
             )
 
+    def iter_messages(self, file_path: str, encoding: str = 'utf-8') -> Iterator[ConversationMessage]:
+        """
+        스트리밍 파싱: 파일을 한 줄씩 읽으며 메시지를 하나씩 yield
+
+        원본 텍스트와 메시지 리스트를 만들지 않으므로 파일 크기와 관계없이 메모리 사용이 일정합니다.
+        (소비하는 쪽이 메시지를 모으지 않는 경우)
+
+        Args:
+            file_path: 파일 경로
+            encoding: 파일 인코딩
+
+        Yields:
+            ConversationMessage: 파싱된 메시지 (파일 순서)
+        """
+        with open(file_path, 'r', encoding=encoding) as f:
+            is_english = self._detect_format(f.read(FORMAT_DETECT_CHARS))
+            f.seek(0)
+            yield from KakaoLineParser(is_english).parse_lines(f)
+
     def _detect_format(self, text: str) -> bool:
         """
         텍스트 파일 형식 감지 (한글 vs 영문)
@@ -131,7 +270,7 @@ class KakaoTxtProcessor(BaseFileProcessor):
         # 기본값: 한글
         return False
 
-    def _parse_conversations(self, text: str, is_english: bool = False) -> List[ConversationMessage]:
+    def _parse_conversations(self, text: str, is_english: bool = False) -> MessageTable:
         """
         텍스트에서 대화 메시지 추출
 
@@ -140,103 +279,13 @@ class KakaoTxtProcessor(BaseFileProcessor):
             is_english: True if English format, False if Korean format
 
         Returns:
-            List[ConversationMessage]: 파싱된 메시지 리스트
-        """
-        if is_english:
-            return self._parse_english_format(text)
-        else:
-            return self._parse_korean_format(text)
-
-    def _parse_english_format(self, text: str) -> List[ConversationMessage]:
+            MessageTable: 파싱된 메시지
         """
-        영문 형식 카카오톡 파일 파싱
+        return MessageTable.from_messages(KakaoLineParser(is_english).parse_lines(text.split('\n')))
 
-        예시:
-        January 3, 2022 at 5:59 PM, ♥그만개겨김송♥ : 헤이헤이헤이헤이헤이
-        """
-        conversations = []
-        lines = text.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # 영문 형식 메시지 파싱
-            # 패턴: "January 3, 2022 at 5:59 PM, sender : message"
-            msg_match = re.match(
-                r'([A-Z][a-z]+\s+\d{1,2},\s+\d{4})\s+at\s+(\d{1,2}:\d{2}\s+[AP]M),\s*(.+?)\s*:\s*(.+)',
-                line
-            )
-
-            if msg_match:
-                date_str = msg_match.group(1)  # "January 3, 2022"
-                time_str = msg_match.group(2)  # "5:59 PM"
-                sender = msg_match.group(3).strip()
-                message = msg_match.group(4).strip()
-
-                try:
-                    # 날짜/시간 파싱
-                    datetime_str = f"{date_str} {time_str}"
-                    timestamp = datetime.strptime(datetime_str, "%B %d, %Y %I:%M %p")
-
-                    conversations.append(ConversationMessage(
-                        timestamp=timestamp,
-                        sender=sender,
-                        message=message
-                    ))
-                except Exception as e:
-                    logger.warning(f"Failed to parse English format line: {line[:100]}, error: {e}")
-
-        return conversations
-
-    def _parse_korean_format(self, text: str) -> List[ConversationMessage]:
-        """
-        한글 형식 카카오톡 파일 파싱
-
-        예시:
-        2025년 2월 14일 오후 2:07, 딱복 🍑 : 소영님 몸은 괜찮으신가여..
-        """
-        conversations = []
-        lines = text.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # 한글 형식 메시지 파싱
-            # 패턴: "2025년 2월 14일 오후 2:07, 딱복 🍑 : 소영님 몸은 괜찮으신가여.."
-            msg_match = re.match(
-                r'(\d{4})년\s+(\d{1,2})월\s+(\d{1,2})일\s+(오전|오후)\s+(\d{1,2}):(\d{2}),\s*(.+?)\s*:\s*(.+)',
-                line
-            )
 
-            if msg_match:
-                year = int(msg_match.group(1))
-                month = int(msg_match.group(2))
-                day = int(msg_match.group(3))
-                period = msg_match.group(4)  # 오전/오후
-                hour = int(msg_match.group(5))
-                minute = int(msg_match.group(6))
-                sender = msg_match.group(7).strip()
-                message = msg_match.group(8).strip()
-
-                try:
-                    # 오후 변환 (12시간제 → 24시간제)
-                    if period == '오후' and hour != 12:
-                        hour += 12
-                    elif period == '오전' and hour == 12:
-                        hour = 0
-
-                    timestamp = datetime(year, month, day, hour, minute, 0)
-
-                    conversations.append(ConversationMessage(
-                        timestamp=timestamp,
-                        sender=sender,
-                        message=message
-                    ))
-                except Exception as e:
-                    logger.warning(f"Failed to parse Korean format line: {line[:100]}, error: {e}")
-
-        return conversations
+def _tee_lines(lines: Iterable[str], sink: List[str]) -> Iterator[str]:
+    """줄을 그대로 넘기면서 sink에도 보관 (원본 텍스트 복원용)"""
+    for line in lines:
+        sink.append(line)
+        yield line
@@ -0,0 +1,380 @@
+"""
+Message Table
+
+파싱된 대화 메시지를 컬럼 단위로 담는 컨테이너 (ProcessedFile.conversations)
+
+ConversationMessage 객체 리스트는 메시지마다 dataclass 인스턴스 + __dict__ + datetime + 문자열 2개를 만들기 때문에
+수년치 내보내기 파일(수백만 메시지)에서는 원본 텍스트보다 몇 배 큰 메모리를 씁니다.
+MessageTable은 같은 내용을 배열 몇 개로 저장합니다.
+
+- timestamps: int64 epoch 마이크로초 (naive 현지 시각 기준, 타임스탬프 없음 = NO_TIMESTAMP)
+- sender_codes: int32 발신자 코드 + senders: 코드 → 발신자 이름 (등장 순서)
+- offsets: 메시지 i의 본문 = text[offsets[i]:offsets[i + 1]] (본문은 문자열 하나에 이어 붙임)
+- metadata: 메타데이터가 있는 메시지만 {인덱스: dict}
+
+Sequence[ConversationMessage]로도 동작하므로 기존 코드(for msg in conversations, len, 인덱싱)는 그대로 쓸 수 있고,
+턴테이킹 / 응답 지연 분석기와 ai_preprocessed_data 직렬화는 배열을 바로 사용합니다.
+"""
+import io
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from .base_processor import ConversationMessage
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 타임스탬프 없음 (datetime64로 보면 NaT)
+NO_TIMESTAMP = np.iinfo(np.int64).min
+
+
+def to_epoch_microseconds(timestamp: Optional[datetime]) -> int:
+    """naive datetime → epoch 마이크로초 (None → NO_TIMESTAMP, timezone이 있으면 UTC 기준)"""
+    if timestamp is None:
+        return NO_TIMESTAMP
+    if timestamp.tzinfo is not None:
+        timestamp = (timestamp - timestamp.utcoffset()).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+class MessageTableBuilder:
+    """메시지를 하나씩 받아 MessageTable을 만드는 빌더 (스트리밍 파서용)"""
+
+    def __init__(self):
+        self._timestamps = array('q')
+        self._codes = array('i')
+        self._offsets = array('q', [0])
+        self._text = io.StringIO()
+        self._length = 0
+        self._senders: Dict[str, int] = {}
+        self._metadata: Dict[int, Dict[str, Any]] = {}
+
+    def append(
+        self,
+        timestamp: Optional[datetime],
+        sender: str,
+        message: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """메시지 1개 추가"""
+        if metadata is not None:
+            self._metadata[len(self._codes)] = metadata
+        self._timestamps.append(to_epoch_microseconds(timestamp))
+        self._codes.append(self._senders.setdefault(sender, len(self._senders)))
+        self._length += self._text.write(message)
+        self._offsets.append(self._length)
+
+    def append_message(self, msg: ConversationMessage):
+        self.append(msg.timestamp, msg.sender, msg.message, msg.metadata)
+
+    def extend(self, messages: Iterable[ConversationMessage]) -> 'MessageTableBuilder':
+        for msg in messages:
+            self.append(msg.timestamp, msg.sender, msg.message, msg.metadata)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def build(self) -> 'MessageTable':
+        return MessageTable(
+            timestamps=np.frombuffer(self._timestamps, dtype=np.int64).copy(),
+            sender_codes=np.frombuffer(self._codes, dtype=np.int32).copy(),
+            senders=list(self._senders),
+            offsets=np.frombuffer(self._offsets, dtype=np.int64).copy(),
+            text=self._text.getvalue(),
+            metadata=self._metadata or None,
+        )
+
+
+class MessageTable(Sequence):
+    """컬럼 기반 대화 메시지 테이블 (Sequence[ConversationMessage] 호환)"""
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        sender_codes: np.ndarray,
+        senders: List[str],
+        offsets: np.ndarray,
+        text: str,
+        metadata: Optional[Dict[int, Dict[str, Any]]] = None,
+    ):
+        self.timestamps = timestamps
+        self.sender_codes = sender_codes
+        self.senders = senders
+        self.offsets = offsets
+        self.text = text
+        self.metadata = metadata
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[ConversationMessage]) -> 'MessageTable':
+        """ConversationMessage iterable(제너레이터 포함)로부터 생성"""
+        if isinstance(messages, MessageTable):
+            return messages
+        return MessageTableBuilder().extend(messages).build()
+
+    @classmethod
+    def from_columns(
+        cls,
+        timestamps: np.ndarray,
+        senders: List[str],
+        messages: List[str],
+    ) -> 'MessageTable':
+        """
+        컬럼 리스트로부터 생성 (CSV처럼 컬럼 단위로 파싱한 경우)
+
+        Args:
+            timestamps: datetime64 배열 (NaT = 타임스탬프 없음)
+            senders: 메시지별 발신자
+            messages: 메시지별 본문
+        """
+        index: Dict[str, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(sender, len(index)) for sender in senders),
+            dtype=np.int32,
+            count=len(senders),
+        )
+        offsets = np.zeros(len(messages) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, messages), dtype=np.int64, count=len(messages)), out=offsets[1:])
+
+        return cls(
+            timestamps=np.asarray(timestamps, dtype='datetime64[us]').view(np.int64),
+            sender_codes=codes,
+            senders=list(index),
+            offsets=offsets,
+            text=''.join(messages),
+        )
+
+    @classmethod
+    def concat(cls, tables: List['MessageTable']) -> 'MessageTable':
+        """테이블들을 순서대로 이어 붙임 (발신자 코드는 합친 사전 기준으로 다시 매김)"""
+        tables = [table for table in tables if len(table)]
+        if not tables:
+            return cls.empty()
+        if len(tables) == 1:
+            return tables[0]
+
+        index: Dict[str, int] = {}
+        codes = []
+        offsets = [np.zeros(1, dtype=np.int64)]
+        metadata: Dict[int, Dict[str, Any]] = {}
+        text_length = 0
+        row = 0
+
+        for table in tables:
+            remap = np.array([index.setdefault(sender, len(index)) for sender in table.senders], dtype=np.int32)
+            codes.append(remap[table.sender_codes])
+            offsets.append(table.offsets[1:] + text_length)
+            for i, meta in (table.metadata or {}).items():
+                metadata[row + i] = meta
+            text_length += len(table.text)
+            row += len(table)
+
+        return cls(
+            timestamps=np.concatenate([table.timestamps for table in tables]),
+            sender_codes=np.concatenate(codes),
+            senders=list(index),
+            offsets=np.concatenate(offsets),
+            text=''.join(table.text for table in tables),
+            metadata=metadata or None,
+        )
+
+    @classmethod
+    def empty(cls) -> 'MessageTable':
+        return cls(
+            timestamps=np.zeros(0, dtype=np.int64),
+            sender_codes=np.zeros(0, dtype=np.int32),
+            senders=[],
+            offsets=np.zeros(1, dtype=np.int64),
+            text='',
+        )
+
+    def __len__(self) -> int:
+        return len(self.sender_codes)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ConversationMessage, 'MessageTable']:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._slice(start, max(start, stop))
+            return self.take(np.arange(start, stop, step))
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("MessageTable index out of range")
+
+        timestamp = int(self.timestamps[index])
+        return ConversationMessage(
+            timestamp=None if timestamp == NO_TIMESTAMP else _EPOCH + timedelta(microseconds=timestamp),
+            sender=self.senders[self.sender_codes[index]],
+            message=self.text[self.offsets[index]:self.offsets[index + 1]],
+            metadata=self.metadata.get(index) if self.metadata else None,
+        )
+
+    def __iter__(self) -> Iterator[ConversationMessage]:
+        # datetime / 발신자 / 본문을 컬럼 단위로 한 번에 변환한 뒤 객체는 하나씩 생성
+        metadata = self.metadata or {}
+        for i, (timestamp, sender, message) in enumerate(zip(
+            self.datetimes(), self.sender_names(), self.messages()
+        )):
+            yield ConversationMessage(
+                timestamp=timestamp,
+                sender=sender,
+                message=message,
+                metadata=metadata.get(i),
+            )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (MessageTable, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"MessageTable({len(self)} messages, {len(self.senders)} senders)"
+
+    @property
+    def has_timestamp(self) -> np.ndarray:
+        return self.timestamps != NO_TIMESTAMP
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """메시지별 본문 길이 (문자 수)"""
+        return np.diff(self.offsets)
+
+    def datetimes(self) -> List[Optional[datetime]]:
+        """메시지별 naive datetime (없으면 None)"""
+        return self.timestamps.view('datetime64[us]').tolist()
+
+    def sender_names(self) -> List[str]:
+        senders = self.senders
+        return [senders[code] for code in self.sender_codes.tolist()]
+
+    def messages(self) -> List[str]:
+        text = self.text
+        offsets = self.offsets.tolist()
+        return [text[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    def take(self, indices: np.ndarray) -> 'MessageTable':
+        """
+        indices 순서의 메시지로 새 테이블 (발신자 사전은 남은 발신자만, 등장 순서)
+
+        고른 메시지의 본문만 offsets로 잘라 이어 붙이므로 전체 메시지 문자열을 만들지 않습니다. (O(고른 메시지))
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self.offsets[indices]
+        ends = self.offsets[indices + 1]
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(ends - starts, out=offsets[1:])
+
+        text = self.text
+        codes, senders = self._remap_senders(self.sender_codes[indices])
+        metadata = {
+            new: self.metadata[old]
+            for new, old in enumerate(indices.tolist())
+            if self.metadata and old in self.metadata
+        }
+
+        return MessageTable(
+            timestamps=self.timestamps[indices],
+            sender_codes=codes,
+            senders=senders,
+            offsets=offsets,
+            text=''.join([text[start:end] for start, end in zip(starts.tolist(), ends.tolist())]),
+            metadata=metadata or None,
+        )
+
+    def _slice(self, start: int, stop: int) -> 'MessageTable':
+        """연속 구간 [start, stop) (본문은 문자열 한 번 자르기)"""
+        codes, senders = self._remap_senders(self.sender_codes[start:stop])
+        metadata = {
+            i - start: meta
+            for i, meta in (self.metadata or {}).items()
+            if start <= i < stop
+        }
+
+        return MessageTable(
+            timestamps=self.timestamps[start:stop].copy(),
+            sender_codes=codes,
+            senders=senders,
+            offsets=self.offsets[start:stop + 1] - self.offsets[start],
+            text=self.text[self.offsets[start]:self.offsets[stop]],
+            metadata=metadata or None,
+        )
+
+    def _remap_senders(self, codes: np.ndarray) -> tuple[np.ndarray, List[str]]:
+        """고른 메시지의 발신자 코드를 등장 순서 기준으로 다시 매김"""
+        present, first = np.unique(codes, return_index=True)
+        present = present[np.argsort(first)]
+        remap = np.zeros(len(self.senders), dtype=np.int32)
+        remap[present] = np.arange(len(present), dtype=np.int32)
+        return remap[codes], [self.senders[code] for code in present.tolist()]
+
+    def participants(self) -> List[str]:
+        """메시지를 보낸 발신자 (빈 이름 제외, 정렬)"""
+        present = np.unique(self.sender_codes)
+        return sorted(self.senders[code] for code in present.tolist() if self.senders[code])
+
+    def date_range(self) -> Optional[Dict[str, datetime]]:
+        """{'start': ..., 'end': ...} (타임스탬프가 하나도 없으면 None)"""
+        timestamps = self.timestamps[self.has_timestamp]
+        if len(timestamps) == 0:
+            return None
+        start, end = timestamps.min(), timestamps.max()
+        return {
+            'start': _EPOCH + timedelta(microseconds=int(start)),
+            'end': _EPOCH + timedelta(microseconds=int(end)),
+        }
+
+    def isoformat_timestamps(self) -> List[Optional[str]]:
+        """메시지별 datetime.isoformat() 문자열 (없으면 None), NumPy로 일괄 변환"""
+        stamps = self.timestamps.view('datetime64[us]')
+        # isoformat은 마이크로초가 0이면 초 단위까지만 출력
+        whole_seconds = (self.timestamps % 1_000_000) == 0
+        strings = np.where(
+            whole_seconds,
+            np.datetime_as_string(stamps.astype('datetime64[s]'), unit='s'),
+            np.datetime_as_string(stamps, unit='us'),
+        ).tolist()
+        return [None if not has else value for value, has in zip(strings, self.has_timestamp.tolist())]
+
+    def to_records(self, sanitize=None) -> List[Dict[str, Any]]:
+        """
+        ai_preprocessed_data.parsed_conversations 형식의 dict 리스트
+
+        Args:
+            sanitize: 발신자 / 본문에 적용할 정제 함수 (예: file_service.sanitize_text)
+        """
+        sanitize = sanitize or (lambda value: value)
+        senders = [sanitize(sender) for sender in self.senders]
+        metadata = self.metadata or {}
+        return [
+            {
+                'timestamp': timestamp,
+                'sender': senders[code],
+                'message': sanitize(message),
+                'metadata': metadata.get(i),
+            }
+            for i, (timestamp, code, message) in enumerate(zip(
+                self.isoformat_timestamps(), self.sender_codes.tolist(), self.messages()
+            ))
+        ]
+
+    def to_analysis_messages(self) -> List[Dict[str, Any]]:
+        """분석기 입력 형식 [{sender_id, content, timestamp}, ...]"""
+        return [
+            {'sender_id': sender, 'content': message, 'timestamp': timestamp}
+            for sender, message, timestamp in zip(self.sender_names(), self.messages(), self.datetimes())
+        ]
+
+    def nbytes(self) -> int:
+        """배열 + 본문 문자열의 대략적인 메모리 사용량"""
+        return (
+            self.timestamps.nbytes + self.sender_codes.nbytes + self.offsets.nbytes
+            + sys.getsizeof(self.text) + sum(sys.getsizeof(sender) for sender in self.senders)
+        )
@@ -0,0 +1,226 @@
+"""
+Parallel Chunked Parser
+
+대용량 카카오톡 내보내기 파일(txt/csv)을 여러 프로세스에서 나눠 파싱합니다.
+
+1. 파일을 mmap으로 열고 목표 크기마다 "메시지가 시작하는 줄" 경계를 찾아 바이트 구간으로 나눔
+2. 구간별 파싱을 ProcessPoolExecutor에 제출 (GIL 없이 코어 수만큼 병렬)
+3. 구간 순서대로 메시지를 이어 붙이고, 참여자 / 날짜 범위는 구간별 결과를 합쳐 계산
+
+워커는 파일 경로와 바이트 구간만 받아 직접 mmap으로 읽으므로 원본 텍스트를 프로세스 간에 복사하지 않습니다.
+NOTE: 바이트 단위로 자르므로 '\\n'이 다른 문자의 일부가 될 수 없는 인코딩(UTF-8 계열)에서만 사용합니다.
+"""
+import asyncio
+import codecs
+import csv
+import io
+import logging
+import mmap
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Set
+
+from ...core.config import get_settings
+from .message_table import MessageTable
+
+logger = logging.getLogger(__name__)
+
+# 바이트 단위 분할이 안전한 인코딩 (codecs 정규 이름)
+SPLITTABLE_ENCODINGS = frozenset({'utf-8', 'utf-8-sig'})
+
+# 코어당 구간 수 (구간 크기 편차를 흡수하기 위해 워커 수보다 잘게 나눔)
+CHUNKS_PER_WORKER = 4
+
+
+class ChunkResult(NamedTuple):
+    """구간 1개의 파싱 결과"""
+    messages: MessageTable  # 배열 몇 개라 프로세스 간 전달(pickle) 비용이 작음
+    participants: Set[str]
+    start: Optional[datetime]
+    end: Optional[datetime]
+
+
+def should_parse_in_parallel(file_path: str, encoding: str) -> bool:
+    """
+    구간 병렬 파싱 사용 여부
+
+    파일이 parallel_parse_min_bytes 이상이고, 워커가 2개 이상이며,
+    바이트 구간 분할이 안전한 인코딩일 때만 사용합니다. (작은 파일은 프로세스 왕복 비용이 더 큼)
+    """
+    settings = get_settings()
+    return (
+        parse_worker_count() > 1
+        and codecs.lookup(encoding).name in SPLITTABLE_ENCODINGS
+        and os.path.getsize(file_path) >= settings.parallel_parse_min_bytes
+    )
+
+
+def split_offsets(file_path: str, num_chunks: int, csv_rows: bool = False) -> List[int]:
+    """
+    파일을 메시지 경계에서 나누는 바이트 오프셋 계산
+
+    txt는 줄마다 독립적으로 파싱되므로 모든 줄 시작이 안전한 경계이고,
+    csv는 따옴표 안 줄바꿈이 있을 수 있어 파일 처음부터 센 따옴표 수가 짝수인(따옴표 밖) 줄 시작만 사용합니다.
+    (CSV는 따옴표를 ""로 이스케이프하므로 짝수/홀수로 따옴표 안팎을 판단할 수 있음)
+
+    Args:
+        file_path: 파일 경로
+        num_chunks: 목표 구간 수
+        csv_rows: True면 CSV 레코드 경계에서만 분할
+
+    Returns:
+        List[int]: [0, 경계1, ..., 파일 크기] (오름차순, 중복 없음)
+    """
+    size = os.path.getsize(file_path)
+    if size == 0 or num_chunks <= 1:
+        return [0, size]
+
+    offsets = [0]
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        scanned = 0  # 따옴표를 센 위치
+        quotes = 0  # [0, scanned) 구간의 따옴표 수
+
+        for i in range(1, num_chunks):
+            newline = mm.find(b'\n', max(size * i // num_chunks, offsets[-1]))
+            while newline != -1 and csv_rows:
+                quotes += mm[scanned:newline + 1].count(b'"')
+                scanned = newline + 1
+                if quotes % 2 == 0:
+                    break
+                newline = mm.find(b'\n', scanned)
+
+            if newline == -1 or newline + 1 >= size:
+                break
+            if newline + 1 > offsets[-1]:
+                offsets.append(newline + 1)
+
+    offsets.append(size)
+    return offsets
+
+
+def _read_chunk(file_path: str, start: int, end: int, encoding: str) -> str:
+    """바이트 구간을 읽어 디코딩 (텍스트 모드 open과 같은 universal newline 변환)"""
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    # BOM은 파일 맨 앞에만 있으므로 첫 구간이 아니면 utf-8-sig도 utf-8로 디코딩
+    if start > 0 and codecs.lookup(encoding).name == 'utf-8-sig':
+        encoding = 'utf-8'
+    return data.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _summarize(messages: MessageTable) -> ChunkResult:
+    date_range = messages.date_range() or {}
+    return ChunkResult(
+        messages=messages,
+        participants=set(messages.participants()),
+        start=date_range.get('start'),
+        end=date_range.get('end'),
+    )
+
+
+def parse_txt_chunk(file_path: str, start: int, end: int, encoding: str, is_english: bool) -> ChunkResult:
+    """txt 구간 파싱 (워커 프로세스에서 실행)"""
+    # 프로세서 모듈이 이 모듈을 import하므로 함수 안에서 import (순환 import 방지)
+    from .kakao_txt_processor import KakaoLineParser
+
+    text = _read_chunk(file_path, start, end, encoding)
+    return _summarize(MessageTable.from_messages(KakaoLineParser(is_english).parse_lines(text.split('\n'))))
+
+
+def parse_csv_chunk(file_path: str, start: int, end: int, encoding: str, fieldnames: List[str]) -> ChunkResult:
+    """
+    csv 구간 파싱 (워커 프로세스에서 실행)
+
+    첫 구간은 헤더 줄을 포함하므로 DictReader가 직접 읽고, 나머지 구간은 첫 구간의 헤더를 사용합니다.
+    """
+    from .kakao_csv_processor import parse_csv_rows
+
+    text = _read_chunk(file_path, start, end, encoding)
+    reader = csv.DictReader(io.StringIO(text), fieldnames=None if start == 0 else fieldnames)
+    return _summarize(parse_csv_rows(reader))
+
+
+def merge_chunks(results: List[ChunkResult]) -> ChunkResult:
+    """구간 결과를 파일 순서대로 합침 (메시지 이어 붙이기, 참여자 합집합, 날짜 min/max)"""
+    participants: Set[str] = set()
+    starts = []
+    ends = []
+
+    for result in results:
+        participants |= result.participants
+        if result.start is not None:
+            starts.append(result.start)
+            ends.append(result.end)
+
+    return ChunkResult(
+        messages=MessageTable.concat([result.messages for result in results]),
+        participants=participants,
+        start=min(starts) if starts else None,
+        end=max(ends) if ends else None,
+    )
+
+
+async def parse_in_parallel(
+    file_path: str,
+    chunk_parser,
+    *args,
+    csv_rows: bool = False,
+    workers: Optional[int] = None,
+) -> ChunkResult:
+    """
+    파일을 구간으로 나눠 프로세스 풀에서 파싱한 뒤 순서대로 합침
+
+    Args:
+        file_path: 파일 경로
+        chunk_parser: parse_txt_chunk 또는 parse_csv_chunk
+        *args: chunk_parser에 (file_path, start, end) 다음으로 넘길 인자
+        csv_rows: CSV 행 시작에서만 분할할지 여부
+        workers: 구간 수 계산에 쓸 워커 수 (기본값: 공유 풀 크기)
+
+    Returns:
+        ChunkResult: 파일 전체 결과
+    """
+    executor = get_parse_executor()
+    workers = workers or parse_worker_count()
+
+    offsets = await asyncio.to_thread(split_offsets, file_path, workers * CHUNKS_PER_WORKER, csv_rows)
+    logger.info(f"⚡ Parsing {file_path} in {len(offsets) - 1} chunks ({workers} workers)")
+
+    loop = asyncio.get_running_loop()
+    futures = [
+        loop.run_in_executor(executor, chunk_parser, file_path, start, end, *args)
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+    return merge_chunks(await asyncio.gather(*futures))
+
+
+# 공유 프로세스 풀 (파일 리스너 스레드 / API 요청이 함께 사용)
+_executor_instance: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def parse_worker_count() -> int:
+    """파싱 워커 수 (file_parse_workers, 0이면 CPU 코어 수)"""
+    return get_settings().file_parse_workers or os.cpu_count() or 1
+
+
+def get_parse_executor() -> ProcessPoolExecutor:
+    """파싱용 ProcessPoolExecutor 싱글톤 반환"""
+    global _executor_instance
+    with _executor_lock:
+        if _executor_instance is None:
+            workers = parse_worker_count()
+            _executor_instance = ProcessPoolExecutor(max_workers=workers)
+            logger.info(f"✅ File parse process pool started (workers={workers})")
+        return _executor_instance
+
+
+def shutdown_parse_executor():
+    """프로세스 풀 종료 (앱 종료 시)"""
+    global _executor_instance
+    with _executor_lock:
+        if _executor_instance is not None:
+            _executor_instance.shutdown(wait=True, cancel_futures=True)
+            _executor_instance = None
@@ -2,15 +2,109 @@
 PDF 파일 프로세서
 
 PDF에서 텍스트 추출 후 대화 형식 파싱
+
+대화 PDF는 수천 페이지가 될 수 있으므로
+1. 페이지를 PAGES_PER_TASK장씩 구간으로 나눠 파싱 프로세스 풀(parallel_parser)에서 추출하고
+2. 끝난 구간부터 파일 순서대로 KakaoLineParser에 흘려 넣어 MessageTable을 쌓습니다.
+
+이벤트 루프는 추출을 기다리기만 하고, 페이지마다 제한 시간을 두어 비정상적인 페이지 하나가 파일 전체를 붙잡지 않습니다.
 """
-from typing import List
+import asyncio
 import logging
+import signal
+import threading
+from collections import deque
+from typing import AsyncIterator, List, NamedTuple
 
-from .base_processor import BaseFileProcessor, ProcessedFile, ConversationMessage
-from .kakao_txt_processor import KakaoTxtProcessor
+from ...core.config import get_settings
+from .base_processor import BaseFileProcessor, ProcessedFile
+from .kakao_txt_processor import FORMAT_DETECT_CHARS, KakaoLineParser, KakaoTxtProcessor
+from .message_table import MessageTableBuilder
+from .parallel_parser import get_parse_executor, parse_worker_count
 
 logger = logging.getLogger(__name__)
 
+# 워커 작업 1개가 추출하는 페이지 수 (작업마다 PDF를 다시 열므로 너무 작게 나누지 않음)
+PAGES_PER_TASK = 8
+
+
+class PageRangeText(NamedTuple):
+    """페이지 구간 1개의 추출 결과"""
+    texts: List[str]  # 페이지별 텍스트 (빈 페이지 / 시간 초과 페이지는 '')
+    timed_out: List[int]  # 제한 시간을 넘겨 건너뛴 페이지 번호 (1부터)
+
+
+def _import_pdfplumber():
+    try:
+        # pdfplumber 사용 (설치 필요: pip install pdfplumber)
+        import pdfplumber
+        return pdfplumber
+    except ImportError:
+        logger.error("pdfplumber not installed. Run: pip install pdfplumber")
+        raise ImportError(
+            "pdfplumber is required for PDF processing. "
+            "Install it with: pip install pdfplumber"
+        )
+
+
+def _raise_page_timeout(signum, frame):
+    raise TimeoutError("page text extraction timed out")
+
+
+def count_pages(file_path: str) -> int:
+    """PDF 페이지 수 (페이지 내용은 읽지 않음)"""
+    with _import_pdfplumber().open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def extract_page_range(file_path: str, start: int, end: int, page_timeout: float) -> PageRangeText:
+    """
+    페이지 [start, end) 텍스트 추출 (워커 프로세스에서 실행)
+
+    제한 시간은 SIGALRM 타이머로 페이지마다 걸고, 넘기면 그 페이지만 건너뛰고 다음 페이지를 계속 추출합니다.
+    (워커는 작업을 메인 스레드에서 실행하므로 시그널 사용 가능, SIGALRM이 없는 플랫폼에서는 제한 없음)
+
+    Args:
+        file_path: PDF 파일 경로
+        start: 시작 페이지 인덱스 (0부터)
+        end: 끝 페이지 인덱스 (미포함)
+        page_timeout: 페이지당 제한 시간 (초, 0 이하면 제한 없음)
+
+    Returns:
+        PageRangeText: 페이지별 텍스트와 시간 초과 페이지
+    """
+    pdfplumber = _import_pdfplumber()
+    use_alarm = (
+        page_timeout > 0
+        and hasattr(signal, 'setitimer')
+        and threading.current_thread() is threading.main_thread()
+    )
+    previous_handler = signal.signal(signal.SIGALRM, _raise_page_timeout) if use_alarm else None
+
+    texts = []
+    timed_out = []
+    try:
+        with pdfplumber.open(file_path, pages=list(range(start + 1, end + 1))) as pdf:
+            for page_num, page in enumerate(pdf.pages, start + 1):
+                try:
+                    if use_alarm:
+                        signal.setitimer(signal.ITIMER_REAL, page_timeout)
+                    page_text = page.extract_text() or ''
+                except TimeoutError:
+                    page_text = ''
+                    timed_out.append(page_num)
+                finally:
+                    if use_alarm:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+                # 페이지 레이아웃 캐시 해제 (긴 구간에서 메모리 누적 방지)
+                page.close()
+                texts.append(page_text)
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous_handler)
+
+    return PageRangeText(texts=texts, timed_out=timed_out)
+
 
 class PdfProcessor(BaseFileProcessor):
     """
@@ -38,36 +132,73 @@ class PdfProcessor(BaseFileProcessor):
             file_path: 파일 경로
             **kwargs:
                 - extract_images: 이미지도 추출할지 여부 (기본값: False)
+                - keep_raw_text: 추출한 텍스트를 결과에 담을지 여부 (기본값: False)
+                  False면 대화가 파싱되는 순간부터 페이지 텍스트를 보관하지 않음
+                  (대화 형식이 아니면 파싱 실패 결과로 돌려주기 위해 보관)
 
         Returns:
             ProcessedFile: 처리 결과
         """
+        keep_raw_text = kwargs.get('keep_raw_text', False)
+
         try:
             logger.info(f"📄 Processing PDF file: {file_path}")
 
-            # PDF에서 텍스트 추출
-            raw_text = await self._extract_text_from_pdf(file_path)
+            # 페이지 구간이 끝나는 대로 카카오톡 형식으로 파싱
+            builder = MessageTableBuilder()
+            line_parser = None
+            text_parts = []
+            char_count = 0
+            timed_out = []
+
+            async for page_range in self._extract_page_ranges(file_path):
+                timed_out += page_range.timed_out
+                for page_text in page_range.texts:
+                    if not page_text:
+                        continue
+                    # 페이지 구분 줄바꿈 포함 (raw_text 길이와 같음)
+                    char_count += len(page_text) + (1 if char_count else 0)
+                    if line_parser is None:
+                        # 형식(한글/영문)은 텍스트가 있는 첫 페이지로 판단
+                        is_english = self.kakao_parser._detect_format(page_text[:FORMAT_DETECT_CHARS])
+                        line_parser = KakaoLineParser(is_english)
+                    builder.extend(line_parser.parse_lines(page_text.split('\n')))
+
+                    if keep_raw_text or not len(builder):
+                        text_parts.append(page_text)
+                    elif text_parts:
+                        # 대화가 파싱되기 시작하면 원본 텍스트는 더 필요 없음
+                        text_parts = []
+
+            logger.info(f"✅ Extracted {char_count} characters from PDF")
 
-            if not raw_text:
+            warnings = []
+            if timed_out:
+                logger.warning(f"⚠️ Skipped {len(timed_out)} PDF pages after timeout: {timed_out[:20]}")
+                warnings.append(
+                    f"{len(timed_out)}개 페이지가 제한 시간을 넘겨 제외되었습니다 (페이지: {', '.join(map(str, timed_out[:20]))})"
+                )
+
+            if not char_count:
                 logger.warning("No text found in PDF")
                 return ProcessedFile(
                     success=False,
                     file_type='pdf',
-                    error_message="PDF에서 텍스트를 추출할 수 없습니다"
+                    error_message="PDF에서 텍스트를 추출할 수 없습니다",
+                    warnings=warnings
                 )
 
-            # 카카오톡 형식으로 파싱 시도
-            conversations = self.kakao_parser._parse_conversations(raw_text)
+            conversations = builder.build()
 
             if not conversations:
-                # 파싱 실패 시 raw_text만 반환
+                # 파싱 실패 시 raw_text만 반환 (이 경우 모든 페이지 텍스트가 남아 있음)
                 logger.warning("Could not parse conversations from PDF text")
                 return ProcessedFile(
                     success=True,
                     file_type='pdf',
-                    raw_text=raw_text,
+                    raw_text='\n'.join(text_parts),
                     conversations=[],
-                    warnings=["PDF 텍스트를 대화 형식으로 파싱할 수 없습니다"]
+                    warnings=warnings + ["PDF 텍스트를 대화 형식으로 파싱할 수 없습니다"]
                 )
 
             # 성공
@@ -81,11 +212,12 @@ class PdfProcessor(BaseFileProcessor):
             return ProcessedFile(
                 success=True,
                 file_type='pdf',
-                raw_text=raw_text,
+                raw_text='\n'.join(text_parts) if keep_raw_text else None,
                 conversations=conversations,
                 total_messages=len(conversations),
                 participants=participants,
-                date_range=date_range
+                date_range=date_range,
+                warnings=warnings
             )
 
         except Exception as e:
@@ -96,43 +228,48 @@ class PdfProcessor(BaseFileProcessor):
                 error_message=str(e)
             )
 
-    async def _extract_text_from_pdf(self, file_path: str) -> str:
+    async def _extract_page_ranges(self, file_path: str) -> AsyncIterator[PageRangeText]:
         """
-        PDF에서 텍스트 추출
+        페이지 구간을 워커 프로세스에서 추출해 파일 순서대로 yield
+
+        동시에 제출하는 구간은 pdf_page_workers개로 제한하고,
+        맨 앞 구간이 끝나면 yield한 뒤 다음 구간을 제출합니다. (순서 유지 + 메모리에 쌓이는 구간 수 제한)
 
         Args:
             file_path: PDF 파일 경로
 
-        Returns:
-            str: 추출된 텍스트
+        Yields:
+            PageRangeText: 구간별 추출 결과 (페이지 순서)
         """
-        try:
-            # pdfplumber 사용 (설치 필요: pip install pdfplumber)
-            import pdfplumber
+        settings = get_settings()
+        concurrency = max(1, settings.pdf_page_workers or parse_worker_count())
 
-            text_parts = []
+        page_count = await asyncio.to_thread(count_pages, file_path)
+        logger.info(f"📖 PDF has {page_count} pages ({concurrency} page ranges in parallel)")
 
-            with pdfplumber.open(file_path) as pdf:
-                logger.info(f"📖 PDF has {len(pdf.pages)} pages")
+        executor = get_parse_executor()
+        loop = asyncio.get_running_loop()
+        starts = iter(range(0, page_count, PAGES_PER_TASK))
+        pending = deque()
 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    page_text = page.extract_text()
-
-                    if page_text:
-                        text_parts.append(page_text)
-                        logger.debug(f"   Page {page_num}: {len(page_text)} characters")
+        def submit_next():
+            start = next(starts, None)
+            if start is not None:
+                end = min(start + PAGES_PER_TASK, page_count)
+                pending.append(loop.run_in_executor(
+                    executor, extract_page_range,
+                    file_path, start, end, settings.pdf_page_timeout_seconds,
+                ))
 
-            full_text = '\n'.join(text_parts)
-            logger.info(f"✅ Extracted {len(full_text)} characters from PDF")
+        for _ in range(concurrency):
+            submit_next()
 
-            return full_text
-
-        except ImportError:
-            logger.error("pdfplumber not installed. Run: pip install pdfplumber")
-            raise ImportError(
-                "pdfplumber is required for PDF processing. "
-                "Install it with: pip install pdfplumber"
-            )
-        except Exception as e:
-            logger.error(f"PDF text extraction failed: {e}")
-            raise
+        try:
+            while pending:
+                page_range = await pending.popleft()
+                submit_next()
+                yield page_range
+        finally:
+            # 중간에 실패하면 아직 시작하지 않은 구간은 취소
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,163 @@
+"""
+Timestamp Parser
+
+카카오톡 내보내기 파일의 타임스탬프 파싱 (txt / csv / pdf 프로세서 공유)
+
+datetime.strptime은 호출마다 형식 문자열 해석 + 정규식 매칭을 하므로 수십만 줄에서 가장 느린 부분입니다.
+여기서는 고정 레이아웃을 직접 잘라 정수로 변환하고,
+같은 날짜 부분("2024-01-15", "2025년 2월 14일", "January 3, 2022")은 크기 제한이 있는 캐시로 한 번만 해석합니다.
+
+- 결과와 예외는 strptime과 같습니다. (고정 레이아웃이 아니면 strptime으로 처리)
+- CSV 날짜 컬럼처럼 문자열이 모여 있으면 NumPy datetime64로 한 번에 변환할 수 있습니다.
+
+벤치마크: scripts/benchmark_timestamp_parser.py
+"""
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 날짜 부분 캐시 크기 (대화 기간의 날짜 수만큼이면 충분, 여러 해 내보내기 파일 기준)
+DATE_CACHE_SIZE = 8192
+
+CSV_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+KOREAN_DATE_PATTERN = re.compile(r'(\d{4})년\s+(\d{1,2})월\s+(\d{1,2})일')
+ENGLISH_DATE_PATTERN = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})')
+
+ENGLISH_MONTHS = {
+    name: month for month, name in enumerate(
+        ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+         'august', 'september', 'october', 'november', 'december'],
+        start=1,
+    )
+}
+
+_DIGITS = frozenset('0123456789')
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _iso_date(prefix: str) -> Optional[Tuple[int, int, int]]:
+    """'YYYY-MM-DD' → (연, 월, 일), 숫자가 아니면 None"""
+    if not (_DIGITS.issuperset(prefix[0:4]) and _DIGITS.issuperset(prefix[5:7]) and _DIGITS.issuperset(prefix[8:10])):
+        return None
+    return int(prefix[0:4]), int(prefix[5:7]), int(prefix[8:10])
+
+
+def parse_csv_datetime(value: str) -> datetime:
+    """
+    'YYYY-MM-DD HH:MM:SS' 파싱 (strptime(value, '%Y-%m-%d %H:%M:%S')와 같은 결과)
+
+    Raises:
+        ValueError: 형식이 맞지 않거나 날짜/시간 범위를 벗어난 경우
+    """
+    if (
+        len(value) == 19
+        and value[4] == '-' and value[7] == '-' and value[10] == ' '
+        and value[13] == ':' and value[16] == ':'
+    ):
+        date_parts = _iso_date(value[:10])
+        time_digits = value[11:13] + value[14:16] + value[17:19]
+        if date_parts is not None and _DIGITS.issuperset(time_digits):
+            second = int(value[17:19])
+            # strptime은 %S에 61까지 받지만 datetime은 59까지만 허용 → 같은 예외를 위해 strptime에 위임
+            if second <= 59:
+                return datetime(*date_parts, int(value[11:13]), int(value[14:16]), second)
+
+    # 한 자리 월/일 등 고정 레이아웃이 아닌 값
+    return datetime.strptime(value, CSV_DATETIME_FORMAT)
+
+
+def parse_csv_datetime_column(values: Sequence[str]) -> np.ndarray:
+    """
+    'YYYY-MM-DD HH:MM:SS' 문자열 컬럼을 datetime64[s] 배열로 일괄 변환
+
+    NumPy 파서가 거부하거나 strptime이 거부할 값(예: 'T' 구분자, 시간대 표기)은
+    개별 파싱으로 다시 확인하고 실패하면 NaT로 둡니다.
+
+    Args:
+        values: 날짜 문자열들
+
+    Returns:
+        np.ndarray: datetime64[s] 배열 (파싱 실패는 NaT)
+    """
+    strings = np.asarray(values, dtype=str)
+    fixed_layout = np.char.str_len(strings) == 19
+    if strings.size:
+        fixed_layout &= np.char.find(strings, ' ') == 10
+
+    result = np.full(len(strings), np.datetime64('NaT'), dtype='datetime64[s]')
+    try:
+        result[fixed_layout] = strings[fixed_layout].astype('datetime64[s]')
+    except ValueError:
+        # 잘못된 값이 섞이면 전체 변환이 실패하므로 개별 파싱으로 전환
+        fixed_layout[:] = False
+
+    for i in np.flatnonzero(~fixed_layout):
+        try:
+            result[i] = np.datetime64(parse_csv_datetime(strings[i]), 's')
+        except ValueError:
+            pass
+    return result
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_korean_date(value: str) -> Tuple[int, int, int]:
+    """
+    '2025년 2월 14일' → (2025, 2, 14)
+
+    Raises:
+        ValueError: 형식이 맞지 않는 경우
+    """
+    match = KOREAN_DATE_PATTERN.fullmatch(value)
+    if not match:
+        raise ValueError(f"invalid Korean date: {value}")
+    year, month, day = match.groups()
+    return int(year), int(month), int(day)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_english_date(value: str) -> Tuple[int, int, int]:
+    """
+    'January 3, 2022' → (2022, 1, 3) (strptime(value, '%B %d, %Y')와 같은 검사)
+
+    Raises:
+        ValueError: 월 이름이 틀리거나 날짜가 범위를 벗어난 경우
+    """
+    match = ENGLISH_DATE_PATTERN.fullmatch(value)
+    month = ENGLISH_MONTHS.get(match.group(1).lower()) if match else None
+    if month is None:
+        raise ValueError(f"invalid English date: {value}")
+
+    year, day = int(match.group(3)), int(match.group(2))
+    # 존재하지 않는 날짜(2월 30일 등)는 여기서 ValueError
+    datetime(year, month, day)
+    return year, month, day
+
+
+def kakao_datetime(date_parts: Tuple[int, int, int], hour: int, minute: int, afternoon: bool) -> datetime:
+    """
+    카카오톡 12시간제 시각 → datetime (오전 12시 = 0시, 오후 12시 = 12시)
+
+    Args:
+        date_parts: (연, 월, 일)
+        hour: 12시간제 시
+        minute: 분
+        afternoon: 오후(PM) 여부
+    """
+    if afternoon and hour != 12:
+        hour += 12
+    elif not afternoon and hour == 12:
+        hour = 0
+    return datetime(*date_parts, hour, minute, 0)
+
+
+def clear_caches() -> List[int]:
+    """날짜 캐시 비우기 (벤치마크용), 비우기 전 항목 수 반환"""
+    caches = (_iso_date, parse_korean_date, parse_english_date)
+    sizes = [cache.cache_info().currsize for cache in caches]
+    for cache in caches:
+        cache.cache_clear()
+    return sizes
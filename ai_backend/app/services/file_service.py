@@ -13,6 +13,7 @@ import logging
 from ..core.supabase import get_supabase_client
 from .file_processors.processor_factory import FileProcessorFactory
 from .file_processors.base_processor import ProcessedFile
+from .file_processors.message_table import MessageTable
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +106,9 @@ class FileService:
                     f"Supported extensions: {FileProcessorFactory.get_supported_extensions()}"
                 )
 
-            result = await processor.process(local_path)
+            # 대화 내보내기(txt/csv) 원본은 Storage의 파일(file_url)에 그대로 있으므로
+            # 원본 텍스트를 메모리에 다시 만들어 extracted_text에 중복 저장하지 않음 (대용량 파일 메모리 제한)
+            result = await processor.process(local_path, keep_raw_text=False)
 
             # 5. 처리 결과를 ai_preprocessed_data 테이블에 저장
             await self._save_to_preprocessed_data(
@@ -197,16 +200,10 @@ class FileService:
             result: 처리 결과
         """
         try:
-            # 대화 데이터를 JSONB 형식으로 변환 (텍스트 정제)
+            # 대화 데이터를 JSONB 형식으로 변환 (텍스트 정제, 메시지 객체를 만들지 않고 컬럼에서 바로 변환)
             parsed_conversations = []
             if result.conversations:
-                for msg in result.conversations:
-                    parsed_conversations.append({
-                        'timestamp': msg.timestamp.isoformat() if msg.timestamp else None,
-                        'sender': sanitize_text(msg.sender),
-                        'message': sanitize_text(msg.message),
-                        'metadata': msg.metadata
-                    })
+                parsed_conversations = MessageTable.from_messages(result.conversations).to_records(sanitize_text)
 
             # ai_preprocessed_data에 INSERT
             # NOTE: user_id는 profiles 테이블에 레코드가 있어야 함
@@ -0,0 +1,252 @@
+"""
+Keyphrase Extractor (TextRank)
+
+하루 대화의 명사 동시출현 그래프에 TextRank(가중 PageRank)를 돌려 여러 단어 키프레이즈를 뽑습니다.
+("강남역 파스타", "주말 여행")
+
+- 노드 = 키워드 후보 명사 (KeywordExtractor와 같은 품사 / 불용어 규칙)
+- 간선 = 같은 메시지 안에서 window 이내로 등장한 명사 쌍, 가중치 = 동시출현 횟수
+- 그래프는 CSR 배열(indptr, indices, data)로 한 번에 만들고,
+  power iteration의 행렬-벡터 곱은 NumPy bincount로 계산합니다. (scipy 불필요)
+- 상위 단어가 원문에서 연달아 나오면 하나의 키프레이즈로 묶습니다.
+
+형태소 분석은 KeywordExtractor와 결과를 공유할 수 있도록 (form, tag) 리스트를 입력으로 받습니다.
+"""
+import logging
+from typing import List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ..core.config import get_settings
+from .keyword_extractor import KeywordExtractor, TaggedTexts
+
+logger = logging.getLogger(__name__)
+
+
+class CooccurrenceGraph(NamedTuple):
+    """대칭 가중 그래프 (CSR)"""
+    vocab: List[str]  # 노드 ID → 명사
+    indptr: np.ndarray  # 길이 n + 1
+    indices: np.ndarray  # 이웃 노드 ID
+    data: np.ndarray  # 간선 가중치 (동시출현 횟수)
+
+
+class CandidateTokens(NamedTuple):
+    """후보 명사 토큰 (원문 등장 순서)"""
+    ids: np.ndarray  # 노드 ID
+    messages: np.ndarray  # 메시지 번호
+    positions: np.ndarray  # 메시지 안의 형태소 위치
+
+
+class TextRankKeyphraseExtractor:
+    """명사 동시출현 그래프 기반 TextRank 키프레이즈 추출기"""
+
+    DAMPING = 0.85
+    MAX_ITERATIONS = 50
+    TOLERANCE = 1e-6
+
+    # 이 비율 안에 드는 상위 단어만 키프레이즈 구성에 사용 (원 논문의 T = |V| / 3)
+    TOP_WORD_RATIO = 1 / 3
+    MAX_PHRASE_WORDS = 3
+
+    def __init__(self, window: Optional[int] = None):
+        """
+        Args:
+            window: 동시출현 간선을 만드는 후보 명사 거리 (기본값: textrank_window)
+
+        Raises:
+            ValueError: window가 2보다 작은 경우 (간선이 하나도 만들어지지 않음)
+        """
+        self.window = window if window is not None else get_settings().textrank_window
+        if self.window < 2:
+            raise ValueError(f"TextRank window must be >= 2 (got {self.window})")
+
+    def extract(self, tagged: TaggedTexts, top_k: Optional[int] = None) -> List[str]:
+        """
+        TextRank 키프레이즈 추출
+
+        Args:
+            tagged: 메시지별 (형태소 form, 품사 태그) 리스트 (TokenizerService.tokenize_tagged 결과)
+            top_k: 반환할 키프레이즈 수 (기본값: keyphrase_top_k)
+
+        Returns:
+            List[str]: 점수 순 키프레이즈 (단어는 공백으로 연결)
+        """
+        top_k = top_k or get_settings().keyphrase_top_k
+
+        vocab, tokens = self.candidate_tokens(tagged)
+        if len(vocab) < 2:
+            return vocab[:top_k]
+
+        graph = self.build_graph(vocab, tokens)
+        scores = self.rank(graph)
+        return self._phrases(vocab, tokens, scores, top_k)
+
+    def candidate_tokens(self, tagged: TaggedTexts) -> Tuple[List[str], CandidateTokens]:
+        """
+        후보 명사 토큰을 정수 배열로 인코딩
+
+        Returns:
+            tuple: (노드 ID → 명사 리스트, CandidateTokens)
+        """
+        vocab: dict = {}
+        ids = []
+        messages = []
+        positions = []
+
+        for m, tokens in enumerate(tagged):
+            for p, (form, tag) in enumerate(tokens):
+                if not tag.startswith(KeywordExtractor.NOUN_TAGS) or len(form) < 2:
+                    continue
+                term = form.lower() if tag == 'SL' else form
+                if term in KeywordExtractor.STOPWORDS:
+                    continue
+                ids.append(vocab.setdefault(term, len(vocab)))
+                messages.append(m)
+                positions.append(p)
+
+        return list(vocab), CandidateTokens(
+            ids=np.array(ids, dtype=np.int64),
+            messages=np.array(messages, dtype=np.int64),
+            positions=np.array(positions, dtype=np.int64),
+        )
+
+    def build_graph(self, vocab: List[str], tokens: CandidateTokens) -> CooccurrenceGraph:
+        """
+        후보 명사열에서 window 이내 쌍을 세어 CSR 그래프 생성
+
+        메시지 경계는 넘지 않고, 같은 명사끼리의 자기 간선은 만들지 않습니다.
+        window 안에 쌍이 하나도 없으면 간선 없는 그래프를 반환합니다.
+        """
+        n = len(vocab)
+        ids, messages = tokens.ids, tokens.messages
+
+        sources = []
+        targets = []
+        for distance in range(1, min(self.window, len(ids))):
+            a, b = ids[:-distance], ids[distance:]
+            valid = (messages[:-distance] == messages[distance:]) & (a != b)
+            sources.append(a[valid])
+            targets.append(b[valid])
+
+        if not sources:
+            return CooccurrenceGraph(
+                vocab=vocab,
+                indptr=np.zeros(n + 1, dtype=np.int64),
+                indices=np.zeros(0, dtype=np.int64),
+                data=np.zeros(0, dtype=np.float64),
+            )
+
+        # 무방향 그래프: 양방향 간선을 모두 넣고 (행, 열) 키로 합산
+        src = np.concatenate(sources + targets)
+        dst = np.concatenate(targets + sources)
+        keys, weights = np.unique(src * n + dst, return_counts=True)
+
+        # np.unique 결과는 키 순 = 행 우선 정렬이므로 그대로 CSR
+        rows = keys // n
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+        return CooccurrenceGraph(
+            vocab=vocab,
+            indptr=indptr,
+            indices=keys % n,
+            data=weights.astype(np.float64),
+        )
+
+    def rank(self, graph: CooccurrenceGraph) -> np.ndarray:
+        """
+        가중 PageRank power iteration
+
+        이웃이 없는 노드의 점수는 전체 노드에 고르게 나눠 총합을 1로 유지합니다.
+
+        Returns:
+            np.ndarray: 노드별 점수 (합 1)
+        """
+        n = len(graph.vocab)
+        rows = np.repeat(np.arange(n), np.diff(graph.indptr))
+        strength = np.bincount(rows, weights=graph.data, minlength=n)
+        dangling = strength == 0
+        inverse_strength = np.divide(1.0, strength, out=np.zeros(n), where=~dangling)
+
+        scores = np.full(n, 1.0 / n)
+        for _ in range(self.MAX_ITERATIONS):
+            # 대칭 행렬이므로 A^T x = A x: 행별로 data * x[indices] 합산
+            spread = scores * inverse_strength
+            incoming = np.bincount(rows, weights=graph.data * spread[graph.indices], minlength=n)
+
+            updated = (1 - self.DAMPING) / n + self.DAMPING * (incoming + scores[dangling].sum() / n)
+            if np.abs(updated - scores).sum() < self.TOLERANCE:
+                return updated
+            scores = updated
+
+        return scores
+
+    def _phrases(
+        self,
+        vocab: List[str],
+        tokens: CandidateTokens,
+        scores: np.ndarray,
+        top_k: int,
+    ) -> List[str]:
+        """상위 단어가 같은 메시지에서 연달아 나온 구간을 키프레이즈로 묶어 점수(단어 점수 합) 순 정렬"""
+        top_count = max(top_k, int(np.ceil(len(vocab) * self.TOP_WORD_RATIO)))
+        is_top = np.zeros(len(vocab), dtype=bool)
+        is_top[np.argsort(-scores, kind='stable')[:top_count]] = True
+
+        keep = is_top[tokens.ids]
+        ids = tokens.ids[keep]
+        messages = tokens.messages[keep]
+        positions = tokens.positions[keep]
+        if len(ids) == 0:
+            return []
+
+        # 바로 앞 토큰과 이어지지 않으면 새 구간 시작
+        starts = np.ones(len(ids), dtype=bool)
+        starts[1:] = (messages[1:] != messages[:-1]) | (positions[1:] != positions[:-1] + 1)
+        bounds = np.append(np.flatnonzero(starts), len(ids))
+
+        phrases = {}
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            run = ids[begin:end]
+            if len(run) > self.MAX_PHRASE_WORDS or len(set(run.tolist())) < len(run):
+                continue
+            phrase = ' '.join(vocab[i] for i in run)
+            if phrase not in phrases:
+                phrases[phrase] = float(scores[run].sum())
+
+        return sorted(phrases, key=phrases.get, reverse=True)[:top_k]
+
+
+def merge_keyphrases(keyphrases: List[str], keywords: List[str], top_k: Optional[int] = None) -> List[str]:
+    """
+    여러 단어 키프레이즈를 앞에 두고 TF-IDF 키워드로 채운 키워드 리스트
+
+    키프레이즈에 이미 들어간 단어는 다시 넣지 않습니다.
+
+    Args:
+        keyphrases: TextRank 키프레이즈 (점수 순)
+        keywords: TF-IDF 키워드 (점수 순)
+        top_k: 전체 개수 (기본값: keyword_top_k)
+
+    Returns:
+        List[str]: conversation_analysis.keywords에 저장할 리스트
+    """
+    top_k = top_k or get_settings().keyword_top_k
+
+    merged = [phrase for phrase in keyphrases if ' ' in phrase]
+    covered = {word for phrase in merged for word in phrase.split(' ')}
+    merged += [keyword for keyword in keywords if keyword not in covered]
+    return merged[:top_k]
+
+
+# 싱글톤 인스턴스
+_extractor_instance = None
+
+
+def get_keyphrase_extractor() -> TextRankKeyphraseExtractor:
+    """TextRank Keyphrase Extractor 싱글톤 인스턴스 반환"""
+    global _extractor_instance
+    if _extractor_instance is None:
+        _extractor_instance = TextRankKeyphraseExtractor()
+    return _extractor_instance
@@ -0,0 +1,403 @@
+"""
+Keyword Extractor (TF-IDF)
+
+Kiwi 형태소 분석으로 명사 / 동사 / 형용사 어간을 뽑고, 누적된 문서 빈도(df)로 TF-IDF 점수를 매깁니다.
+
+- 문서 = 커플의 하루 대화 (일별 배치) 또는 API로 받은 대화 1건
+- df 색인은 커플별 + 전체(global) 두 가지를 유지하고, 날짜가 분석될 때마다 그 날 문서만 더합니다.
+- 문서는 (용어, 빈도) 희소 벡터로 표현하므로 점수 계산은 그 날 등장한 용어 수에만 비례합니다.
+
+저장 테이블: keyword_df_index (supabase/migrations/20251120000003_keyword_df_index.sql)
+저장은 마지막 저장 이후의 증가분만 increment_keyword_df RPC로 더합니다 (20251120000007_keyword_df_increment.sql).
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..core.config import get_settings
+from ..core.supabase import get_supabase_client
+from .tokenizer_service import get_tokenizer_service
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_SCOPE = 'global'
+
+# 메시지별 (형태소 form, 품사 태그) 리스트
+TaggedTexts = List[List[Tuple[str, str]]]
+
+
+class DocumentFrequencyIndex:
+    """용어별 문서 빈도 색인 (용어 → 정수 ID, df는 NumPy 배열)"""
+
+    def __init__(self):
+        self.vocab: Dict[str, int] = {}
+        self._df = np.zeros(1024, dtype=np.int64)
+        self.n_docs = 0
+        self.last_doc_key: Optional[str] = None
+        # 아직 저장하지 않은 증가분
+        self._pending_df: Counter = Counter()
+        self._pending_docs = 0
+
+    def _ensure_capacity(self, size: int):
+        if size > len(self._df):
+            grown = np.zeros(max(size, len(self._df) * 2), dtype=np.int64)
+            grown[:len(self._df)] = self._df
+            self._df = grown
+
+    def add_document(self, terms: Iterable[str], doc_key: Optional[str] = None) -> bool:
+        """
+        문서 1건의 용어 집합을 df에 반영
+
+        Args:
+            terms: 문서의 용어들 (중복은 한 번만 셈)
+            doc_key: 문서 키 (예: 날짜). 마지막으로 반영한 키 이하이면 무시 (재실행 시 중복 방지)
+
+        Returns:
+            bool: 반영 여부
+        """
+        if doc_key is not None and self.last_doc_key is not None and doc_key <= self.last_doc_key:
+            return False
+
+        unique_terms = set(terms)
+        ids = [self.vocab.setdefault(term, len(self.vocab)) for term in unique_terms]
+        self._ensure_capacity(len(self.vocab))
+        self._df[np.asarray(ids, dtype=np.int64)] += 1
+        self.n_docs += 1
+        self._pending_df.update(unique_terms)
+        self._pending_docs += 1
+        if doc_key is not None:
+            self.last_doc_key = doc_key
+        return True
+
+    def has_pending(self) -> bool:
+        """저장하지 않은 증가분이 있는지"""
+        return self._pending_docs > 0
+
+    def pending_delta(self) -> dict:
+        """마지막 저장 이후 증가분 (increment_keyword_df 인자 형식)"""
+        return {
+            'n_docs': self._pending_docs,
+            'last_doc_key': self.last_doc_key,
+            'df': dict(self._pending_df),
+        }
+
+    def commit_pending(self, delta: dict):
+        """저장된 증가분을 대기 목록에서 제거 (저장 중에 더해진 문서는 남김)"""
+        self._pending_docs -= delta['n_docs']
+        self._pending_df.subtract(delta['df'])
+        self._pending_df = +self._pending_df
+
+    def document_frequencies(self, terms: List[str]) -> np.ndarray:
+        """용어별 df (색인에 없으면 0)"""
+        ids = np.fromiter((self.vocab.get(term, -1) for term in terms), dtype=np.int64, count=len(terms))
+        return np.where(ids >= 0, self._df[np.maximum(ids, 0)], 0)
+
+    def idf(self, terms: List[str]) -> np.ndarray:
+        """평활화 IDF: log((1 + N) / (1 + df)) + 1"""
+        return np.log((1 + self.n_docs) / (1 + self.document_frequencies(terms))) + 1
+
+    def to_dict(self) -> dict:
+        """JSON 저장용 상태"""
+        return {
+            'n_docs': self.n_docs,
+            'last_doc_key': self.last_doc_key,
+            'df': {term: int(self._df[i]) for term, i in self.vocab.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DocumentFrequencyIndex':
+        """to_dict 결과로부터 복원"""
+        index = cls()
+        df = data.get('df') or {}
+        index.vocab = {term: i for i, term in enumerate(df)}
+        index._ensure_capacity(len(df))
+        index._df[:len(df)] = np.fromiter(df.values(), dtype=np.int64, count=len(df))
+        index.n_docs = data.get('n_docs', 0)
+        index.last_doc_key = data.get('last_doc_key')
+        return index
+
+
+class KeywordIndexStore:
+    """
+    keyword_df_index 테이블 기반 df 색인 캐시 (scope = 'global' 또는 couple_id)
+
+    - 다른 워커가 더한 문서를 보도록 저장 대기 증가분이 없는 색인은 keyword_index_ttl_seconds마다 다시 로드
+    - 저장은 행 전체가 아니라 증가분만 DB에서 더하므로 동시에 저장해도 증가분이 사라지지 않음
+    - 로드에 실패한 색인은 캐시하지 않고, 갱신 / 저장도 하지 않음 (빈 색인으로 DB 행을 덮어쓰지 않도록)
+    - 색인 변경 / 조회는 _lock 안에서 (배치가 스레드에서 갱신하는 동안 API가 읽을 수 있음)
+    """
+
+    TABLE = 'keyword_df_index'
+    INCREMENT_RPC = 'increment_keyword_df'
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.supabase = get_supabase_client()
+        self.ttl_seconds = get_settings().keyword_index_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._indexes: Dict[str, DocumentFrequencyIndex] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._dirty: set = set()
+        self._saving: set = set()
+        self._lock = threading.Lock()
+
+    def _is_stale(self, scope: str) -> bool:
+        """다시 로드할 때가 됐는지 (저장 대기 / 저장 중인 색인은 다시 로드하지 않음)"""
+        if scope not in self._indexes:
+            return True
+        if scope in self._dirty or scope in self._saving or self._indexes[scope].has_pending():
+            return False
+        return time.monotonic() - self._loaded_at[scope] >= self.ttl_seconds
+
+    def _load(self, scope: str) -> Optional[DocumentFrequencyIndex]:
+        """DB에서 색인 로드 (행이 없으면 빈 색인, 실패하면 None)"""
+        try:
+            response = self.supabase.table(self.TABLE)\
+                .select('n_docs, last_doc_key, df')\
+                .eq('scope', scope)\
+                .limit(1)\
+                .execute()
+        except Exception as e:
+            logger.warning(f"Failed to load keyword index ({scope}): {e}")
+            return None
+        if response.data:
+            return DocumentFrequencyIndex.from_dict(response.data[0])
+        return DocumentFrequencyIndex()
+
+    def get(self, scope: str) -> Optional[DocumentFrequencyIndex]:
+        """
+        색인 반환 (메모리에 없거나 TTL이 지났으면 DB에서 로드)
+
+        Returns:
+            DocumentFrequencyIndex | None: 로드에 실패하면 이전에 로드한 색인, 그것도 없으면 None
+        """
+        with self._lock:
+            if not self._is_stale(scope):
+                return self._indexes[scope]
+
+        index = self._load(scope)
+
+        with self._lock:
+            if index is None or not self._is_stale(scope):
+                # 로드 실패 또는 그 사이 다른 스레드가 로드 / 갱신함
+                return self._indexes.get(scope)
+            self._indexes[scope] = index
+            self._loaded_at[scope] = time.monotonic()
+            return index
+
+    def add_document(self, scope: str, terms: Iterable[str], doc_key: Optional[str] = None) -> bool:
+        """
+        색인에 문서 1건 반영 (DocumentFrequencyIndex.add_document 참고)
+
+        Returns:
+            bool: 반영 여부 (색인을 로드하지 못했으면 False)
+        """
+        if self.get(scope) is None:
+            return False
+        with self._lock:
+            added = self._indexes[scope].add_document(terms, doc_key)
+            if added:
+                self._dirty.add(scope)
+            return added
+
+    def idf(self, scope: str, terms: List[str]) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        용어별 IDF와 색인 문서 수
+
+        Returns:
+            tuple | None: (IDF 배열, 문서 수), 색인을 로드하지 못했으면 None
+        """
+        if self.get(scope) is None:
+            return None
+        with self._lock:
+            index = self._indexes[scope]
+            return index.idf(terms), index.n_docs
+
+    def save(self, scope: str):
+        """색인 1개의 저장 대기 증가분을 DB에 더함"""
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None or not index.has_pending() or scope in self._saving:
+                self._dirty.discard(scope)
+                return
+            delta = index.pending_delta()
+            self._saving.add(scope)
+
+        try:
+            self.supabase.rpc(self.INCREMENT_RPC, {
+                'p_scope': scope,
+                'p_n_docs': delta['n_docs'],
+                'p_last_doc_key': delta['last_doc_key'],
+                'p_df': delta['df'],
+            }).execute()
+            with self._lock:
+                index.commit_pending(delta)
+                if not index.has_pending():
+                    self._dirty.discard(scope)
+        finally:
+            with self._lock:
+                self._saving.discard(scope)
+
+    def flush(self):
+        """변경된 색인 모두 저장 (일별 배치 종료 시 전체 색인을 한 번만 저장)"""
+        with self._lock:
+            scopes = list(self._dirty)
+        for scope in scopes:
+            self.save(scope)
+
+
+class KeywordExtractor:
+    """Kiwi 형태소 + 누적 df 기반 TF-IDF 키워드 추출기"""
+
+    # 키워드 후보 품사: 일반/고유 명사, 어근, 외국어 / 동사, 형용사 (불규칙 활용 태그 포함)
+    NOUN_TAGS = ('NNG', 'NNP', 'XR', 'SL')
+    PREDICATE_TAGS = ('VV', 'VA')
+
+    STOPWORDS = frozenset({
+        '하다', '있다', '없다', '되다', '같다', '보다', '주다', '이다', '아니다', '그렇다', '이렇다',
+        '오늘', '내일', '어제', '지금', '진짜', '정말', '그냥', '우리', '사람', '생각', '다음',
+        '이거', '그거', '저거', '시간', '정도', '하나',
+    })
+
+    # 커플 색인 문서 수가 이 값일 때 커플 IDF와 전체 IDF를 반반 반영
+    COUPLE_IDF_PRIOR_DOCS = 7
+
+    def __init__(self, store: KeywordIndexStore):
+        self.store = store
+        self.tokenizer = get_tokenizer_service()
+
+    def terms(self, texts: List[str], tagged: Optional[TaggedTexts] = None) -> List[str]:
+        """
+        텍스트들에서 키워드 후보 용어 추출
+
+        명사는 2글자 이상만, 동사/형용사는 어간 + '다' 형태로 정규화합니다.
+
+        Args:
+            texts: 메시지 텍스트들
+            tagged: 이미 분석한 (form, tag) 결과 (있으면 형태소 분석 생략)
+        """
+        if tagged is None:
+            tagged = self.tokenizer.tokenize_tagged(texts)
+
+        terms = []
+        for tokens in tagged:
+            for form, tag in tokens:
+                if tag.startswith(self.PREDICATE_TAGS):
+                    term = form + '다'
+                elif tag.startswith(self.NOUN_TAGS) and len(form) >= 2:
+                    term = form.lower() if tag == 'SL' else form
+                else:
+                    continue
+                if term not in self.STOPWORDS:
+                    terms.append(term)
+        return terms
+
+    def document_vector(self, texts: List[str], tagged: Optional[TaggedTexts] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        문서의 희소 용어 빈도 벡터
+
+        Returns:
+            tuple: (용어 리스트, 같은 순서의 빈도 배열)
+        """
+        counts = Counter(self.terms(texts, tagged))
+        return list(counts), np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+
+    def extract(
+        self,
+        texts: List[str],
+        couple_id: Optional[str] = None,
+        top_k: Optional[int] = None,
+        tagged: Optional[TaggedTexts] = None,
+    ) -> List[str]:
+        """
+        누적 df 기준 TF-IDF 상위 키워드 (색인은 변경하지 않음)
+
+        Args:
+            texts: 문서를 이루는 메시지 텍스트들
+            couple_id: 커플 ID (있으면 커플 색인도 반영)
+            top_k: 반환할 키워드 수 (기본값: keyword_top_k)
+            tagged: 이미 분석한 (form, tag) 결과 (TextRank와 공유)
+
+        Returns:
+            List[str]: 점수 순 키워드
+        """
+        terms, counts = self.document_vector(texts, tagged)
+        return self._top_keywords(terms, counts, couple_id, top_k)
+
+    def extract_and_update(
+        self,
+        couple_id: str,
+        doc_key: str,
+        texts: List[str],
+        top_k: Optional[int] = None,
+        tagged: Optional[TaggedTexts] = None,
+    ) -> List[str]:
+        """
+        하루 문서를 커플 / 전체 색인에 더한 뒤 키워드 추출 (일별 배치용)
+
+        커플 색인은 바로 저장하고, 전체 색인은 flush() 때 한 번에 저장합니다.
+
+        Args:
+            couple_id: 커플 ID
+            doc_key: 문서 키 (분석 날짜, 'YYYY-MM-DD')
+            texts: 그 날 메시지 텍스트들
+            top_k: 반환할 키워드 수
+            tagged: 이미 분석한 (form, tag) 결과 (TextRank와 공유)
+
+        Returns:
+            List[str]: 점수 순 키워드
+        """
+        terms, counts = self.document_vector(texts, tagged)
+
+        # 이미 반영한 날짜(재실행)거나 색인을 로드하지 못했으면 두 색인 모두 그대로 둠
+        if self.store.get(GLOBAL_SCOPE) is not None and self.store.add_document(couple_id, terms, doc_key):
+            self.store.add_document(GLOBAL_SCOPE, terms)
+            self.store.save(couple_id)
+
+        return self._top_keywords(terms, counts, couple_id, top_k)
+
+    def flush(self):
+        """변경된 색인 저장"""
+        self.store.flush()
+
+    def _top_keywords(
+        self,
+        terms: List[str],
+        counts: np.ndarray,
+        couple_id: Optional[str],
+        top_k: Optional[int],
+    ) -> List[str]:
+        if not terms:
+            return []
+        top_k = top_k or get_settings().keyword_top_k
+
+        # 커플 IDF(우리 대화에서 드문 말)와 전체 IDF를 커플 문서 수에 따라 가중 평균
+        # (색인을 로드하지 못했으면 df 0 기준 IDF, 즉 TF 순위)
+        global_idf = self.store.idf(GLOBAL_SCOPE, terms)
+        idf = global_idf[0] if global_idf is not None else DocumentFrequencyIndex().idf(terms)
+        couple_idf = self.store.idf(couple_id, terms) if couple_id else None
+        if couple_idf is not None:
+            couple_values, couple_docs = couple_idf
+            weight = couple_docs / (couple_docs + self.COUPLE_IDF_PRIOR_DOCS)
+            idf = weight * couple_values + (1 - weight) * idf
+
+        # 로그 스케일 TF (한 단어 반복 도배 완화)
+        scores = (1 + np.log(counts)) * idf
+
+        # 점수 내림차순, 동점이면 빈도 내림차순
+        order = np.lexsort((-counts, -scores))[:top_k]
+        return [terms[i] for i in order]
+
+
+# 싱글톤 인스턴스
+_extractor_instance = None
+
+
+def get_keyword_extractor() -> KeywordExtractor:
+    """Keyword Extractor 싱글톤 인스턴스 반환"""
+    global _extractor_instance
+    if _extractor_instance is None:
+        _extractor_instance = KeywordExtractor(KeywordIndexStore())
+    return _extractor_instance
@@ -0,0 +1,267 @@
+"""
+Lexicon Emotion Analyzer
+
+한국어 감정 어휘 사전 + 이모티콘 + 카카오톡 특수 토큰(ㅋㅋ, ㅠㅠ, ㅡㅡ)으로
+LLM 호출 없이 7가지 감정 점수를 계산하는 로컬 분석기
+
+- Kiwi 형태소 기반 어휘 매칭
+- 카카오톡 토큰/이모지는 정규식으로 원문에서 직접 추출
+- 배치 전체를 (매칭 수 × 7) 가중치 행렬로 한 번에 합산 (NumPy)
+
+HybridEmotionAnalyzer는 로컬 신뢰도가 임계값보다 낮은 메시지만 LLM으로 보냅니다.
+"""
+import asyncio
+import logging
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..models.schemas import EmotionScore
+from .emotion_analyzer import BaseEmotionAnalyzer
+from .tokenizer_service import TokenizerService, get_tokenizer_service
+
+logger = logging.getLogger(__name__)
+
+# 하이브리드 라우팅 누적 통계 (local: 로컬 처리, remote: LLM 호출, fallback: LLM 실패 시 로컬 대체)
+routing_stats: Counter = Counter()
+
+
+class LexiconEmotionAnalyzer(BaseEmotionAnalyzer):
+    """
+    어휘 사전 기반 로컬 감정 분석기
+
+    confidence는 지배적 감정 비율에 근거량(매칭된 가중치 합)을 반영한 값입니다.
+    매칭되는 단서가 없으면 중립이지만 confidence는 0에 가깝습니다.
+    """
+
+    provider = "local"
+    model_name = "lexicon-v1"
+
+    # 형태소(form) → 감정별 가중치
+    LEXICON: Dict[str, Dict[str, float]] = {
+        # 기쁨
+        '좋': {'기쁨': 1.0}, '행복': {'기쁨': 1.2}, '기쁘': {'기쁨': 1.2}, '신나': {'기쁨': 1.0},
+        '재밌': {'기쁨': 1.0}, '재미있': {'기쁨': 1.0}, '웃기': {'기쁨': 0.8}, '즐겁': {'기쁨': 1.0},
+        '최고': {'기쁨': 1.0}, '대박': {'기쁨': 0.8}, '축하': {'기쁨': 1.0}, '다행': {'기쁨': 0.8},
+        '설레': {'기쁨': 0.6, '사랑': 0.6}, '고맙': {'기쁨': 0.8, '사랑': 0.3}, '감사': {'기쁨': 0.8},
+        # 슬픔
+        '슬프': {'슬픔': 1.2}, '우울': {'슬픔': 1.2}, '외롭': {'슬픔': 1.0}, '서운': {'슬픔': 1.0, '화남': 0.3},
+        '속상': {'슬픔': 1.0, '화남': 0.3}, '눈물': {'슬픔': 1.0}, '울': {'슬픔': 0.8}, '그립': {'슬픔': 0.6, '사랑': 0.4},
+        '아쉽': {'슬픔': 0.8}, '섭섭': {'슬픔': 1.0}, '허전': {'슬픔': 0.8},
+        # 화남
+        '화나': {'화남': 1.2}, '화': {'화남': 1.0}, '짜증': {'화남': 1.2}, '열받': {'화남': 1.2},
+        '빡치': {'화남': 1.4}, '싫': {'화남': 0.8}, '어이없': {'화남': 1.0}, '답답': {'화남': 0.8, '불안': 0.3},
+        # 불안
+        '걱정': {'불안': 1.2}, '불안': {'불안': 1.2}, '무섭': {'불안': 1.0}, '떨리': {'불안': 0.8},
+        '긴장': {'불안': 1.0}, '두렵': {'불안': 1.0}, '초조': {'불안': 1.0}, '어떡하': {'불안': 0.8},
+        # 사랑
+        '사랑': {'사랑': 1.4}, '좋아하': {'사랑': 1.0}, '귀엽': {'사랑': 0.8}, '예쁘': {'사랑': 0.8},
+        '이쁘': {'사랑': 0.8}, '뽀뽀': {'사랑': 1.2}, '자기': {'사랑': 0.5},
+        # 피곤
+        '피곤': {'피곤': 1.2}, '졸리': {'피곤': 1.0}, '힘들': {'피곤': 1.0, '슬픔': 0.2}, '지치': {'피곤': 1.2},
+        '잠': {'피곤': 0.6}, '녹초': {'피곤': 1.2}, '야근': {'피곤': 0.8},
+        # 중립 (일상적 응답)
+        '응': {'중립': 1.0}, '네': {'중립': 1.0}, '그래': {'중립': 0.8}, '알': {'중립': 0.4}, '오키': {'중립': 0.8},
+    }
+
+    # 원문 정규식 단서 (카카오톡 토큰, 이모티콘, 이모지)
+    PATTERNS: List[Tuple[str, Dict[str, float]]] = [
+        (r'[ㅋ]{2,}', {'기쁨': 1.5}),
+        (r'[ㅎ]{2,}', {'기쁨': 1.0}),
+        (r'[ㅠㅜ]{2,}', {'슬픔': 1.5}),
+        (r'ㅡㅡ|-_-|;;', {'화남': 1.2}),
+        (r'[♥♡❤💕💖😘🥰😍]', {'사랑': 1.2}),
+        (r'[😂🤣😆😄😁😊]', {'기쁨': 1.2}),
+        (r'[😢😭😞]', {'슬픔': 1.2}),
+        (r'[😡🤬😠]', {'화남': 1.4}),
+        (r'[😰😨😱]', {'불안': 1.2}),
+        (r'[😴🥱]', {'피곤': 1.2}),
+        (r'보고\s*싶', {'사랑': 1.2}),
+        (r'잘\s*자', {'사랑': 0.6, '피곤': 0.6}),
+        (r'^(ㅇㅇ|ㅇㅋ|ok|오케이)$', {'중립': 1.5}),
+    ]
+
+    # 단서가 없을 때 중립으로 기울이는 사전 확률 가중치
+    NEUTRAL_PRIOR = 0.2
+
+    # 근거량 → 신뢰도 포화 스케일
+    EVIDENCE_SCALE = 1.0
+
+    # 이 개수를 넘는 배치는 형태소 분석 / 채점을 스레드에서 실행 (이벤트 루프를 막지 않음)
+    THREAD_MIN_TEXTS = 8
+
+    def __init__(self, tokenizer: Optional[TokenizerService] = None):
+        self._emotion_index = {emotion: i for i, emotion in enumerate(self.EMOTIONS)}
+
+        # 어휘 가중치 행렬 (V × 7)
+        lexicon_items = list(self.LEXICON.items())
+        self._term_ids = {form: i for i, (form, _) in enumerate(lexicon_items)}
+        self._term_weights = self._build_weight_matrix([w for _, w in lexicon_items])
+
+        # 정규식 가중치 행렬 (P × 7)
+        self._patterns = [re.compile(pattern) for pattern, _ in self.PATTERNS]
+        self._pattern_weights = self._build_weight_matrix([w for _, w in self.PATTERNS])
+
+        self._prior = np.zeros(len(self.EMOTIONS), dtype=np.float64)
+        self._prior[self._emotion_index['중립']] = self.NEUTRAL_PRIOR
+
+        self.tokenizer = tokenizer or get_tokenizer_service()
+
+    def _build_weight_matrix(self, weights_list: List[Dict[str, float]]) -> np.ndarray:
+        matrix = np.zeros((len(weights_list), len(self.EMOTIONS)), dtype=np.float64)
+        for row, weights in enumerate(weights_list):
+            for emotion, weight in weights.items():
+                matrix[row, self._emotion_index[emotion]] = weight
+        return matrix
+
+    def _tokenize_forms(self, texts: List[str]) -> List[List[str]]:
+        """텍스트 리스트를 형태소 form 리스트로 변환 (Kiwi 없으면 공백 분리)"""
+        return self.tokenizer.tokenize_forms(texts)
+
+    def score_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트 배치의 원시 감정 근거 행렬 계산
+
+        Args:
+            texts: 분석할 텍스트 리스트
+
+        Returns:
+            np.ndarray: (N × 7) 감정별 가중치 합
+        """
+        raw = np.zeros((len(texts), len(self.EMOTIONS)), dtype=np.float64)
+        if not texts:
+            return raw
+
+        # 1. 형태소 매칭: (문장 번호, 어휘 번호) 쌍을 모아 한 번에 합산
+        rows, term_ids = [], []
+        for row, forms in enumerate(self._tokenize_forms(texts)):
+            for form in forms:
+                term_id = self._term_ids.get(form)
+                if term_id is not None:
+                    rows.append(row)
+                    term_ids.append(term_id)
+
+        if rows:
+            np.add.at(raw, np.asarray(rows), self._term_weights[np.asarray(term_ids)])
+
+        # 2. 정규식 단서: (N × P) 매칭 횟수 행렬 @ (P × 7)
+        pattern_counts = np.array(
+            [[len(pattern.findall(text.strip())) for pattern in self._patterns] for text in texts],
+            dtype=np.float64
+        )
+        raw += pattern_counts @ self._pattern_weights
+
+        return raw
+
+    def _to_emotion_scores(self, raw: np.ndarray) -> List[EmotionScore]:
+        evidence = raw.sum(axis=1)
+        probs = (raw + self._prior) / (evidence + self.NEUTRAL_PRIOR)[:, None]
+        coverage = 1.0 - np.exp(-evidence / self.EVIDENCE_SCALE)
+
+        dominant = probs.argmax(axis=1)
+        confidence = probs[np.arange(len(probs)), dominant] * coverage
+
+        results = []
+        for i in range(len(probs)):
+            results.append(EmotionScore(
+                emotion=self.EMOTIONS[dominant[i]],
+                confidence=round(float(confidence[i]), 4),
+                all_scores={
+                    emotion: round(float(probs[i, j]), 4)
+                    for j, emotion in enumerate(self.EMOTIONS)
+                }
+            ))
+        return results
+
+    async def analyze_emotion(self, text: str) -> EmotionScore:
+        """단일 텍스트 로컬 감정 분석"""
+        return self._to_emotion_scores(self.score_texts([text]))[0]
+
+    async def analyze_emotions_batch(self, texts: list[str]) -> list[EmotionScore]:
+        """
+        배치 로컬 감정 분석 (한 번의 행렬 연산)
+
+        Kiwi 형태소 분석은 동기 호출이므로 THREAD_MIN_TEXTS개를 넘는 배치는 스레드에서 실행합니다.
+        (짧은 배치는 스레드 전환 비용이 더 큼)
+        """
+        if len(texts) > self.THREAD_MIN_TEXTS:
+            raw = await asyncio.to_thread(self.score_texts, texts)
+        else:
+            raw = self.score_texts(texts)
+        return self._to_emotion_scores(raw)
+
+
+class HybridEmotionAnalyzer(BaseEmotionAnalyzer):
+    """
+    로컬 분석 우선 + 저신뢰 메시지만 LLM으로 보내는 라우팅 분석기
+
+    LLM 호출이 실패하면 로컬 결과를 그대로 사용합니다 (제공자 장애 시에도 분석 지속).
+    """
+
+    def __init__(
+        self,
+        local: LexiconEmotionAnalyzer,
+        remote: BaseEmotionAnalyzer,
+        threshold: float,
+    ):
+        self.local = local
+        self.remote = remote
+        self.threshold = threshold
+        self.provider = remote.provider
+        self.model_name = remote.model_name
+
+    async def analyze_emotion(self, text: str) -> EmotionScore:
+        return (await self.analyze_emotions_batch([text]))[0]
+
+    async def analyze_emotions_batch(self, texts: list[str]) -> list[EmotionScore]:
+        results = await self.local.analyze_emotions_batch(texts)
+
+        uncertain = [i for i, score in enumerate(results) if score.confidence < self.threshold]
+        routing_stats['local'] += len(texts) - len(uncertain)
+        if not uncertain:
+            return results
+
+        try:
+            remote_results = await self.remote.analyze_emotions_batch([texts[i] for i in uncertain])
+        except Exception as e:
+            routing_stats['fallback'] += len(uncertain)
+            logger.warning(f"LLM emotion analysis failed, using lexicon results for {len(uncertain)} messages: {e}")
+            return results
+
+        routing_stats['remote'] += len(uncertain)
+        for i, score in zip(uncertain, remote_results):
+            results[i] = score
+
+        return results
+
+    async def analyze_conversation_emotions(
+        self,
+        messages: list[dict],
+        targets: list[int] | None = None,
+    ) -> list[EmotionScore]:
+        if targets is None:
+            targets = list(range(len(messages)))
+        results = await self.local.analyze_emotions_batch([messages[i]['content'] for i in targets])
+
+        uncertain = [n for n, score in enumerate(results) if score.confidence < self.threshold]
+        routing_stats['local'] += len(targets) - len(uncertain)
+        if not uncertain:
+            return results
+
+        # 저신뢰 메시지만 대상으로, 나머지는 맥락으로 LLM에 전달
+        try:
+            remote_results = await self.remote.analyze_conversation_emotions(
+                messages, [targets[n] for n in uncertain]
+            )
+        except Exception as e:
+            routing_stats['fallback'] += len(uncertain)
+            logger.warning(f"LLM emotion analysis failed, using lexicon results for {len(uncertain)} messages: {e}")
+            return results
+
+        routing_stats['remote'] += len(uncertain)
+        for n, score in zip(uncertain, remote_results):
+            results[n] = score
+
+        return results
@@ -0,0 +1,268 @@
+"""
+LSM Accumulator
+
+커플별 · 발신자별 · 날짜별 기능어 개수를 저장해 두고, 새 메시지만 형태소 분석해 더합니다.
+일/주/임의 기간의 LSM 점수는 저장된 개수를 합산해 계산하므로 과거 메시지를 다시 분석하지 않습니다.
+
+LSM은 카테고리별 비율만 사용하므로 (합친 텍스트의 개수 = 메시지별 개수의 합)
+기간 상태는 더하기(merge) / 빼기(subtract)로 조합할 수 있습니다.
+
+저장 테이블: lsm_daily_counts (supabase/migrations/20251120000001_lsm_daily_counts.sql)
+"""
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..core.supabase import get_supabase_client
+from ..models.schemas import LSMScore
+from .lsm_analyzer import LSMAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+class LSMAccumulator:
+    """발신자별 기능어 개수 벡터 (CATEGORIES 순서) + 메시지 수"""
+
+    def __init__(
+        self,
+        counts: Optional[Dict[str, np.ndarray]] = None,
+        message_counts: Optional[Dict[str, int]] = None,
+    ):
+        self.counts: Dict[str, np.ndarray] = counts or {}
+        self.message_counts: Dict[str, int] = message_counts or {}
+
+    @classmethod
+    def from_messages(cls, messages: List[dict], analyzer: LSMAnalyzer) -> 'LSMAccumulator':
+        """
+        메시지들의 기능어 개수 집계 (형태소 분석은 한 번의 배치 호출)
+
+        Args:
+            messages: [{sender_id, content}, ...] 형태의 메시지 리스트
+            analyzer: 기능어 사전 / 토크나이저를 가진 LSMAnalyzer
+
+        Returns:
+            LSMAccumulator: 발신자별 개수 상태
+        """
+        if not messages:
+            return cls()
+
+        senders = list(dict.fromkeys(msg['sender_id'] for msg in messages))
+        sender_index = {sender: i for i, sender in enumerate(senders)}
+        rows = np.fromiter((sender_index[msg['sender_id']] for msg in messages), dtype=np.int64)
+
+        vectors = analyzer.function_word_vectors([msg['content'] for msg in messages])
+        totals = np.zeros((len(senders), vectors.shape[1]), dtype=np.int64)
+        np.add.at(totals, rows, vectors)
+
+        return cls(
+            counts={sender: totals[i] for i, sender in enumerate(senders)},
+            message_counts=dict(zip(senders, np.bincount(rows, minlength=len(senders)).tolist())),
+        )
+
+    def merge(self, other: 'LSMAccumulator') -> 'LSMAccumulator':
+        """두 기간의 상태를 합친 새 누적기"""
+        counts = {sender: vector.copy() for sender, vector in self.counts.items()}
+        message_counts = dict(self.message_counts)
+
+        for sender, vector in other.counts.items():
+            counts[sender] = counts[sender] + vector if sender in counts else vector.copy()
+            message_counts[sender] = message_counts.get(sender, 0) + other.message_counts.get(sender, 0)
+
+        return LSMAccumulator(counts, message_counts)
+
+    def subtract(self, other: 'LSMAccumulator') -> 'LSMAccumulator':
+        """
+        other 기간을 뺀 새 누적기 (예: 최근 30일 - 최근 7일)
+
+        Raises:
+            ValueError: other가 이 기간에 포함되지 않아 개수가 음수가 되는 경우
+        """
+        counts = {sender: vector.copy() for sender, vector in self.counts.items()}
+        message_counts = dict(self.message_counts)
+
+        for sender, vector in other.counts.items():
+            remaining = counts.get(sender, np.zeros_like(vector)) - vector
+            remaining_messages = message_counts.get(sender, 0) - other.message_counts.get(sender, 0)
+            if (remaining < 0).any() or remaining_messages < 0:
+                raise ValueError(f"Cannot subtract LSM counts not contained in this window (sender={sender})")
+
+            if remaining_messages == 0:
+                counts.pop(sender, None)
+                message_counts.pop(sender, None)
+            else:
+                counts[sender] = remaining
+                message_counts[sender] = remaining_messages
+
+        return LSMAccumulator(counts, message_counts)
+
+    __add__ = merge
+    __sub__ = subtract
+
+    def score(self, analyzer: LSMAnalyzer) -> LSMScore:
+        """
+        누적된 개수로 LSM 점수 계산 (LSMAnalyzer.analyze_conversation과 같은 규칙)
+
+        Returns:
+            LSMScore: 2명이면 두 사람의 점수, 3명 이상이면 쌍별 평균, 1명 이하면 기본값(0.5)
+        """
+        senders = list(self.counts)
+        if not senders:
+            return analyzer.score_from_matrix([], np.zeros((0, len(analyzer.CATEGORIES)), dtype=np.int64))
+
+        return analyzer.score_from_matrix(senders, np.stack([self.counts[sender] for sender in senders]))
+
+    @staticmethod
+    def vector_to_dict(vector: np.ndarray) -> Dict[str, int]:
+        """개수 벡터 → {카테고리: 개수} (저장용, 카테고리 순서 변경에 안전)"""
+        return {category: int(count) for category, count in zip(LSMAnalyzer.CATEGORIES, vector)}
+
+    @staticmethod
+    def vector_from_dict(category_counts: Dict[str, int]) -> np.ndarray:
+        """{카테고리: 개수} → 개수 벡터 (없는 카테고리는 0)"""
+        return np.array(
+            [int(category_counts.get(category, 0)) for category in LSMAnalyzer.CATEGORIES],
+            dtype=np.int64,
+        )
+
+
+class LSMCountStore:
+    """lsm_daily_counts 테이블 기반 누적기 저장소"""
+
+    TABLE = 'lsm_daily_counts'
+
+    def __init__(self, analyzer: Optional[LSMAnalyzer] = None):
+        self.supabase = get_supabase_client()
+        self.analyzer = analyzer or LSMAnalyzer()
+
+    def update(self, couple_id: str, messages: List[dict]) -> int:
+        """
+        아직 집계되지 않은 메시지만 형태소 분석해 날짜별 개수에 더함
+
+        (발신자, 날짜)별로 집계에 반영한 메시지 ID(counted_message_ids)를 저장해
+        같은 날 배치를 다시 돌리거나 같은 시각의 메시지 / 늦게 도착한 메시지가 있어도
+        메시지마다 정확히 한 번 집계됩니다.
+
+        Args:
+            couple_id: 커플 ID
+            messages: [{id, sender_id, content, created_at}, ...] 형태의 메시지 리스트
+
+        Returns:
+            int: 새로 집계한 메시지 수
+        """
+        groups: Dict[tuple, List[dict]] = defaultdict(list)
+        for msg in messages:
+            if msg.get('content'):
+                created_at = _parse_timestamp(msg['created_at'])
+                groups[(msg['sender_id'], created_at.date().isoformat())].append(msg)
+
+        if not groups:
+            return 0
+
+        days = sorted({day for _, day in groups})
+        response = self.supabase.table(self.TABLE)\
+            .select('*')\
+            .eq('couple_id', couple_id)\
+            .in_('count_date', days)\
+            .execute()
+        existing = {(row['sender_id'], row['count_date']): row for row in response.data}
+
+        # 아직 집계되지 않은 메시지만 선택
+        new_groups: Dict[tuple, List[dict]] = {}
+        for key, group in groups.items():
+            row = existing.get(key)
+            counted = set(row.get('counted_message_ids') or []) if row else set()
+            fresh = [msg for msg in group if str(msg['id']) not in counted]
+            if fresh:
+                new_groups[key] = fresh
+
+        if not new_groups:
+            return 0
+
+        # 새 메시지 전체를 한 번에 형태소 분석
+        keys = list(new_groups)
+        fresh_messages = [msg for key in keys for msg in new_groups[key]]
+        vectors = self.analyzer.function_word_vectors([msg['content'] for msg in fresh_messages])
+
+        rows = []
+        offset = 0
+        for key in keys:
+            group = new_groups[key]
+            added = vectors[offset:offset + len(group)].sum(axis=0)
+            offset += len(group)
+
+            row = existing.get(key) or {}
+            previous = LSMAccumulator.vector_from_dict(row['category_counts']) if row else 0
+            timestamps = [_parse_timestamp(msg['created_at']) for msg in group]
+            if row.get('last_message_at'):
+                timestamps.append(_parse_timestamp(row['last_message_at']))
+            sender_id, day = key
+
+            rows.append({
+                'couple_id': couple_id,
+                'sender_id': sender_id,
+                'count_date': day,
+                'category_counts': LSMAccumulator.vector_to_dict(previous + added),
+                'message_count': row.get('message_count', 0) + len(group),
+                'counted_message_ids': (row.get('counted_message_ids') or []) + [str(msg['id']) for msg in group],
+                'last_message_at': max(timestamps).isoformat(),
+            })
+
+        self.supabase.table(self.TABLE)\
+            .upsert(rows, on_conflict='couple_id,sender_id,count_date')\
+            .execute()
+
+        logger.info(f"📈 LSM counts updated for couple {couple_id}: {len(fresh_messages)} new messages")
+        return len(fresh_messages)
+
+    def load(self, couple_id: str, start_date: date, end_date: date) -> LSMAccumulator:
+        """
+        기간(양 끝 포함)의 저장된 개수를 합산
+
+        Args:
+            couple_id: 커플 ID
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+
+        Returns:
+            LSMAccumulator: 기간 전체의 발신자별 개수 상태
+        """
+        response = self.supabase.table(self.TABLE)\
+            .select('sender_id, category_counts, message_count')\
+            .eq('couple_id', couple_id)\
+            .gte('count_date', str(start_date))\
+            .lte('count_date', str(end_date))\
+            .execute()
+
+        accumulator = LSMAccumulator()
+        for row in response.data:
+            accumulator = accumulator.merge(LSMAccumulator(
+                counts={row['sender_id']: LSMAccumulator.vector_from_dict(row['category_counts'])},
+                message_counts={row['sender_id']: row['message_count']},
+            ))
+        return accumulator
+
+    def score(self, couple_id: str, start_date: date, end_date: date) -> LSMScore:
+        """기간 LSM 점수 (형태소 분석 없이 저장된 개수만 사용)"""
+        return self.load(couple_id, start_date, end_date).score(self.analyzer)
+
+
+def _parse_timestamp(value) -> datetime:
+    """Supabase 타임스탬프 문자열 / datetime → datetime"""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+
+
+# 싱글톤 인스턴스
+_store_instance = None
+
+
+def get_lsm_count_store() -> LSMCountStore:
+    """LSM Count Store 싱글톤 인스턴스 반환"""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = LSMCountStore()
+    return _store_instance
@@ -3,7 +3,13 @@ Language Style Matching (LSM) Analyzer
 Based on Ireland & Pennebaker (2010) research
 """
 from collections import defaultdict
-from ..models.schemas import LSMScore
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from ..models.schemas import LSMScore, PairwiseLSM, RollingLSMSeries
+from .tokenizer_service import TokenizerService, get_tokenizer_service
 
 class LSMAnalyzer:
     """
@@ -23,14 +29,21 @@ class LSMAnalyzer:
         'negations': ['안', '못', '없다', '아니', '말다'],
     }
 
-    def __init__(self):
-        """Initialize Kiwi morphological analyzer"""
-        try:
-            from kiwipiepy import Kiwi
-            self.kiwi = Kiwi()
-        except ImportError:
-            print("⚠️ kiwipiepy not installed. LSM analysis will be disabled.")
-            self.kiwi = None
+    CATEGORIES = list(FUNCTION_WORDS.keys())
+
+    # 기능어 → 카테고리 인덱스 역색인 ('저', '없다'처럼 여러 카테고리에 속하는 단어 포함)
+    WORD_CATEGORIES: dict[str, tuple[int, ...]] = {}
+    for _index, _category in enumerate(CATEGORIES):
+        for _word in dict.fromkeys(FUNCTION_WORDS[_category]):
+            WORD_CATEGORIES[_word] = WORD_CATEGORIES.get(_word, ()) + (_index,)
+    del _index, _category, _word
+
+    def __init__(self, tokenizer: Optional[TokenizerService] = None):
+        """
+        Args:
+            tokenizer: 형태소 분석기 (기본값: 공유 Kiwi 서비스, 요청마다 모델을 다시 로드하지 않음)
+        """
+        self.tokenizer = tokenizer or get_tokenizer_service()
 
     def extract_function_words(self, text: str) -> dict[str, int]:
         """
@@ -42,16 +55,26 @@ class LSMAnalyzer:
         Returns:
             dict: 카테고리별 기능어 개수
         """
-        tokens = self.kiwi.tokenize(text)
-        function_word_counts = {category: 0 for category in self.FUNCTION_WORDS}
+        counts = self.function_word_vectors([text])[0]
+        return {category: int(count) for category, count in zip(self.CATEGORIES, counts)}
 
-        for token in tokens:
-            word = token.form
-            for category, words in self.FUNCTION_WORDS.items():
-                if word in words:
-                    function_word_counts[category] += 1
+    def function_word_vectors(self, texts: list[str]) -> np.ndarray:
+        """
+        텍스트별 카테고리 기능어 개수 행렬 (형태소 분석은 한 번의 배치 호출)
 
-        return function_word_counts
+        Args:
+            texts: 분석할 텍스트 리스트
+
+        Returns:
+            np.ndarray: (len(texts), len(CATEGORIES)) int64 개수 행렬
+        """
+        counts = np.zeros((len(texts), len(self.CATEGORIES)), dtype=np.int64)
+        for row, forms in enumerate(self.tokenizer.tokenize_forms(texts)):
+            indices = [index for form in forms for index in self.WORD_CATEGORIES.get(form, ())]
+            counts[row] = np.bincount(
+                np.asarray(indices, dtype=np.int64), minlength=len(self.CATEGORIES)
+            )
+        return counts
 
     def calculate_lsm_score(self, text_a: str, text_b: str) -> LSMScore:
         """
@@ -64,33 +87,113 @@ class LSMAnalyzer:
         Returns:
             LSMScore: LSM 점수 및 카테고리별 분석
         """
-        # 기능어 추출
-        counts_a = self.extract_function_words(text_a)
-        counts_b = self.extract_function_words(text_b)
-
-        # 총 단어 수
-        total_a = sum(counts_a.values()) or 1
-        total_b = sum(counts_b.values()) or 1
+        counts_a, counts_b = self.function_word_vectors([text_a, text_b])
+        return self.score_from_vectors(counts_a, counts_b)
 
-        # 비율 계산
-        ratios_a = {k: v / total_a for k, v in counts_a.items()}
-        ratios_b = {k: v / total_b for k, v in counts_b.items()}
+    def score_from_vectors(self, counts_a: np.ndarray, counts_b: np.ndarray) -> LSMScore:
+        """
+        카테고리별 기능어 개수 벡터 두 개로 LSM 점수 계산
 
-        # 카테고리별 유사도 계산
-        category_scores = {}
-        for category in self.FUNCTION_WORDS.keys():
-            diff = abs(ratios_a[category] - ratios_b[category])
-            similarity = 1 - diff  # 차이가 적을수록 높은 점수
-            category_scores[category] = max(0, min(1, similarity))
+        Args:
+            counts_a: 첫 번째 사람의 기능어 개수 벡터
+            counts_b: 두 번째 사람의 기능어 개수 벡터
 
-        # 전체 LSM 점수 (카테고리 평균)
-        lsm_score = sum(category_scores.values()) / len(category_scores)
+        Returns:
+            LSMScore: LSM 점수 및 카테고리별 분석
+        """
+        similarities = self._category_similarities(counts_a, counts_b)
 
         return LSMScore(
-            lsm_score=lsm_score,
-            category_breakdown=category_scores
+            lsm_score=float(similarities.mean()),
+            category_breakdown={
+                category: float(score) for category, score in zip(self.CATEGORIES, similarities)
+            }
+        )
+
+    @staticmethod
+    def _category_similarities(counts_a: np.ndarray, counts_b: np.ndarray) -> np.ndarray:
+        """
+        카테고리별 유사도 (마지막 축이 카테고리, 행 단위로 벡터화)
+
+        Returns:
+            np.ndarray: counts와 같은 모양의 0~1 유사도
+        """
+        # 비율 계산 (기능어가 없으면 분모 1)
+        ratios_a = counts_a / np.maximum(counts_a.sum(axis=-1, keepdims=True), 1)
+        ratios_b = counts_b / np.maximum(counts_b.sum(axis=-1, keepdims=True), 1)
+
+        # 차이가 적을수록 높은 점수
+        return np.clip(1 - np.abs(ratios_a - ratios_b), 0, 1)
+
+    def rolling_lsm(
+        self,
+        messages: list[dict],
+        window: int = 20,
+        window_seconds: Optional[float] = None,
+    ) -> RollingLSMSeries:
+        """
+        대화 전체의 롤링 LSM 시계열 (rLSM)
+
+        메시지별 기능어 개수의 누적합을 한 번 만들어 두고
+        윈도우 개수 = 누적합[끝] - 누적합[시작]으로 계산하므로 윈도우 크기와 무관하게 O(N)입니다.
+
+        Args:
+            messages: [{sender_id, content, timestamp}, ...] 형태의 메시지 리스트 (시간순)
+            window: 슬라이딩 윈도우 크기 (메시지 수)
+            window_seconds: 지정하면 메시지 수 대신 시간 윈도우 사용 (예: 3600 = 최근 1시간)
+
+        Returns:
+            RollingLSMSeries: 윈도우별 / 턴별 LSM 점수 배열
+        """
+        senders = list(dict.fromkeys(msg['sender_id'] for msg in messages))
+        if len(senders) != 2:
+            # 혼자 대화하는 경우 또는 3명 이상인 경우 - 빈 시계열
+            return RollingLSMSeries(
+                window=0 if window_seconds else window,
+                window_seconds=window_seconds,
+                message_index=[], window_scores=[], turn_index=[], turn_scores=[],
+            )
+
+        vectors = self.function_word_vectors([msg['content'] for msg in messages])
+        is_a = np.fromiter((msg['sender_id'] == senders[0] for msg in messages), dtype=bool, count=len(messages))
+
+        # 발신자별 누적합 (맨 앞에 0행)
+        zeros = np.zeros((1, vectors.shape[1]), dtype=np.int64)
+        cumsum_a = np.concatenate([zeros, np.cumsum(vectors * is_a[:, None], axis=0)])
+        cumsum_b = np.concatenate([zeros, np.cumsum(vectors * ~is_a[:, None], axis=0)])
+
+        ends = np.arange(1, len(messages) + 1)
+        if window_seconds:
+            times = np.array([self._epoch_seconds(msg['timestamp']) for msg in messages])
+            starts = np.searchsorted(times, times - window_seconds, side='left')
+        else:
+            starts = np.maximum(ends - window, 0)
+
+        window_scores = self._category_similarities(
+            cumsum_a[ends] - cumsum_a[starts],
+            cumsum_b[ends] - cumsum_b[starts],
+        ).mean(axis=1)
+
+        # 턴 = 같은 발신자의 연속 메시지 묶음, 각 턴을 직전(상대) 턴과 비교
+        turn_starts = np.flatnonzero(np.concatenate([[True], is_a[1:] != is_a[:-1]]))
+        turn_counts = np.add.reduceat(vectors, turn_starts, axis=0)
+        turn_scores = self._category_similarities(turn_counts[1:], turn_counts[:-1]).mean(axis=1)
+
+        return RollingLSMSeries(
+            window=0 if window_seconds else window,
+            window_seconds=window_seconds,
+            message_index=(ends - 1).tolist(),
+            window_scores=np.round(window_scores, 4).tolist(),
+            turn_index=turn_starts[1:].tolist(),
+            turn_scores=np.round(turn_scores, 4).tolist(),
         )
 
+    @staticmethod
+    def _epoch_seconds(timestamp) -> float:
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return timestamp.timestamp()
+
     def analyze_conversation(self, messages: list[dict]) -> LSMScore:
         """
         대화 전체의 LSM 분석
@@ -101,25 +204,92 @@ class LSMAnalyzer:
         Returns:
             LSMScore: 전체 대화의 평균 LSM 점수
         """
-        # 사용자별로 텍스트 분리
-        user_texts = defaultdict(list)
-        for msg in messages:
-            user_texts[msg['sender_id']].append(msg['content'])
+        senders, counts = self.sender_count_matrix(messages)
+        return self.score_from_matrix(senders, counts)
+
+    def score_from_matrix(self, senders: list, counts: np.ndarray) -> LSMScore:
+        """
+        발신자별 기능어 개수 행렬로 LSM 점수 계산
 
-        # 두 사용자 확인
-        if len(user_texts) != 2:
-            # 혼자 대화하는 경우 또는 3명 이상인 경우 - 기본값 반환
+        Args:
+            senders: 발신자 리스트 (counts 행 순서)
+            counts: (발신자 수, 카테고리 수) 개수 행렬
+
+        Returns:
+            LSMScore: 2명이면 두 사람의 점수, 3명 이상이면 모든 참여자 쌍의 평균 (+ 쌍별 행렬), 1명 이하면 기본값(0.5)
+        """
+        if len(senders) < 2:
+            # 혼자 대화하는 경우 - 기본값 반환
             return LSMScore(
                 lsm_score=0.5,
-                category_breakdown={cat: 0.5 for cat in self.FUNCTION_WORDS.keys()}
+                category_breakdown={cat: 0.5 for cat in self.CATEGORIES}
             )
 
-        # 각 사용자의 전체 텍스트 합치기
-        users = list(user_texts.keys())
-        text_a = ' '.join(user_texts[users[0]])
-        text_b = ' '.join(user_texts[users[1]])
+        if len(senders) == 2:
+            return self.score_from_vectors(counts[0], counts[1])
+
+        # 3명 이상: 모든 참여자 쌍의 평균 + 쌍별 행렬
+        similarities = self.pairwise_similarities(counts)
+        pair_i, pair_j = np.triu_indices(len(senders), k=1)
+        pair_scores = similarities[pair_i, pair_j]  # (쌍 수, 카테고리)
+        category_scores = pair_scores.mean(axis=0)
+
+        return LSMScore(
+            lsm_score=float(category_scores.mean()),
+            category_breakdown={
+                category: float(score) for category, score in zip(self.CATEGORIES, category_scores)
+            },
+            pairwise=PairwiseLSM(
+                participants=[str(sender) for sender in senders],
+                matrix=np.round(similarities.mean(axis=2), 4).tolist(),
+            )
+        )
+
+    def sender_count_matrix(self, messages: list[dict]) -> tuple[list, np.ndarray]:
+        """
+        발신자별 기능어 개수 행렬 (발신자별 텍스트를 합쳐 한 번의 배치로 형태소 분석)
+
+        Args:
+            messages: [{sender_id, content}, ...] 형태의 메시지 리스트
+
+        Returns:
+            tuple: (등장 순서의 발신자 리스트, (발신자 수, 카테고리 수) 개수 행렬)
+        """
+        user_texts = defaultdict(list)
+        for msg in messages:
+            user_texts[msg['sender_id']].append(msg['content'])
+
+        senders = list(user_texts.keys())
+        counts = self.function_word_vectors([' '.join(user_texts[sender]) for sender in senders])
+        return senders, counts
 
-        return self.calculate_lsm_score(text_a, text_b)
+    def pairwise_similarities(self, counts: np.ndarray) -> np.ndarray:
+        """
+        발신자 쌍별 카테고리 유사도 (브로드캐스팅으로 한 번에 계산)
+
+        Args:
+            counts: (발신자 수, 카테고리 수) 개수 행렬
+
+        Returns:
+            np.ndarray: (발신자 수, 발신자 수, 카테고리 수) 유사도, 대각선은 1
+        """
+        return self._category_similarities(counts[:, None, :], counts[None, :, :])
+
+    def pairwise_lsm(self, messages: list[dict]) -> PairwiseLSM:
+        """
+        참여자 수와 관계없이 쌍별 LSM 행렬 계산
+
+        Args:
+            messages: [{sender_id, content}, ...] 형태의 메시지 리스트
+
+        Returns:
+            PairwiseLSM: 참여자 목록과 N×N 점수 행렬
+        """
+        senders, counts = self.sender_count_matrix(messages)
+        return PairwiseLSM(
+            participants=[str(sender) for sender in senders],
+            matrix=np.round(self.pairwise_similarities(counts).mean(axis=2), 4).tolist(),
+        )
 
     def get_lsm_interpretation(self, lsm_score: float) -> str:
         """
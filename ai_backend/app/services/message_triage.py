@@ -0,0 +1,160 @@
+"""
+Message Triage
+
+파싱된 메시지 중 의미 판단이 필요 없는 메시지(미디어 자리표시자, 시스템 문구, URL,
+"ㅇㅇ"/"?" 같은 확인 반응, ㅋㅋ/ㅠㅠ 단독 메시지 등)를 간단한 규칙으로 분류해 결정적인 결과를 돌려주고,
+모델 판단이 필요한 메시지만 LLM으로 보냅니다.
+"""
+import logging
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from ..models.schemas import EmotionScore
+from .emotion_analyzer import BaseEmotionAnalyzer
+from .emotion_cache import count_cache_hits
+
+logger = logging.getLogger(__name__)
+
+# 규칙별로 절약한 LLM 호출 수 (메시지 단위)
+# cache_hit: 트리아지를 통과했지만 결과 캐시에서 처리된 수, analyzed: 실제로 분석기(모델)에 보낸 수
+triage_stats: Counter = Counter()
+
+
+class MessageTriage:
+    """규칙 기반 메시지 분류기 (위에서부터 처음 일치하는 규칙 적용)"""
+
+    # (규칙 이름, 패턴, 결정적 감정)
+    RULES: List[Tuple[str, str, str]] = [
+        ('deleted', r'^(삭제된 메시지입니다\.?|This message has been deleted\.?)$', '중립'),
+        ('media', r'^(사진( \d+장)?|동영상|이모티콘|음성메시지|보이스톡|페이스톡|파일: .+|'
+                  r'Photo|Photos|Video|Emoticon|Voice Note|File: .+)$', '중립'),
+        ('system', r'(님이 들어왔습니다|님이 나갔습니다|님을 초대했습니다|님을 내보냈습니다|'
+                   r'채팅방 관리자가|메시지가 가려졌습니다|^보이스톡 (해요|취소|통화시간)|'
+                   r'^페이스톡 (해요|취소|통화시간)|^통화시간 \d)', '중립'),
+        ('url', r'^(https?://|www\.)\S+$', '중립'),
+        ('laugh', r'^[ㅋㅎ]{2,}[~!.]*$', '기쁨'),
+        ('cry', r'^[ㅠㅜ]{2,}[~!.]*$', '슬픔'),
+        # 감정이 없는 확인 반응 / 문장부호만 있는 메시지 ("ㅇㅇ", "ㄱㄱ", "ㅇㅋ", "?", "...")
+        # 그 밖의 자모("ㅡㅡ", "ㅠ", "ㅗ", "ㅋㅋㅠㅠ")와 ";;"는 감정 표현일 수 있으므로 모델에 맡김
+        ('trivial', r'^(ㅇ+|ㄱㄱ|ㄴㄴ|ㅇㅋ)?[?!.~^,]*$', '중립'),
+    ]
+
+    # 대화 흐름에 따라 의미가 달라지는 반응 규칙 (맥락 분석 시에는 모델에 맡김)
+    CONTEXT_DEPENDENT_RULES = frozenset({'laugh', 'cry', 'trivial'})
+
+    def __init__(self):
+        self._rules = [
+            (name, re.compile(pattern), emotion) for name, pattern, emotion in self.RULES
+        ]
+        self._results: Dict[str, EmotionScore] = {
+            emotion: EmotionScore(
+                emotion=emotion,
+                confidence=1.0,
+                all_scores={e: (1.0 if e == emotion else 0.0) for e in BaseEmotionAnalyzer.EMOTIONS}
+            )
+            for _, _, emotion in self.RULES
+        }
+
+    def classify(self, text: str) -> Optional[str]:
+        """
+        메시지에 해당하는 규칙 이름 반환
+
+        Args:
+            text: 메시지 텍스트
+
+        Returns:
+            Optional[str]: 규칙 이름 (LLM 판단이 필요하면 None)
+        """
+        text = (text or '').strip()
+        if not text:
+            return 'empty'
+
+        for name, pattern, _ in self._rules:
+            if pattern.search(text):
+                return name
+        return None
+
+    def deterministic_result(self, rule: str) -> EmotionScore:
+        """규칙에 해당하는 고정 감정 결과"""
+        for name, _, emotion in self._rules:
+            if name == rule:
+                return self._results[emotion]
+        return self._results['중립']
+
+
+class TriagedEmotionAnalyzer(BaseEmotionAnalyzer):
+    """트리아지를 통과한 메시지만 내부 분석기로 보내는 래퍼"""
+
+    def __init__(self, analyzer: BaseEmotionAnalyzer, triage: MessageTriage):
+        self.analyzer = analyzer
+        self.triage = triage
+        self.provider = analyzer.provider
+        self.model_name = analyzer.model_name
+
+    async def analyze_emotion(self, text: str) -> EmotionScore:
+        return (await self.analyze_emotions_batch([text]))[0]
+
+    async def analyze_emotions_batch(self, texts: list[str]) -> list[EmotionScore]:
+        results: list[EmotionScore | None] = [None] * len(texts)
+        remaining = []
+
+        for i, text in enumerate(texts):
+            rule = self.triage.classify(text)
+            if rule is None:
+                remaining.append(i)
+            else:
+                triage_stats[rule] += 1
+                results[i] = self.triage.deterministic_result(rule)
+
+        if remaining:
+            with count_cache_hits() as hits:
+                scores = await self.analyzer.analyze_emotions_batch([texts[i] for i in remaining])
+            for i, score in zip(remaining, scores):
+                results[i] = score
+            triage_stats['cache_hit'] += hits['hits']
+            triage_stats['analyzed'] += len(remaining) - hits['hits']
+
+        return results
+
+    async def analyze_conversation_emotions(
+        self,
+        messages: list[dict],
+        targets: list[int] | None = None,
+    ) -> list[EmotionScore]:
+        if targets is None:
+            targets = list(range(len(messages)))
+        results: list[EmotionScore | None] = [None] * len(targets)
+        remaining = []
+
+        for n, i in enumerate(targets):
+            rule = self.triage.classify(messages[i]['content'])
+            if rule is None or rule in self.triage.CONTEXT_DEPENDENT_RULES:
+                remaining.append(n)
+            else:
+                triage_stats[rule] += 1
+                results[n] = self.triage.deterministic_result(rule)
+
+        # 맥락 분석은 결과 캐시를 거치지 않음
+        triage_stats['analyzed'] += len(remaining)
+
+        if remaining:
+            scores = await self.analyzer.analyze_conversation_emotions(
+                messages, [targets[n] for n in remaining]
+            )
+            for n, score in zip(remaining, scores):
+                results[n] = score
+
+        return results
+
+
+# 싱글톤 인스턴스
+_triage_instance = None
+
+
+def get_message_triage() -> MessageTriage:
+    """Message Triage 싱글톤 인스턴스 반환"""
+    global _triage_instance
+    if _triage_instance is None:
+        _triage_instance = MessageTriage()
+    return _triage_instance
@@ -6,6 +6,9 @@ import google.generativeai as genai
 from pydantic import BaseModel
 
 from ..core.config import get_settings
+from .provider_executor import get_provider_executor
+from .rate_limiter import estimate_tokens
+from .provider_registry import get_provider_registry
 
 logger = logging.getLogger(__name__)
 
@@ -15,20 +18,25 @@ class NEREntity(BaseModel):
     confidence: float
 
 class NERService:
+    MODEL_NAME = 'gemini-1.5-flash'
+
     def __init__(self):
         settings = get_settings()
-        if settings.gemini_api_key:
-            genai.configure(api_key=settings.gemini_api_key)
-            self.model = genai.GenerativeModel('gemini-1.5-flash')
-        else:
+        self.enabled = bool(settings.gemini_api_key)
+        if not self.enabled:
             logger.warning("GEMINI_API_KEY not set. NER service disabled.")
-            self.model = None
+
+    @property
+    def model(self):
+        """호출한 이벤트 루프의 Gemini 모델 (grpc.aio 채널이 루프에 묶이므로 호출 시점에 조회)"""
+        return get_provider_registry().gemini_model(self.MODEL_NAME) if self.enabled else None
 
     async def extract_entities(self, text: str) -> List[NEREntity]:
         """
         텍스트에서 날짜, 시간, 장소, 활동 정보를 추출합니다.
         """
-        if not self.model:
+        model = self.model
+        if not model:
             return []
 
         prompt = f"""
@@ -49,13 +57,13 @@ class NERService:
         """
 
         try:
-            response = self.model.generate_content(
+            response = await get_provider_executor().run('gemini', lambda: model.generate_content_async(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=0.1,
                     response_mime_type="application/json"
                 )
-            )
+            ), estimated_tokens=estimate_tokens(prompt))
             
             entities_json = json.loads(response.text)
             entities = []
@@ -0,0 +1,199 @@
+"""
+Provider Executor
+
+LLM 제공자 호출에 제공자별 동시 실행 한도와 타임아웃을 적용합니다.
+모든 호출은 각 SDK의 네이티브 async 클라이언트로 이루어지므로 이벤트 루프를 막지 않습니다.
+
+호출 순서: 서킷 브레이커 → 우선순위 대기열 + RPM/TPM 버킷 → 동시성 슬롯 → 타임아웃 → (429/5xx 시) 백오프 재시도
+성공한 호출의 지연 시간(슬롯을 얻은 뒤부터, 대기열 시간 제외)은 제공자별로 기록되어 hedging 지연(p95) 계산에 사용됩니다.
+"""
+import asyncio
+import contextvars
+import logging
+import time
+import weakref
+from collections import deque
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import numpy as np
+
+from ..core.config import get_settings
+from .circuit_breaker import CircuitOpenError, get_circuit_breaker
+from .rate_limiter import ProviderRateLimiter, request_priority, retry_with_backoff
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# 호출이 대기열을 지나 실제로 시작되면 set되는 이벤트 (hedging 타이머 시작 시점, 호출한 task 안에서만 유효)
+call_started: contextvars.ContextVar[Optional[asyncio.Event]] = contextvars.ContextVar(
+    'call_started', default=None
+)
+
+
+class ProviderExecutor:
+    """
+    제공자별 동시성 제한 + 타임아웃 실행기
+
+    asyncio.Semaphore는 생성된 이벤트 루프에 묶이므로 루프별로 따로 만듭니다.
+    (FastAPI 메인 루프와 파일 리스너 스레드의 루프가 공존하기 때문)
+    """
+
+    # 제공자별로 보관하는 최근 성공 호출 지연 시간 수 (p95 계산용)
+    LATENCY_WINDOW = 200
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        default_timeout: float,
+        rate_limiters: Optional[Dict[str, ProviderRateLimiter]] = None,
+        max_retries: int = 0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+    ):
+        self.limits = limits
+        self.default_timeout = default_timeout
+        self.rate_limiters = rate_limiters or {}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._latencies: Dict[str, deque] = {}
+
+    def _record_latency(self, provider: str, seconds: float):
+        self._latencies.setdefault(provider, deque(maxlen=self.LATENCY_WINDOW)).append(seconds)
+
+    def latency_percentile(self, provider: str, q: float, min_samples: int = 20) -> Optional[float]:
+        """
+        최근 성공 호출 지연 시간의 백분위 (초)
+
+        Args:
+            provider: 제공자 이름
+            q: 백분위 (0~100)
+            min_samples: 최소 표본 수 (부족하면 None)
+
+        Returns:
+            Optional[float]: 백분위 지연 시간
+        """
+        samples = self._latencies.get(provider)
+        if not samples or len(samples) < min_samples:
+            return None
+        return float(np.percentile(np.fromiter(samples, dtype=np.float64), q))
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        per_loop = self._semaphores.setdefault(loop, {})
+
+        if provider not in per_loop:
+            per_loop[provider] = asyncio.Semaphore(self.limits.get(provider, 4))
+
+        return per_loop[provider]
+
+    async def run(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        timeout: Optional[float] = None,
+        estimated_tokens: int = 1,
+        latency_key: Optional[str] = None,
+    ) -> T:
+        """
+        제공자 호출 실행
+
+        Args:
+            provider: 제공자 이름 (gemini, openai, anthropic)
+            call: 코루틴을 반환하는 함수 (슬롯을 얻은 뒤에 호출됨, 재시도마다 다시 호출)
+            timeout: 호출 타임아웃 (초). None이면 기본값 사용
+            estimated_tokens: TPM 한도 계산용 예상 토큰 수
+            latency_key: 지연 시간 기록 키 (기본값: provider, 배치 호출은 "{provider}:batch")
+
+        Returns:
+            호출 결과
+
+        Raises:
+            asyncio.TimeoutError: 재시도 후에도 타임아웃 초과 시
+            CircuitOpenError: 제공자가 차단된 상태일 때
+        """
+        timeout = timeout or self.default_timeout
+        limiter = self.rate_limiters.get(provider)
+        priority = request_priority.get()
+        breaker = get_circuit_breaker(provider)
+        latency_key = latency_key or provider
+
+        async def attempt() -> T:
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open for provider: {provider}")
+
+            try:
+                if limiter is not None:
+                    await limiter.acquire(estimated_tokens, priority)
+
+                async with self._semaphore(provider):
+                    started_event = call_started.get()
+                    if started_event is not None:
+                        started_event.set()
+                    started = time.monotonic()
+                    result = await asyncio.wait_for(call(), timeout=timeout)
+                    elapsed = time.monotonic() - started
+            except asyncio.CancelledError:
+                # hedging에서 진 요청 취소 등은 실패로 세지 않음
+                breaker.cancel_probe()
+                raise
+            except Exception as e:
+                breaker.record_failure()
+                if isinstance(e, asyncio.TimeoutError):
+                    logger.warning(f"⏱️ {provider} call timed out after {timeout}s")
+                raise
+
+            # 지표 기록은 try 밖에서 (기록 오류가 제공자 실패로 집계되지 않도록)
+            breaker.record_success()
+            self._record_latency(latency_key, elapsed)
+            return result
+
+        return await retry_with_backoff(
+            attempt,
+            max_retries=self.max_retries,
+            base_delay=self.backoff_base,
+            max_delay=self.backoff_max,
+            label=provider,
+        )
+
+    def stats(self) -> dict:
+        """제공자별 대기열 / 대기 시간 / 지연 시간 / 서킷 상태 지표"""
+        return {
+            name: {
+                **limiter.stats(),
+                'latency_p50_seconds': self.latency_percentile(name, 50, min_samples=1),
+                'latency_p95_seconds': self.latency_percentile(name, 95, min_samples=1),
+                'circuit': get_circuit_breaker(name).stats(),
+            }
+            for name, limiter in self.rate_limiters.items()
+        }
+
+
+# 싱글톤 인스턴스
+_executor_instance = None
+
+
+def get_provider_executor() -> ProviderExecutor:
+    """Provider Executor 싱글톤 인스턴스 반환"""
+    global _executor_instance
+    if _executor_instance is None:
+        settings = get_settings()
+        _executor_instance = ProviderExecutor(
+            limits={
+                'gemini': settings.gemini_max_concurrency,
+                'openai': settings.openai_max_concurrency,
+                'anthropic': settings.anthropic_max_concurrency,
+            },
+            default_timeout=settings.llm_request_timeout_seconds,
+            rate_limiters={
+                'gemini': ProviderRateLimiter('gemini', settings.gemini_rpm, settings.gemini_tpm),
+                'openai': ProviderRateLimiter('openai', settings.openai_rpm, settings.openai_tpm),
+                'anthropic': ProviderRateLimiter('anthropic', settings.anthropic_rpm, settings.anthropic_tpm),
+            },
+            max_retries=settings.llm_max_retries,
+            backoff_base=settings.llm_backoff_base_seconds,
+            backoff_max=settings.llm_backoff_max_seconds,
+        )
+    return _executor_instance
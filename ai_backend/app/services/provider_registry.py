@@ -0,0 +1,239 @@
+"""
+Provider Registry
+
+LLM 제공자 클라이언트를 이벤트 루프당 한 번만 생성해 감정 분석, NER 등 모든 LLM 작업에서 재사용합니다.
+커넥션 풀, TLS 세션, HTTP keep-alive가 요청 간에 유지됩니다.
+
+- Gemini: genai.configure 1회 + 모델명별 GenerativeModel 캐시
+- OpenAI / Anthropic: HTTP/2 커넥션 풀을 가진 httpx.AsyncClient 공유
+
+httpx 커넥션 풀과 Gemini grpc.aio 채널은 생성된 이벤트 루프에 묶이므로
+클라이언트는 실행 중인 루프별로 따로 캐시합니다. (ProviderExecutor의 루프별 세마포어와 같은 방식)
+FastAPI 메인 루프 외의 루프(리스너 스레드 등)는 루프를 닫기 전에 aclose()를 호출합니다.
+"""
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+import httpx
+
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class _LoopClients:
+    """이벤트 루프 1개에 묶인 클라이언트 / 분석기 캐시"""
+
+    def __init__(self):
+        self.gemini_models: Dict[str, Any] = {}
+        self.clients: Dict[str, Any] = {}
+        self.emotion_analyzers: Dict[str, Any] = {}
+        self.http_clients: List[httpx.AsyncClient] = []
+        self.grpc_clients: List[Any] = []
+
+
+class ProviderRegistry:
+    """제공자 클라이언트 레지스트리 (lifespan에서 warm-up / 종료)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._gemini_configured = False
+        self._loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # 실행 중인 루프 밖에서 생성된 클라이언트 (처음 사용하는 루프에 묶임)
+        self._unbound = _LoopClients()
+        # 로컬 어휘 분석기는 루프와 무관하므로 프로세스당 1개
+        self._local_analyzer = None
+
+    def _loop_clients(self) -> _LoopClients:
+        """현재 실행 중인 이벤트 루프의 클라이언트 캐시"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._unbound
+
+        with self._lock:
+            clients = self._loops.get(loop)
+            if clients is None:
+                clients = self._loops[loop] = _LoopClients()
+            return clients
+
+    def _create_http_client(self, scope: _LoopClients) -> httpx.AsyncClient:
+        """HTTP/2 커넥션 풀 클라이언트 생성 (h2 미설치 시 HTTP/1.1)"""
+        settings = get_settings()
+        limits = httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+        )
+        timeout = httpx.Timeout(settings.llm_request_timeout_seconds, connect=10.0)
+
+        try:
+            client = httpx.AsyncClient(http2=settings.llm_http2, limits=limits, timeout=timeout)
+        except ImportError:
+            logger.warning("⚠️ h2 not installed. LLM clients fall back to HTTP/1.1 (pip install httpx[http2])")
+            client = httpx.AsyncClient(limits=limits, timeout=timeout)
+
+        scope.http_clients.append(client)
+        return client
+
+    def gemini_model(self, model_name: str):
+        """현재 루프의 Gemini GenerativeModel 반환 (genai.configure는 최초 1회)"""
+        with self._lock:
+            if not self._gemini_configured:
+                settings = get_settings()
+                if not settings.gemini_api_key:
+                    raise ValueError("GEMINI_API_KEY not set in environment")
+                genai.configure(api_key=settings.gemini_api_key)
+                self._gemini_configured = True
+
+            scope = self._loop_clients()
+            if model_name not in scope.gemini_models:
+                model = genai.GenerativeModel(model_name)
+                if scope is not self._unbound:
+                    self._bind_gemini_async_client(model, scope)
+                scope.gemini_models[model_name] = model
+
+            return scope.gemini_models[model_name]
+
+    def _bind_gemini_async_client(self, model, scope: _LoopClients):
+        """
+        루프 전용 grpc.aio 클라이언트를 모델에 연결
+
+        genai의 기본 async 클라이언트는 프로세스 전역(처음 사용한 루프에 묶임)이므로
+        공개 API인 google.ai.generativelanguage.GenerativeServiceAsyncClient를 루프마다 생성합니다.
+        GenerativeModel은 _async_client가 비어 있을 때만 기본 클라이언트를 쓰므로 여기에 넣어 둡니다.
+        (google-generativeai==0.8.3 고정, tests/test_provider_registry.py가 이 동작을 확인)
+        """
+        if not hasattr(model, '_async_client'):
+            logger.warning("⚠️ GenerativeModel has no _async_client; Gemini async calls share the default client")
+            return
+
+        model._async_client = glm.GenerativeServiceAsyncClient(
+            client_options={'api_key': get_settings().gemini_api_key},
+        )
+        scope.grpc_clients.append(model._async_client)
+
+    def openai_client(self):
+        """현재 루프의 AsyncOpenAI 클라이언트 반환"""
+        with self._lock:
+            scope = self._loop_clients()
+            if 'openai' not in scope.clients:
+                settings = get_settings()
+                if not settings.openai_api_key:
+                    raise ValueError("OPENAI_API_KEY not set in environment")
+
+                from openai import AsyncOpenAI
+                scope.clients['openai'] = AsyncOpenAI(
+                    api_key=settings.openai_api_key,
+                    http_client=self._create_http_client(scope),
+                )
+
+            return scope.clients['openai']
+
+    def anthropic_client(self):
+        """현재 루프의 AsyncAnthropic 클라이언트 반환"""
+        with self._lock:
+            scope = self._loop_clients()
+            if 'anthropic' not in scope.clients:
+                settings = get_settings()
+                if not settings.anthropic_api_key:
+                    raise ValueError("ANTHROPIC_API_KEY not set in environment")
+
+                from anthropic import AsyncAnthropic
+                scope.clients['anthropic'] = AsyncAnthropic(
+                    api_key=settings.anthropic_api_key,
+                    http_client=self._create_http_client(scope),
+                )
+
+            return scope.clients['anthropic']
+
+    def emotion_analyzer(self, provider: str):
+        """제공자별 감정 분석기 인스턴스 (LLM 분석기는 이벤트 루프당 1개, 로컬 분석기는 프로세스당 1개)"""
+        if provider == "local":
+            if self._local_analyzer is None:
+                from .lexicon_emotion_analyzer import LexiconEmotionAnalyzer
+                self._local_analyzer = LexiconEmotionAnalyzer()
+            return self._local_analyzer
+
+        scope = self._loop_clients()
+        analyzer = scope.emotion_analyzers.get(provider)
+        if analyzer is not None:
+            return analyzer
+
+        from .emotion_analyzer import (
+            GeminiEmotionAnalyzer,
+            OpenAIEmotionAnalyzer,
+            ClaudeEmotionAnalyzer,
+        )
+
+        if provider == "gemini":
+            analyzer = GeminiEmotionAnalyzer(self.gemini_model(GeminiEmotionAnalyzer.model_name))
+        elif provider == "openai":
+            analyzer = OpenAIEmotionAnalyzer(self.openai_client())
+        elif provider == "anthropic":
+            analyzer = ClaudeEmotionAnalyzer(self.anthropic_client())
+        else:
+            raise ValueError(f"Unknown provider: {provider}")
+
+        scope.emotion_analyzers[provider] = analyzer
+        return analyzer
+
+    async def warm_up(self):
+        """시작 시 API 키가 설정된 제공자의 클라이언트를 미리 생성 (현재 루프 기준)"""
+        settings = get_settings()
+        configured = {
+            'gemini': settings.gemini_api_key,
+            'openai': settings.openai_api_key,
+            'anthropic': settings.anthropic_api_key,
+        }
+
+        for provider, api_key in configured.items():
+            if not api_key:
+                continue
+            try:
+                self.emotion_analyzer(provider)
+                logger.info(f"✅ LLM provider client ready: {provider}")
+            except Exception as e:
+                logger.error(f"❌ Failed to warm up {provider} client: {e}")
+
+        if settings.emotion_routing != "llm":
+            self.emotion_analyzer("local")
+            logger.info("✅ Local lexicon emotion analyzer ready")
+
+    async def aclose(self):
+        """현재 루프(와 루프 밖에서 생성된) 클라이언트의 커넥션 풀 종료"""
+        with self._lock:
+            scopes: List[Optional[_LoopClients]] = [self._unbound]
+            try:
+                scopes.append(self._loops.pop(asyncio.get_running_loop(), None))
+            except RuntimeError:
+                pass
+            self._unbound = _LoopClients()
+
+        for scope in filter(None, scopes):
+            for client in scope.http_clients:
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    logger.error(f"Error closing LLM HTTP client: {e}")
+            for client in scope.grpc_clients:
+                try:
+                    await client.transport.close()
+                except Exception as e:
+                    logger.error(f"Error closing Gemini client: {e}")
+
+
+# 싱글톤 인스턴스
+_registry_instance = None
+
+
+def get_provider_registry() -> ProviderRegistry:
+    """Provider Registry 싱글톤 인스턴스 반환"""
+    global _registry_instance
+    if _registry_instance is None:
+        _registry_instance = ProviderRegistry()
+    return _registry_instance
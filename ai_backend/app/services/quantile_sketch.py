@@ -0,0 +1,102 @@
+"""
+Quantile Sketch
+
+양수 값(응답 시간 등)의 분위수를 고정 크기 상태로 추정하는 스트리밍 스케치입니다. (DDSketch 방식)
+
+값을 로그 스케일 버킷에 세기만 하므로 추가는 O(1)이고,
+추정한 분위수는 실제 값 대비 상대 오차 relative_accuracy 이내입니다.
+상태는 JSON으로 저장할 수 있고 두 스케치는 합칠 수 있습니다.
+"""
+import math
+from typing import Dict, Optional
+
+
+class QuantileSketch:
+    """로그 버킷 기반 분위수 스케치"""
+
+    # 이 값 이하는 0 버킷으로 취급 (로그 계산 불가)
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float):
+        """값 1개 추가"""
+        if value <= self.MIN_VALUE:
+            self.zero_count += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0) + 1
+
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        분위수 추정
+
+        Args:
+            q: 분위 (0~1)
+
+        Returns:
+            Optional[float]: 추정값 (값이 없으면 None)
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return max(0.0, self.min)
+
+        seen = self.zero_count
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # 버킷 (gamma^(k-1), gamma^k]의 상대 오차 중앙값
+                value = 2 * self.gamma ** key / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    def merge(self, other: 'QuantileSketch'):
+        """다른 스케치를 합침 (같은 relative_accuracy 필요)"""
+        if not math.isclose(self.gamma, other.gamma):
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def to_dict(self) -> dict:
+        """JSON 저장용 상태"""
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'bins': {str(key): count for key, count in self.bins.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuantileSketch':
+        """to_dict 결과로부터 복원"""
+        sketch = cls(data.get('relative_accuracy', 0.01))
+        sketch.bins = {int(key): int(count) for key, count in data.get('bins', {}).items()}
+        sketch.zero_count = data.get('zero_count', 0)
+        sketch.count = data.get('count', 0)
+        sketch.min = data.get('min')
+        sketch.max = data.get('max')
+        return sketch
@@ -0,0 +1,259 @@
+"""
+Provider Rate Limiter
+
+제공자별 토큰 버킷(분당 요청 수 + 분당 토큰 수)과 우선순위 대기열,
+429/5xx 재시도(지터 포함 지수 백오프)를 제공합니다.
+
+우선순위는 contextvar로 전달되어 호출 경로를 바꾸지 않고도
+배치 작업(BULK)이 API 요청(INTERACTIVE) 뒤로 밀리도록 합니다.
+
+Usage:
+    with bulk_priority():
+        await analyze_couple_day(...)
+"""
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class Priority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 처리)"""
+    INTERACTIVE = 0  # API 요청
+    BULK = 1  # 일별 배치, 대용량 업로드
+
+
+request_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar(
+    'request_priority', default=Priority.INTERACTIVE
+)
+
+
+@contextmanager
+def bulk_priority():
+    """이 블록 안의 LLM 호출을 BULK 우선순위로 처리"""
+    token = request_priority.set(Priority.BULK)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+def estimate_tokens(text: str) -> int:
+    """프롬프트 토큰 수 보수적 추정 (한국어는 대략 글자당 1토큰 이하)"""
+    return max(1, len(text))
+
+
+class TokenBucket:
+    """분당 한도를 연속적으로 채우는 토큰 버킷"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 소비하기 위해 기다려야 하는 시간 (초)"""
+        self._refill()
+        # 한도보다 큰 요청은 버킷이 가득 찼을 때 통과시킴 (영구 대기 방지)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+
+class ProviderRateLimiter:
+    """
+    제공자 1개에 대한 RPM/TPM 제한 + 우선순위 대기열
+
+    대기열 맨 앞 요청만 버킷을 소비할 수 있으므로 BULK 요청이 INTERACTIVE 요청을 앞지르지 않습니다.
+    맨 앞 요청은 버킷이 찰 때까지 asyncio.sleep으로 기다리고, 나머지는 각자의 future에서 기다리다가
+    앞 요청이 대기열을 떠날 때 깨어납니다. (폴링 없음)
+    여러 이벤트 루프에서 함께 쓸 수 있도록 future는 call_soon_threadsafe로 깨웁니다.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int, tokens_per_minute: int):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self._queue: list = []
+        self._waiters: Dict[tuple, asyncio.Future] = {}
+        self._seq = itertools.count()
+
+        # 대기 시간 지표 (우선순위별)
+        self.wait_count: Dict[str, int] = {p.name: 0 for p in Priority}
+        self.wait_total: Dict[str, float] = {p.name: 0.0 for p in Priority}
+        self.wait_max: Dict[str, float] = {p.name: 0.0 for p in Priority}
+
+    async def acquire(self, tokens: int, priority: Priority):
+        """요청 1건 + tokens 만큼의 한도를 확보할 때까지 대기"""
+        loop = asyncio.get_running_loop()
+        entry = (int(priority), next(self._seq))
+        started = time.monotonic()
+
+        with self._lock:
+            heapq.heappush(self._queue, entry)
+            wakeup = self._waiters[entry] = loop.create_future()
+
+        try:
+            while True:
+                with self._lock:
+                    if self._queue[0] == entry:
+                        wait = max(self.requests.wait_time(1), self.tokens.wait_time(tokens))
+                        if wait == 0.0:
+                            self.requests.consume(1)
+                            self.tokens.consume(tokens)
+                            heapq.heappop(self._queue)
+                            del self._waiters[entry]
+                            self._wake_head()
+                            break
+                    else:
+                        wait = None
+
+                if wait is None:
+                    # 맨 앞 요청이 떠나면 _wake_head가 깨움
+                    await wakeup
+                    with self._lock:
+                        wakeup = self._waiters[entry] = loop.create_future()
+                else:
+                    await asyncio.sleep(wait)
+        except BaseException:
+            # 취소된 요청은 대기열에서 제거하고, 맨 앞이었다면 다음 요청을 깨움
+            with self._lock:
+                if entry in self._waiters:
+                    del self._waiters[entry]
+                    self._queue.remove(entry)
+                    heapq.heapify(self._queue)
+                    self._wake_head()
+            raise
+
+        self._record_wait(priority, time.monotonic() - started)
+
+    def _wake_head(self):
+        """대기열 맨 앞 요청을 깨움 (lock 안에서 호출)"""
+        if not self._queue:
+            return
+        wakeup = self._waiters[self._queue[0]]
+        try:
+            wakeup.get_loop().call_soon_threadsafe(_resolve, wakeup)
+        except RuntimeError:
+            # 요청한 루프가 이미 닫힘 (해당 요청은 더 이상 기다리지 않음)
+            pass
+
+    def _record_wait(self, priority: Priority, waited: float):
+        with self._lock:
+            self.wait_count[priority.name] += 1
+            self.wait_total[priority.name] += waited
+            self.wait_max[priority.name] = max(self.wait_max[priority.name], waited)
+
+    def stats(self) -> dict:
+        """대기열 길이 및 우선순위별 대기 시간 지표"""
+        with self._lock:
+            return {
+                'queue_length': len(self._queue),
+                'wait_time': {
+                    name: {
+                        'count': self.wait_count[name],
+                        'avg_seconds': round(self.wait_total[name] / self.wait_count[name], 4)
+                        if self.wait_count[name] else 0.0,
+                        'max_seconds': round(self.wait_max[name], 4),
+                    }
+                    for name in self.wait_count
+                },
+            }
+
+
+def _resolve(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+# ===== Retry =====
+
+def _status_code(error: Exception) -> Optional[int]:
+    """SDK 예외에서 HTTP 상태 코드 추출 (openai/anthropic: status_code, google: code)"""
+    for attr in ('status_code', 'code'):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """429 / 5xx / 타임아웃이면 재시도 대상"""
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    status = _status_code(error)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """응답 헤더의 Retry-After (초) 추출"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+async def retry_with_backoff(
+    call: Callable[[], Awaitable[T]],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    label: str = "",
+) -> T:
+    """
+    재시도 가능한 오류에 대해 지터 포함 지수 백오프로 재시도
+
+    Args:
+        call: 코루틴을 반환하는 함수 (시도마다 새로 호출)
+        max_retries: 최대 재시도 횟수
+        base_delay: 첫 백오프 상한 (초)
+        max_delay: 백오프 상한 (초)
+        label: 로그용 이름
+
+    Returns:
+        호출 결과
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable(e):
+                raise
+
+            # Full jitter: [0, min(max_delay, base * 2^attempt)]
+            delay = random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+            retry_after = _retry_after(e)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, max_delay))
+
+            logger.warning(
+                f"🔁 {label} call failed ({type(e).__name__}, status={_status_code(e)}), "
+                f"retry {attempt + 1}/{max_retries} in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,397 @@
+"""
+Response Latency Analytics
+
+상대방 메시지에 답하기까지 걸린 시간의 분포를 계산합니다.
+평균(TurnTakingAnalysis.avg_response_time)과 달리 1시간 상한 없이 모든 응답을 포함하고,
+분위수(p50/p90/p99)와 발신자별 분위수, 요일 × 시간(7×24) 히트맵을 NumPy로 한 번에 계산합니다.
+
+일별 배치가 최근 기간(response_latency_history_days) 결과를 커플별로 저장해 두면
+앱 차트는 원본 메시지 대신 저장된 배열을 읽습니다.
+배치는 새 날짜의 메시지만 조회해 일별 응답 표본으로 저장하고, 기간 분포는 저장된 표본을 합쳐 계산합니다.
+
+저장 테이블: response_latency_stats (supabase/migrations/20251120000002_response_latency_stats.sql)
+            response_latency_daily_samples (supabase/migrations/20251120000006_response_latency_daily_samples.sql)
+"""
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import List, NamedTuple
+
+import numpy as np
+
+from ..core.config import get_settings
+from ..core.supabase import get_supabase_client
+from ..models.schemas import ResponseLatencyStats, SenderLatency
+from .file_processors.message_table import MessageTable
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_DAY_US = 86400 * 1_000_000
+_HOUR_US = 3600 * 1_000_000
+
+DAYS = 7
+HOURS = 24
+
+
+class LatencySamples(NamedTuple):
+    """응답 1건 = 직전 메시지와 발신자가 다른 메시지"""
+    gaps: np.ndarray  # 응답 지연 (초, float64)
+    responders: np.ndarray  # 응답한 사람의 발신자 코드
+    cells: np.ndarray  # 응답 시각의 요일 * 24 + 시 (0~167)
+
+
+class ResponseLatencyAnalyzer:
+    """응답 지연 분포 분석기"""
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, utc_offset_hours: int | None = None):
+        if utc_offset_hours is None:
+            utc_offset_hours = get_settings().analysis_utc_offset_hours
+        self.offset_us = utc_offset_hours * _HOUR_US
+
+    def analyze(self, messages: list[dict] | MessageTable) -> ResponseLatencyStats:
+        """
+        응답 지연 분포 계산
+
+        Args:
+            messages: [{sender_id, timestamp}, ...] 형태의 메시지 리스트 (시간순) 또는 MessageTable
+
+        Returns:
+            ResponseLatencyStats: 분위수, 발신자별 분위수, 요일 × 시간 히트맵
+        """
+        users, samples = self.extract_samples(messages)
+        return self.stats_from_samples(users, samples)
+
+    def stats_from_samples(self, users: list, samples: LatencySamples) -> ResponseLatencyStats:
+        """
+        응답 표본으로 분포 계산 (저장된 일별 표본을 합쳐 기간 분포를 만들 때 사용)
+
+        Args:
+            users: 발신자 리스트 (samples.responders 코드 순서)
+            samples: 응답 지연 표본
+
+        Returns:
+            ResponseLatencyStats: 분위수, 발신자별 분위수, 요일 × 시간 히트맵
+        """
+        gaps = samples.gaps
+
+        p50, p90, p99 = self._percentiles(gaps)
+        per_sender = []
+        for code, user in enumerate(users):
+            sender_gaps = gaps[samples.responders == code]
+            s50, s90, s99 = self._percentiles(sender_gaps)
+            per_sender.append(SenderLatency(
+                sender_id=str(user),
+                response_count=len(sender_gaps),
+                p50=s50, p90=s90, p99=s99,
+            ))
+
+        counts, medians = self._heatmap(samples)
+
+        return ResponseLatencyStats(
+            response_count=len(gaps),
+            p50=p50, p90=p90, p99=p99,
+            per_sender=per_sender,
+            heatmap_counts=counts.reshape(DAYS, HOURS).tolist(),
+            heatmap_median=np.round(medians, 1).reshape(DAYS, HOURS).tolist(),
+        )
+
+    def extract_samples(self, messages: list[dict] | MessageTable) -> tuple[list, LatencySamples]:
+        """
+        메시지를 한 번 순회해 응답 지연 표본 추출
+
+        타임스탬프는 int64 epoch 마이크로초로 변환합니다.
+        timezone이 있는 값은 utc_offset_hours 기준 현지 시각으로, naive 값은 이미 현지 시각으로 봅니다.
+
+        MessageTable은 이미 naive 현지 시각 epoch 마이크로초 배열이므로 변환 없이 사용합니다.
+
+        Returns:
+            tuple: (등장 순서의 발신자 리스트, LatencySamples)
+        """
+        if isinstance(messages, MessageTable):
+            has_time = messages.has_timestamp
+            times = np.where(has_time, messages.timestamps, 0)
+            return messages.senders, self._samples(messages.sender_codes.astype(np.int64), times, times, has_time)
+
+        index: dict = {}
+        codes = []
+        times_us = []
+        local_us = []
+        has_time = []
+
+        for msg in messages:
+            codes.append(index.setdefault(msg['sender_id'], len(index)))
+            ts = msg.get('timestamp')
+            if ts is None:
+                times_us.append(0)
+                local_us.append(0)
+                has_time.append(False)
+                continue
+
+            if isinstance(ts, str):
+                ts = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+            if ts.tzinfo is None:
+                us = (ts.replace(tzinfo=timezone.utc) - _EPOCH) // _MICROSECOND
+                local = us
+            else:
+                us = (ts - _EPOCH) // _MICROSECOND
+                local = us + self.offset_us
+            times_us.append(us)
+            local_us.append(local)
+            has_time.append(True)
+
+        return list(index), self._samples(
+            np.array(codes, dtype=np.int64),
+            np.array(times_us, dtype=np.int64),
+            np.array(local_us, dtype=np.int64),
+            np.array(has_time, dtype=bool),
+        )
+
+    @staticmethod
+    def _samples(codes: np.ndarray, times: np.ndarray, local: np.ndarray, has_time: np.ndarray) -> LatencySamples:
+        """발신자 코드 / epoch 마이크로초 / 현지 시각 배열 → 응답 표본"""
+        gaps = np.diff(times)
+        valid = (codes[1:] != codes[:-1]) & has_time[1:] & has_time[:-1] & (gaps > 0)
+
+        # 응답 시각(현지) → 요일(1970-01-01은 목요일) * 24 + 시
+        local = local[1:][valid]
+        days = local // _DAY_US
+        cells = ((days + 3) % DAYS) * HOURS + (local - days * _DAY_US) // _HOUR_US
+
+        return LatencySamples(
+            gaps=gaps[valid] / 1e6,
+            responders=codes[1:][valid],
+            cells=cells,
+        )
+
+    def _percentiles(self, gaps: np.ndarray) -> List[float]:
+        if len(gaps) == 0:
+            return [0.0] * len(self.PERCENTILES)
+        return [round(float(v), 1) for v in np.percentile(gaps, self.PERCENTILES)]
+
+    def _heatmap(self, samples: LatencySamples) -> tuple[np.ndarray, np.ndarray]:
+        """
+        요일 × 시간 칸별 응답 수와 지연 중앙값 (정렬 한 번으로 전체 칸 계산)
+
+        Returns:
+            tuple: (길이 168 응답 수, 길이 168 중앙값)
+        """
+        cells = samples.cells
+        counts = np.bincount(cells, minlength=DAYS * HOURS)
+        medians = np.zeros(DAYS * HOURS, dtype=np.float64)
+        if len(cells) == 0:
+            return counts, medians
+
+        # 칸 → 지연 순으로 정렬하면 각 칸의 값이 연속 구간이 됨
+        order = np.lexsort((samples.gaps, cells))
+        sorted_gaps = samples.gaps[order]
+        starts = np.cumsum(counts) - counts
+
+        filled = counts > 0
+        low = starts[filled] + (counts[filled] - 1) // 2
+        high = starts[filled] + counts[filled] // 2
+        medians[filled] = (sorted_gaps[low] + sorted_gaps[high]) / 2
+
+        return counts, medians
+
+
+class ResponseLatencyStore:
+    """
+    response_latency_stats 테이블 기반 커플별 결과 저장소
+
+    응답 표본(지연, 응답자, 요일 × 시간 칸)은 응답 날짜별로 response_latency_daily_samples에 저장해 두고,
+    갱신할 때는 마지막으로 저장한 날짜부터의 메시지만 조회합니다.
+    기간 분포는 저장된 일별 표본을 합쳐 계산하므로 매일 전체 기간 메시지를 다시 읽지 않습니다.
+    """
+
+    TABLE = 'response_latency_stats'
+    SAMPLES_TABLE = 'response_latency_daily_samples'
+
+    # Supabase 한 번 조회 최대 행 수
+    PAGE_SIZE = 1000
+
+    def __init__(self, analyzer: ResponseLatencyAnalyzer | None = None):
+        self.supabase = get_supabase_client()
+        self.analyzer = analyzer or ResponseLatencyAnalyzer()
+
+    def refresh(self, couple_id: str, end_date: date, days: int | None = None) -> ResponseLatencyStats:
+        """
+        새 메시지의 응답 표본을 저장한 뒤 최근 기간의 분포를 다시 계산해 저장
+
+        Args:
+            couple_id: 커플 ID
+            end_date: 기간 마지막 날짜
+            days: 기간 길이 (기본값: response_latency_history_days)
+
+        Returns:
+            ResponseLatencyStats: 저장한 결과
+        """
+        days = days or get_settings().response_latency_history_days
+        start_date = end_date - timedelta(days=days - 1)
+
+        self._update_daily_samples(couple_id, start_date, end_date)
+        users, samples = self._load_samples(couple_id, start_date, end_date)
+        stats = self.analyzer.stats_from_samples(users, samples)
+
+        self.supabase.table(self.TABLE)\
+            .upsert({
+                'couple_id': couple_id,
+                'period_start': str(start_date),
+                'period_end': str(end_date),
+                'response_count': stats.response_count,
+                'percentiles': {'p50': stats.p50, 'p90': stats.p90, 'p99': stats.p99},
+                'per_sender': [sender.model_dump() for sender in stats.per_sender],
+                # 7×24를 행 우선(요일, 시)으로 평탄화
+                'heatmap_counts': [count for row in stats.heatmap_counts for count in row],
+                'heatmap_median_seconds': [value for row in stats.heatmap_median for value in row],
+                'computed_at': datetime.now(timezone.utc).isoformat(),
+            }, on_conflict='couple_id')\
+            .execute()
+
+        # 기간이 지난 일별 표본 정리
+        self.supabase.table(self.SAMPLES_TABLE)\
+            .delete()\
+            .eq('couple_id', couple_id)\
+            .lt('sample_date', str(start_date))\
+            .execute()
+
+        logger.info(f"⏱️ Response latency stats saved for couple {couple_id}: {stats.response_count} responses")
+        return stats
+
+    def load(self, couple_id: str) -> ResponseLatencyStats | None:
+        """저장된 결과 조회 (없으면 None)"""
+        response = self.supabase.table(self.TABLE)\
+            .select('*')\
+            .eq('couple_id', couple_id)\
+            .limit(1)\
+            .execute()
+        if not response.data:
+            return None
+
+        row = response.data[0]
+        return ResponseLatencyStats(
+            response_count=row['response_count'],
+            **row['percentiles'],
+            per_sender=[SenderLatency(**sender) for sender in row['per_sender']],
+            heatmap_counts=np.array(row['heatmap_counts']).reshape(DAYS, HOURS).tolist(),
+            heatmap_median=np.array(row['heatmap_median_seconds'], dtype=np.float64).reshape(DAYS, HOURS).tolist(),
+        )
+
+    def _update_daily_samples(self, couple_id: str, start_date: date, end_date: date) -> int:
+        """
+        마지막으로 저장한 날짜(그 날 늦게 온 메시지 반영을 위해 포함)부터 end_date까지 메시지를 조회해
+        날짜별 응답 표본을 저장 (저장된 표본이 없으면 기간 전체를 한 번 조회)
+
+        Returns:
+            int: 조회한 메시지 수
+        """
+        stored = self.supabase.table(self.SAMPLES_TABLE)\
+            .select('sample_date, last_sender_id, last_message_at')\
+            .eq('couple_id', couple_id)\
+            .gte('sample_date', str(start_date))\
+            .lte('sample_date', str(end_date))\
+            .order('sample_date', desc=True)\
+            .limit(2)\
+            .execute().data
+
+        fetch_start = date.fromisoformat(str(stored[0]['sample_date'])) if stored else start_date
+        # 첫 응답의 지연은 직전 날짜의 마지막 메시지 기준
+        previous = None
+        if len(stored) > 1:
+            previous = {'sender_id': stored[1]['last_sender_id'], 'timestamp': stored[1]['last_message_at']}
+
+        messages = self._fetch_messages(couple_id, fetch_start, end_date)
+        if not messages:
+            return 0
+
+        by_day: dict = {}
+        for msg in messages:
+            by_day.setdefault(_utc_date(msg['timestamp']), []).append(msg)
+
+        rows = []
+        for day, day_messages in by_day.items():
+            users, samples = self.analyzer.extract_samples(([previous] if previous else []) + day_messages)
+            rows.append({
+                'couple_id': couple_id,
+                'sample_date': str(day),
+                'sender_ids': [str(user) for user in users],
+                'responder_ids': [str(users[code]) for code in samples.responders],
+                'gaps': samples.gaps.tolist(),
+                'cells': samples.cells.tolist(),
+                'message_count': len(day_messages),
+                'last_sender_id': day_messages[-1]['sender_id'],
+                'last_message_at': day_messages[-1]['timestamp'],
+            })
+            previous = day_messages[-1]
+
+        self.supabase.table(self.SAMPLES_TABLE)\
+            .upsert(rows, on_conflict='couple_id,sample_date')\
+            .execute()
+        return len(messages)
+
+    def _load_samples(self, couple_id: str, start_date: date, end_date: date) -> tuple[list, LatencySamples]:
+        """기간의 일별 표본을 합쳐 하나의 LatencySamples로"""
+        rows = self.supabase.table(self.SAMPLES_TABLE)\
+            .select('sender_ids, responder_ids, gaps, cells')\
+            .eq('couple_id', couple_id)\
+            .gte('sample_date', str(start_date))\
+            .lte('sample_date', str(end_date))\
+            .order('sample_date')\
+            .execute().data
+
+        # 발신자 코드는 메시지 등장 순서 (전체 기간 analyze와 같은 per_sender 순서)
+        index: dict = {}
+        for row in rows:
+            for sender in row['sender_ids']:
+                index.setdefault(sender, len(index))
+        responders = [index[sender] for row in rows for sender in row['responder_ids']]
+        return list(index), LatencySamples(
+            gaps=np.array([gap for row in rows for gap in row['gaps']], dtype=np.float64),
+            responders=np.array(responders, dtype=np.int64),
+            cells=np.array([cell for row in rows for cell in row['cells']], dtype=np.int64),
+        )
+
+    def _fetch_messages(self, couple_id: str, start_date: date, end_date: date) -> list[dict]:
+        """기간 메시지를 페이지 단위로 조회 (sender_id, created_at만)"""
+        messages = []
+        offset = 0
+        while True:
+            response = self.supabase.table('conversations')\
+                .select('sender_id, created_at')\
+                .eq('couple_id', couple_id)\
+                .gte('created_at', f"{start_date} 00:00:00")\
+                .lte('created_at', f"{end_date} 23:59:59")\
+                .order('created_at')\
+                .range(offset, offset + self.PAGE_SIZE - 1)\
+                .execute()
+
+            messages.extend(
+                {'sender_id': row['sender_id'], 'timestamp': row['created_at']}
+                for row in response.data
+            )
+            if len(response.data) < self.PAGE_SIZE:
+                return messages
+            offset += self.PAGE_SIZE
+
+
+def _utc_date(timestamp) -> date:
+    """메시지 시각의 UTC 날짜 (created_at 날짜 필터와 같은 기준)"""
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.date()
+
+
+# 싱글톤 인스턴스
+_store_instance = None
+
+
+def get_response_latency_store() -> ResponseLatencyStore:
+    """Response Latency Store 싱글톤 인스턴스 반환"""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = ResponseLatencyStore()
+    return _store_instance
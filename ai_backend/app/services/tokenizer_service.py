@@ -0,0 +1,118 @@
+"""
+Tokenizer Service
+
+Kiwi 형태소 분석기를 프로세스당 한 번만 로드해 LSM, 로컬 감정 분석 등 모든 서비스에서 공유합니다.
+메시지 리스트는 한 번의 호출로 Kiwi 멀티 워커 배치 모드에서 형태소 분석됩니다.
+
+NOTE: FastAPI 요청 처리와 파일 리스너 스레드가 같은 인스턴스를 쓰므로
+모델 로드와 분석 호출은 lock으로 직렬화합니다. (배치 내부는 Kiwi 워커가 병렬 처리)
+"""
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from ..core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+# 설정을 읽을 수 없을 때(.env 없는 테스트 / 스크립트) 사용하는 Kiwi 워커 수 (-1: 전체 코어)
+DEFAULT_NUM_WORKERS = -1
+
+
+def _configured_num_workers() -> int:
+    """kiwi_num_workers 설정값 (Supabase 등 필수 설정이 없으면 기본값)"""
+    try:
+        return get_settings().kiwi_num_workers
+    except ValidationError:
+        return DEFAULT_NUM_WORKERS
+
+
+class TokenizerService:
+    """공유 Kiwi 형태소 분석 서비스 (lifespan에서 warm-up)"""
+
+    def __init__(self, num_workers: Optional[int] = None):
+        """
+        Args:
+            num_workers: Kiwi 배치 워커 수 (None이면 모델 로드 시점에 kiwi_num_workers 설정 사용)
+        """
+        self.num_workers = num_workers
+        self._kiwi = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _get_kiwi(self):
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                if self.num_workers is None:
+                    self.num_workers = _configured_num_workers()
+                try:
+                    from kiwipiepy import Kiwi
+                    self._kiwi = Kiwi(num_workers=self.num_workers)
+                    logger.info(f"✅ Kiwi tokenizer loaded (num_workers={self.num_workers})")
+                except ImportError:
+                    logger.warning("⚠️ kiwipiepy not installed. Tokenization falls back to whitespace split.")
+            return self._kiwi
+
+    def warm_up(self):
+        """모델 로드 + 첫 분석 비용을 시작 시점에 미리 지불"""
+        self.tokenize_forms(["워밍업 문장입니다."])
+
+    def tokenize_forms(self, texts: List[str]) -> List[List[str]]:
+        """
+        텍스트 리스트를 형태소 form 리스트로 일괄 변환
+
+        Args:
+            texts: 분석할 텍스트 리스트
+
+        Returns:
+            List[List[str]]: 텍스트별 형태소 form 리스트 (Kiwi 없으면 공백 분리)
+        """
+        if not texts:
+            return []
+
+        kiwi = self._get_kiwi()
+        if kiwi is None:
+            return [text.split() for text in texts]
+
+        with self._lock:
+            return [[token.form for token in tokens] for tokens in kiwi.tokenize(iter(texts))]
+
+    def tokenize_tagged(self, texts: List[str]) -> List[List[Tuple[str, str]]]:
+        """
+        텍스트 리스트를 (형태소 form, 품사 태그) 리스트로 일괄 변환
+
+        Args:
+            texts: 분석할 텍스트 리스트
+
+        Returns:
+            List[List[Tuple[str, str]]]: 텍스트별 (form, tag) 리스트
+            (Kiwi 없으면 공백 분리 단어를 일반 명사(NNG)로 취급)
+        """
+        if not texts:
+            return []
+
+        kiwi = self._get_kiwi()
+        if kiwi is None:
+            return [[(word, 'NNG') for word in text.split()] for text in texts]
+
+        with self._lock:
+            return [[(token.form, token.tag) for token in tokens] for tokens in kiwi.tokenize(iter(texts))]
+
+
+# 싱글톤 인스턴스
+_tokenizer_instance: Optional[TokenizerService] = None
+_tokenizer_lock = threading.Lock()
+
+
+def get_tokenizer_service() -> TokenizerService:
+    """Tokenizer Service 싱글톤 인스턴스 반환"""
+    global _tokenizer_instance
+    with _tokenizer_lock:
+        if _tokenizer_instance is None:
+            # 설정은 모델을 처음 로드할 때 읽음 (분석기 생성만으로 설정 검증이 일어나지 않도록)
+            _tokenizer_instance = TokenizerService()
+        return _tokenizer_instance
@@ -2,10 +2,27 @@
 Turn-Taking Analysis
 Analyzes conversation balance and dynamics
 """
-from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple, Optional
 import numpy as np
-from ..models.schemas import TurnTakingAnalysis
+from ..models.schemas import ParticipantTurnStats, TurnTakingAnalysis
+from .file_processors.message_table import MessageTable
+from .quantile_sketch import QuantileSketch
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 응답 시간으로 인정하는 최대 간격 (1시간, 마이크로초)
+_MAX_RESPONSE_GAP_US = 3600 * 1_000_000
+
+
+class EncodedMessages(NamedTuple):
+    """메시지 리스트를 한 번에 변환한 배열들"""
+    users: list  # 등장 순서의 발신자
+    codes: np.ndarray  # 발신자 정수 코드 (int64)
+    lengths: np.ndarray  # 메시지 길이 (int64)
+    times_us: np.ndarray  # epoch 마이크로초 (int64, 타임스탬프 없으면 0)
+    has_time: np.ndarray  # 타임스탬프 유무 (bool)
 
 
 class TurnTakingAnalyzer:
@@ -14,9 +31,12 @@ class TurnTakingAnalyzer:
 
     대화의 균형, 응답 시간, 메시지 길이 등을 분석하여
     대화의 건강성을 평가합니다.
+
+    메시지는 한 번만 순회해 발신자 코드 / epoch 마이크로초 배열로 바꾸고,
+    이후 계산은 NumPy 배열 연산으로 처리합니다.
     """
 
-    def analyze_conversation(self, messages: list[dict]) -> TurnTakingAnalysis:
+    def analyze_conversation(self, messages: list[dict] | MessageTable) -> TurnTakingAnalysis:
         """
         대화 턴테이킹 분석
 
@@ -35,80 +55,175 @@ class TurnTakingAnalyzer:
                 interruption_rate=0.0
             )
 
-        # 사용자별 메시지 통계
-        user_stats = defaultdict(lambda: {
-            'count': 0,
-            'total_length': 0,
-            'timestamps': []
-        })
-
-        for msg in messages:
-            sender = msg['sender_id']
-            user_stats[sender]['count'] += 1
-            user_stats[sender]['total_length'] += len(msg.get('content', ''))
-            if 'timestamp' in msg:
-                ts = msg['timestamp']
-                if isinstance(ts, str):
-                    ts = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                user_stats[sender]['timestamps'].append(ts)
-
-        # 두 사용자 확인
-        users = list(user_stats.keys())
-        if len(users) != 2:
+        encoded = self.encode_messages(messages)
+
+        # 참여자 확인 (혼자 대화하는 경우 기본값)
+        n_users = len(encoded.users)
+        if n_users < 2:
             return TurnTakingAnalysis(
                 balance_score=50.0,
                 turn_ratio=0.5,
-                avg_response_time=0.0
+                avg_response_time=0.0,
+                interruption_rate=0.0
             )
 
-        # 1. 턴 비율 계산
-        user_a_count = user_stats[users[0]]['count']
-        user_b_count = user_stats[users[1]]['count']
-        total_count = user_a_count + user_b_count
-
-        turn_ratio = user_a_count / total_count if total_count > 0 else 0.5
+        codes = encoded.codes
+        total_count = len(codes)
 
-        # 2. 균형 점수 계산 (0-100)
-        # 완벽한 균형(50:50)에서 벗어날수록 점수 감소
-        balance_score = 100 - abs(50 - turn_ratio * 100) * 2
-        balance_score = max(0, min(100, balance_score))
+        # 1~2. 턴 비율 / 균형 점수
+        turn_ratio, balance_score = self._balance(np.bincount(codes, minlength=n_users))
 
         # 3. 평균 응답 시간 계산 (초 단위)
-        response_times = []
-        for i in range(1, len(messages)):
-            prev_msg = messages[i - 1]
-            curr_msg = messages[i]
-
-            # 다른 사람이 응답한 경우만 계산
-            if prev_msg['sender_id'] != curr_msg['sender_id']:
-                if 'timestamp' in prev_msg and 'timestamp' in curr_msg:
-                    prev_ts = prev_msg['timestamp']
-                    curr_ts = curr_msg['timestamp']
-
-                    if isinstance(prev_ts, str):
-                        prev_ts = datetime.fromisoformat(prev_ts.replace('Z', '+00:00'))
-                    if isinstance(curr_ts, str):
-                        curr_ts = datetime.fromisoformat(curr_ts.replace('Z', '+00:00'))
-
-                    time_diff = (curr_ts - prev_ts).total_seconds()
-                    if 0 < time_diff < 3600:  # 1시간 이내만 계산 (비정상적 지연 제외)
-                        response_times.append(time_diff)
-
-        avg_response_time = np.mean(response_times) if response_times else 0.0
+        # 다른 사람이 응답한 경우만, 1시간 이내만 계산 (비정상적 지연 제외)
+        response_gaps, _ = self._response_gaps(encoded)
+        avg_response_time = np.mean(response_gaps / 1e6) if len(response_gaps) else 0.0
 
         # 4. 인터럽션 비율 계산 (연속 메시지)
-        interruptions = 0
-        for i in range(1, len(messages)):
-            if messages[i]['sender_id'] == messages[i - 1]['sender_id']:
-                interruptions += 1
-
-        interruption_rate = interruptions / len(messages) if len(messages) > 0 else 0.0
+        interruptions = int(np.count_nonzero(codes[1:] == codes[:-1]))
+        interruption_rate = interruptions / total_count
 
         return TurnTakingAnalysis(
             balance_score=round(balance_score, 2),
             turn_ratio=round(turn_ratio, 3),
             avg_response_time=round(avg_response_time, 2),
-            interruption_rate=round(interruption_rate, 3)
+            interruption_rate=round(interruption_rate, 3),
+            participants=self._participant_stats(encoded)
+        )
+
+    @staticmethod
+    def _balance(counts: np.ndarray) -> tuple[float, float]:
+        """
+        참여자별 메시지 수로 턴 비율 / 균형 점수 계산 (참여자 2명 이상)
+
+        Returns:
+            tuple: (첫 번째 참여자의 메시지 비율, 균형 점수 0-100)
+        """
+        n_users = len(counts)
+        total_count = int(counts.sum())
+
+        # 턴 비율 (첫 번째 참여자의 메시지 비율)
+        turn_ratio = int(counts[0]) / total_count
+
+        # 균형 점수: 완벽한 균형(1/N씩)에서 가장 많이 벗어난 참여자 기준으로 감소
+        # (2명이면 두 참여자의 편차가 같으므로 100 - |50 - turn_ratio * 100| * 2)
+        if n_users == 2:
+            deviation = abs(50 - turn_ratio * 100)
+        else:
+            deviation = float(np.abs(100 / n_users - counts / total_count * 100).max())
+        balance_score = 100 - deviation * n_users / (n_users - 1)
+        return turn_ratio, max(0, min(100, balance_score))
+
+    def encode_messages(self, messages: list[dict] | MessageTable) -> EncodedMessages:
+        """
+        메시지를 한 번 순회해 발신자 코드 / 길이 / epoch 마이크로초 배열로 변환
+
+        Args:
+            messages: [{sender_id, content, timestamp}, ...] 형태의 메시지 리스트
+                또는 MessageTable (파일 업로드 파싱 결과, 배열을 그대로 사용)
+
+        Returns:
+            EncodedMessages: 변환된 배열들
+        """
+        if isinstance(messages, MessageTable):
+            return self._encode_table(messages)
+
+        index: dict = {}
+        codes = [index.setdefault(msg['sender_id'], len(index)) for msg in messages]
+        lengths = [len(msg.get('content', '')) for msg in messages]
+        timestamps = [msg.get('timestamp') for msg in messages]
+        has_time = np.fromiter((ts is not None for ts in timestamps), dtype=bool, count=len(messages))
+        times_us = np.fromiter(
+            (self._epoch_microseconds(ts) if ts is not None else 0 for ts in timestamps),
+            dtype=np.int64,
+            count=len(messages),
+        )
+
+        return EncodedMessages(
+            list(index),
+            np.array(codes, dtype=np.int64),
+            np.array(lengths, dtype=np.int64),
+            times_us,
+            has_time,
+        )
+
+    @staticmethod
+    def _encode_table(table: MessageTable) -> EncodedMessages:
+        """MessageTable 컬럼 → EncodedMessages (발신자 이름이 sender_id 역할)"""
+        # 슬라이스 등으로 사전에만 남은 발신자가 없도록 등장 순서대로 코드를 다시 매김
+        present, first_seen, inverse = np.unique(table.sender_codes, return_index=True, return_inverse=True)
+        order = np.argsort(first_seen, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        has_time = table.has_timestamp
+        return EncodedMessages(
+            [table.senders[code] for code in present[order].tolist()],
+            rank[inverse].astype(np.int64),
+            table.lengths,
+            np.where(has_time, table.timestamps, 0),
+            has_time,
+        )
+
+    @staticmethod
+    def _epoch_microseconds(timestamp) -> int:
+        """타임스탬프 → epoch 마이크로초 (정수 연산이라 timedelta 차이와 정확히 일치)"""
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        if timestamp.tzinfo is None:
+            # naive 타임스탬프끼리의 차이는 UTC로 간주해도 동일
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return (timestamp - _EPOCH) // _MICROSECOND
+
+    def _response_gaps(self, encoded: EncodedMessages) -> tuple[np.ndarray, np.ndarray]:
+        """
+        발신자가 바뀐 지점의 응답 간격 (마이크로초, 0 < 간격 < 1시간)
+
+        Returns:
+            tuple: (응답 간격 배열, 응답한 사람의 발신자 코드 배열)
+        """
+        codes = encoded.codes
+        gaps = np.diff(encoded.times_us)
+        valid = (
+            (codes[1:] != codes[:-1])
+            & encoded.has_time[1:] & encoded.has_time[:-1]
+            & (gaps > 0) & (gaps < _MAX_RESPONSE_GAP_US)
+        )
+        return gaps[valid], codes[1:][valid]
+
+    def participant_stats(self, messages: list[dict] | MessageTable) -> list[ParticipantTurnStats]:
+        """
+        참여자별 턴테이킹 통계 (참여자 수 제한 없음)
+
+        Args:
+            messages: [{sender_id, content, timestamp}, ...] 형태의 메시지 리스트 (시간순)
+
+        Returns:
+            list[ParticipantTurnStats]: 등장 순서의 참여자별 통계
+        """
+        return self._participant_stats(self.encode_messages(messages))
+
+    def _participant_stats(self, encoded: EncodedMessages) -> list[ParticipantTurnStats]:
+        users = encoded.users
+        if not users:
+            return []
+
+        codes = encoded.codes
+        n_users = len(users)
+
+        message_counts = np.bincount(codes, minlength=n_users)
+        total_lengths = np.bincount(codes, weights=encoded.lengths, minlength=n_users)
+
+        # 턴 = 발신자가 바뀌는 지점에서 시작
+        turn_start = np.concatenate([[True], codes[1:] != codes[:-1]])
+        turn_counts = np.bincount(codes[turn_start], minlength=n_users)
+
+        # 응답 시간: 응답한 사람 기준
+        gaps, responders = self._response_gaps(encoded)
+        response_totals = np.bincount(responders, weights=gaps / 1e6, minlength=n_users)
+        response_counts = np.bincount(responders, minlength=n_users)
+
+        return _build_participants(
+            users, message_counts, total_lengths, turn_counts, response_totals, response_counts
         )
 
     def get_balance_interpretation(self, balance_score: float) -> str:
@@ -154,3 +269,174 @@ class TurnTakingAnalyzer:
             return "다소 느린 응답 - 바쁘신가요?"
         else:
             return "매우 느린 응답 - 더 자주 대화해보세요."
+
+
+def _build_participants(
+    users: list,
+    message_counts,
+    total_lengths,
+    turn_counts,
+    response_totals,
+    response_counts,
+) -> list[ParticipantTurnStats]:
+    """참여자별 집계값 → ParticipantTurnStats 리스트 (response_totals는 초 단위)"""
+    total_messages = int(sum(message_counts))
+    return [
+        ParticipantTurnStats(
+            sender_id=str(user),
+            message_count=int(message_counts[i]),
+            message_share=round(float(message_counts[i] / total_messages), 3),
+            turn_count=int(turn_counts[i]),
+            avg_message_length=round(float(total_lengths[i] / message_counts[i]), 2),
+            avg_response_time=round(float(response_totals[i] / response_counts[i]), 2)
+            if response_counts[i] else 0.0,
+        )
+        for i, user in enumerate(users)
+    ]
+
+
+class TurnTakingAccumulator:
+    """
+    스트리밍 턴테이킹 누적기
+
+    메시지를 1건씩 O(1)로 반영하고, 언제든 TurnTakingAnalysis 스냅샷을 만들 수 있습니다.
+    (TurnTakingAnalyzer.analyze_conversation과 같은 규칙)
+    상태는 to_dict()로 JSON 저장 후 from_dict()로 복원해 커플별로 이어서 누적합니다.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.senders: list = []  # 등장 순서
+        self._index: dict = {}
+        self.message_counts: list[int] = []
+        self.total_lengths: list[int] = []
+        self.turn_counts: list[int] = []
+        self.response_totals_us: list[int] = []
+        self.response_counts: list[int] = []
+
+        self.total_messages = 0
+        self.interruptions = 0
+        self.last_sender = None
+        self.last_time_us: Optional[int] = None
+
+        # 응답 시간(초) 분위수 스케치
+        self.response_sketch = QuantileSketch(relative_accuracy)
+
+    def _sender_code(self, sender) -> int:
+        code = self._index.get(sender)
+        if code is None:
+            code = self._index[sender] = len(self.senders)
+            self.senders.append(sender)
+            for values in (self.message_counts, self.total_lengths, self.turn_counts,
+                           self.response_totals_us, self.response_counts):
+                values.append(0)
+        return code
+
+    def add(self, message: dict):
+        """
+        메시지 1건 반영 (시간순으로 호출)
+
+        Args:
+            message: {sender_id, content, timestamp} 형태의 메시지
+        """
+        sender = message['sender_id']
+        code = self._sender_code(sender)
+        ts = message.get('timestamp')
+        time_us = TurnTakingAnalyzer._epoch_microseconds(ts) if ts is not None else None
+
+        self.message_counts[code] += 1
+        self.total_lengths[code] += len(message.get('content', ''))
+
+        if self.total_messages and sender == self.last_sender:
+            self.interruptions += 1
+        else:
+            self.turn_counts[code] += 1
+
+            # 다른 사람 메시지에 대한 응답 (1시간 이내만)
+            if self.total_messages and time_us is not None and self.last_time_us is not None:
+                gap = time_us - self.last_time_us
+                if 0 < gap < _MAX_RESPONSE_GAP_US:
+                    self.response_totals_us[code] += gap
+                    self.response_counts[code] += 1
+                    self.response_sketch.add(gap / 1e6)
+
+        self.total_messages += 1
+        self.last_sender = sender
+        self.last_time_us = time_us
+
+    def add_many(self, messages: list[dict]):
+        """여러 메시지를 순서대로 반영"""
+        for message in messages:
+            self.add(message)
+
+    def snapshot(self) -> TurnTakingAnalysis:
+        """
+        지금까지 반영된 메시지 기준 턴테이킹 분석 결과
+
+        Returns:
+            TurnTakingAnalysis: 턴테이킹 분석 결과 (참여자별 통계 포함)
+        """
+        if self.total_messages < 2 or len(self.senders) < 2:
+            return TurnTakingAnalysis(
+                balance_score=50.0,
+                turn_ratio=0.5,
+                avg_response_time=0.0,
+                interruption_rate=0.0
+            )
+
+        turn_ratio, balance_score = TurnTakingAnalyzer._balance(np.array(self.message_counts))
+
+        response_count = sum(self.response_counts)
+        avg_response_time = (
+            sum(self.response_totals_us) / 1e6 / response_count if response_count else 0.0
+        )
+
+        return TurnTakingAnalysis(
+            balance_score=round(balance_score, 2),
+            turn_ratio=round(turn_ratio, 3),
+            avg_response_time=round(avg_response_time, 2),
+            interruption_rate=round(self.interruptions / self.total_messages, 3),
+            participants=_build_participants(
+                self.senders,
+                self.message_counts,
+                self.total_lengths,
+                self.turn_counts,
+                [total / 1e6 for total in self.response_totals_us],
+                self.response_counts,
+            )
+        )
+
+    def response_time_quantile(self, q: float) -> Optional[float]:
+        """응답 시간 분위수 추정 (초, 응답이 없으면 None)"""
+        return self.response_sketch.quantile(q)
+
+    def to_dict(self) -> dict:
+        """JSON 저장용 상태"""
+        return {
+            'senders': [str(sender) for sender in self.senders],
+            'message_counts': self.message_counts,
+            'total_lengths': self.total_lengths,
+            'turn_counts': self.turn_counts,
+            'response_totals_us': self.response_totals_us,
+            'response_counts': self.response_counts,
+            'total_messages': self.total_messages,
+            'interruptions': self.interruptions,
+            'last_sender': None if self.last_sender is None else str(self.last_sender),
+            'last_time_us': self.last_time_us,
+            'response_sketch': self.response_sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TurnTakingAccumulator':
+        """to_dict 결과로부터 복원"""
+        accumulator = cls()
+        accumulator.senders = list(data.get('senders', []))
+        accumulator._index = {sender: i for i, sender in enumerate(accumulator.senders)}
+        for field in ('message_counts', 'total_lengths', 'turn_counts', 'response_totals_us', 'response_counts'):
+            setattr(accumulator, field, [int(value) for value in data.get(field, [])])
+        accumulator.total_messages = data.get('total_messages', 0)
+        accumulator.interruptions = data.get('interruptions', 0)
+        accumulator.last_sender = data.get('last_sender')
+        accumulator.last_time_us = data.get('last_time_us')
+        if 'response_sketch' in data:
+            accumulator.response_sketch = QuantileSketch.from_dict(data['response_sketch'])
+        return accumulator
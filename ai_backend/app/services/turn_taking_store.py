@@ -0,0 +1,112 @@
+"""
+Turn-Taking State Store
+
+커플별 TurnTakingAccumulator 상태를 저장해 두고, 일별 배치가 새 메시지만 이어서 반영합니다.
+누적 턴테이킹 통계와 응답 시간 분위수(스케치)를 과거 메시지를 다시 읽지 않고 조회할 수 있습니다.
+
+누적기는 시간순 입력을 전제로 하므로 마지막으로 반영한 메시지 시각(last_message_at)과
+그 시각의 메시지 ID(last_message_ids)를 함께 저장해, 같은 시각 메시지는 ID로 중복을 거르고
+그보다 이른 메시지(지연 도착)는 순서를 깨지 않도록 건너뜁니다.
+
+저장 테이블: turn_taking_state (supabase/migrations/20251120000005_turn_taking_state.sql)
+"""
+import logging
+from typing import List
+
+from ..core.supabase import get_supabase_client
+from ..models.schemas import TurnTakingAnalysis
+from .turn_taking_analyzer import TurnTakingAccumulator, TurnTakingAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+class TurnTakingStateStore:
+    """turn_taking_state 테이블 기반 누적기 저장소"""
+
+    TABLE = 'turn_taking_state'
+
+    def __init__(self):
+        self.supabase = get_supabase_client()
+
+    def load(self, couple_id: str) -> TurnTakingAccumulator:
+        """저장된 누적기 복원 (없으면 빈 누적기)"""
+        row = self._load_row(couple_id)
+        return TurnTakingAccumulator.from_dict(row['state']) if row else TurnTakingAccumulator()
+
+    def update(self, couple_id: str, messages: List[dict]) -> TurnTakingAccumulator:
+        """
+        저장된 누적기에 아직 반영되지 않은 메시지만 시간순으로 더하고 저장
+
+        Args:
+            couple_id: 커플 ID
+            messages: [{id, sender_id, content, created_at}, ...] 형태의 메시지 리스트
+
+        Returns:
+            TurnTakingAccumulator: 갱신된 누적기
+        """
+        row = self._load_row(couple_id)
+        accumulator = TurnTakingAccumulator.from_dict(row['state']) if row else TurnTakingAccumulator()
+        watermark = accumulator.last_time_us
+        watermark_ids = set(row.get('last_message_ids') or []) if row else set()
+
+        timed = sorted(
+            ((TurnTakingAnalyzer._epoch_microseconds(msg['created_at']), msg) for msg in messages),
+            key=lambda item: item[0],
+        )
+        fresh = [
+            (time_us, msg) for time_us, msg in timed
+            if watermark is None
+            or time_us > watermark
+            or (time_us == watermark and str(msg['id']) not in watermark_ids)
+        ]
+        if not fresh:
+            return accumulator
+
+        for time_us, msg in fresh:
+            accumulator.add({
+                'sender_id': msg['sender_id'],
+                'content': msg.get('content') or '',
+                'timestamp': msg['created_at'],
+            })
+
+        last_time_us = fresh[-1][0]
+        last_ids = [str(msg['id']) for time_us, msg in fresh if time_us == last_time_us]
+        if last_time_us == watermark:
+            last_ids += watermark_ids
+
+        self.supabase.table(self.TABLE)\
+            .upsert({
+                'couple_id': couple_id,
+                'state': accumulator.to_dict(),
+                'message_count': accumulator.total_messages,
+                'last_message_at': fresh[-1][1]['created_at'],
+                'last_message_ids': sorted(set(last_ids)),
+            }, on_conflict='couple_id')\
+            .execute()
+
+        logger.info(f"🔁 Turn-taking state updated for couple {couple_id}: {len(fresh)} new messages")
+        return accumulator
+
+    def snapshot(self, couple_id: str) -> TurnTakingAnalysis:
+        """누적 턴테이킹 분석 결과 (메시지 재조회 없음)"""
+        return self.load(couple_id).snapshot()
+
+    def _load_row(self, couple_id: str) -> dict | None:
+        response = self.supabase.table(self.TABLE)\
+            .select('*')\
+            .eq('couple_id', couple_id)\
+            .limit(1)\
+            .execute()
+        return response.data[0] if response.data else None
+
+
+# 싱글톤 인스턴스
+_store_instance = None
+
+
+def get_turn_taking_store() -> TurnTakingStateStore:
+    """Turn-Taking State Store 싱글톤 인스턴스 반환"""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = TurnTakingStateStore()
+    return _store_instance
@@ -0,0 +1,126 @@
+"""
+타임스탬프 파싱 벤치마크
+
+datetime.strptime과 app/services/file_processors/timestamp_parser.py의 파서를 비교합니다.
+같은 입력에 대해 결과가 같은지도 함께 확인합니다.
+
+사용법 (ai_backend 디렉토리에서):
+    python scripts/benchmark_timestamp_parser.py [--rows 200000] [--days 730]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.file_processors.timestamp_parser import (  # noqa: E402
+    clear_caches,
+    kakao_datetime,
+    parse_csv_datetime,
+    parse_csv_datetime_column,
+    parse_english_date,
+    parse_korean_date,
+)
+
+
+def generate_timestamps(rows: int, days: int) -> list[datetime]:
+    """대화처럼 시간순으로 증가하는 타임스탬프 (하루 여러 메시지 → 날짜 부분이 반복됨)"""
+    start = datetime(2023, 1, 1)
+    span = days * 86400
+    return sorted(start + timedelta(seconds=random.randrange(span)) for _ in range(rows))
+
+
+def timed(label: str, func, baseline: float | None = None):
+    clear_caches()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    speedup = f"  ({baseline / elapsed:.1f}x)" if baseline else ""
+    print(f"   {label:<34} {elapsed * 1000:9.1f} ms{speedup}")
+    return result, elapsed
+
+
+def bench_csv(timestamps: list[datetime]):
+    values = [ts.strftime('%Y-%m-%d %H:%M:%S') for ts in timestamps]
+    print(f"📊 CSV 'YYYY-MM-DD HH:MM:SS' ({len(values)} rows)")
+
+    expected, base = timed("strptime", lambda: [datetime.strptime(v, '%Y-%m-%d %H:%M:%S') for v in values])
+    fast, _ = timed("parse_csv_datetime", lambda: [parse_csv_datetime(v) for v in values], base)
+    column, _ = timed(
+        "parse_csv_datetime_column",
+        lambda: parse_csv_datetime_column(values).astype('datetime64[us]').tolist(),
+        base,
+    )
+    assert fast == expected and column == expected, "CSV parser results differ from strptime"
+
+
+def bench_english(timestamps: list[datetime]):
+    # "January 3, 2022 at 5:59 PM" 줄에서 잘라낸 날짜 / 시각 부분
+    parts = [
+        (f"{ts:%B} {ts.day}, {ts.year}", int(f"{ts:%I}"), ts.minute, ts.hour >= 12)
+        for ts in timestamps
+    ]
+    print(f"📊 English 'Month D, YYYY h:mm AM' ({len(parts)} rows)")
+
+    def with_strptime():
+        return [
+            datetime.strptime(f"{date_str} {hour}:{minute:02d} {'PM' if pm else 'AM'}", "%B %d, %Y %I:%M %p")
+            for date_str, hour, minute, pm in parts
+        ]
+
+    def with_parser():
+        return [
+            kakao_datetime(parse_english_date(date_str), hour, minute, pm)
+            for date_str, hour, minute, pm in parts
+        ]
+
+    expected, base = timed("strptime", with_strptime)
+    fast, _ = timed("parse_english_date + kakao_datetime", with_parser, base)
+    assert fast == expected, "English parser results differ from strptime"
+
+
+def bench_korean(timestamps: list[datetime]):
+    parts = [
+        (f"{ts.year}년 {ts.month}월 {ts.day}일", int(f"{ts:%I}"), ts.minute, ts.hour >= 12)
+        for ts in timestamps
+    ]
+    print(f"📊 Korean 'YYYY년 M월 D일 오후 h:mm' ({len(parts)} rows)")
+
+    def with_strptime():
+        return [
+            datetime.strptime(f"{date_str} {hour}:{minute:02d} {'PM' if pm else 'AM'}", "%Y년 %m월 %d일 %I:%M %p")
+            for date_str, hour, minute, pm in parts
+        ]
+
+    def with_parser():
+        return [
+            kakao_datetime(parse_korean_date(date_str), hour, minute, pm)
+            for date_str, hour, minute, pm in parts
+        ]
+
+    expected, base = timed("strptime", with_strptime)
+    fast, _ = timed("parse_korean_date + kakao_datetime", with_parser, base)
+    assert fast == expected, "Korean parser results differ from strptime"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Timestamp parsing benchmark")
+    parser.add_argument('--rows', type=int, default=200_000, help="타임스탬프 수")
+    parser.add_argument('--days', type=int, default=730, help="대화 기간 (일)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    timestamps = generate_timestamps(args.rows, args.days)
+
+    bench_csv(timestamps)
+    bench_english(timestamps)
+    bench_korean(timestamps)
+    print("✅ All parsers match strptime")
+
+
+if __name__ == '__main__':
+    main()
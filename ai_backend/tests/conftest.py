@@ -0,0 +1,143 @@
+"""
+pytest 공통 설정
+
+Settings는 SUPABASE_URL / SUPABASE_KEY가 필수이므로 .env 없이도 테스트가 돌도록 더미 값을 넣습니다.
+(외부 API는 각 테스트에서 mock으로 대체, Supabase는 메모리 대역 fake_supabase 사용)
+"""
+import os
+
+import pytest
+
+os.environ.setdefault('SUPABASE_URL', 'http://localhost:54321')
+os.environ.setdefault('SUPABASE_KEY', 'test-key')
+
+
+class FakeQuery:
+    """supabase-py 쿼리 빌더의 메모리 구현 (테스트에서 쓰는 필터만 지원)"""
+
+    def __init__(self, db: 'FakeSupabase', table: str):
+        self.db = db
+        self.table = table
+        self.filters = []
+        self.order_by = None
+        self.max_rows = None
+        self.pending_upsert = None
+        self.pending_delete = False
+        self.row_range = None
+
+    def select(self, columns='*'):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) == str(value))
+        return self
+
+    def in_(self, column, values):
+        values = {str(value) for value in values}
+        self.filters.append(lambda row: str(row.get(column)) in values)
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and str(row[column]) >= str(value))
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and str(row[column]) <= str(value))
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and str(row[column]) > str(value))
+        return self
+
+    def lt(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and str(row[column]) < str(value))
+        return self
+
+    def order(self, column, desc=False):
+        self.order_by = (column, desc)
+        return self
+
+    def limit(self, count):
+        self.max_rows = count
+        return self
+
+    def range(self, start, end):
+        self.row_range = (start, end)
+        return self
+
+    def delete(self):
+        self.pending_delete = True
+        return self
+
+    def upsert(self, rows, on_conflict=''):
+        self.pending_upsert = (rows if isinstance(rows, list) else [rows], on_conflict.split(','))
+        return self
+
+    def execute(self):
+        rows = self.db.tables.setdefault(self.table, [])
+        if self.pending_upsert is not None:
+            new_rows, keys = self.pending_upsert
+            for new_row in new_rows:
+                match = next((row for row in rows if all(row.get(k) == new_row.get(k) for k in keys)), None)
+                if match is None:
+                    rows.append(dict(new_row))
+                else:
+                    match.update(new_row)
+            self.db.upserts.append((self.table, new_rows))
+            return FakeResponse(new_rows)
+
+        if self.pending_delete:
+            deleted = [row for row in rows if all(check(row) for check in self.filters)]
+            rows[:] = [row for row in rows if row not in deleted]
+            return FakeResponse(deleted)
+
+        result = [dict(row) for row in rows if all(check(row) for check in self.filters)]
+        if self.order_by:
+            column, desc = self.order_by
+            result.sort(key=lambda row: str(row.get(column)), reverse=desc)
+        if self.row_range is not None:
+            result = result[self.row_range[0]:self.row_range[1] + 1]
+        if self.max_rows is not None:
+            result = result[:self.max_rows]
+        return FakeResponse(result)
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeRpc:
+    def __init__(self, db: 'FakeSupabase', name: str, params: dict):
+        self.db = db
+        self.name = name
+        self.params = params
+
+    def execute(self):
+        self.db.rpc_calls.append((self.name, self.params))
+        return FakeResponse(self.db.functions[self.name](self.db, **self.params))
+
+
+class FakeSupabase:
+    """
+    테이블 이름 → 행 리스트를 메모리에 두는 Supabase 클라이언트 대역
+
+    RPC는 functions[이름] = (db, **params) 함수로 등록해 흉내냅니다.
+    """
+
+    def __init__(self):
+        self.tables = {}
+        self.upserts = []
+        self.functions = {}
+        self.rpc_calls = []
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rpc(self, name: str, params: dict) -> FakeRpc:
+        return FakeRpc(self, name, params)
+
+
+@pytest.fixture
+def fake_supabase():
+    return FakeSupabase()
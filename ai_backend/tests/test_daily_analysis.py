@@ -0,0 +1,47 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.schemas import EmotionScore
+from app.schedulers import daily_analysis
+
+
+def _score(emotion):
+    return EmotionScore(emotion=emotion, confidence=0.9, all_scores={emotion: 0.9})
+
+
+def test_filled_sentiment_is_saved_in_one_upsert(monkeypatch, fake_supabase):
+    fake_supabase.tables['conversations'] = [
+        {'id': 1, 'couple_id': 'couple', 'content': '오늘 너무 좋았어', 'sentiment': None},
+        {'id': 2, 'couple_id': 'couple', 'content': '나도', 'sentiment': '기쁨'},
+        {'id': 3, 'couple_id': 'couple', 'content': '근데 피곤하다', 'sentiment': None},
+        {'id': 4, 'couple_id': 'couple', 'content': '', 'sentiment': None},
+    ]
+    analyzer = MagicMock()
+    analyzer.analyze_conversation_emotions = AsyncMock(return_value=[_score('기쁨'), _score('피곤')])
+    monkeypatch.setattr(daily_analysis, 'get_emotion_analyzer', lambda: analyzer)
+
+    messages = fake_supabase.table('conversations').select('*').execute().data
+    filled = asyncio.run(daily_analysis.fill_missing_sentiment(messages))
+    daily_analysis.save_filled_sentiment(fake_supabase, filled)
+
+    # 맥락으로는 전체 대화, 분석 대상은 비어 있는 메시지만
+    assert analyzer.analyze_conversation_emotions.await_args.args == (messages, [0, 2])
+    assert fake_supabase.upserts == [('conversations', filled)]
+    assert [row['sentiment'] for row in fake_supabase.tables['conversations']] == ['기쁨', '기쁨', '피곤', None]
+
+    # 저장된 뒤에는 다시 분석하지 않음
+    messages = fake_supabase.table('conversations').select('*').execute().data
+    assert asyncio.run(daily_analysis.fill_missing_sentiment(messages)) == []
+    assert analyzer.analyze_conversation_emotions.await_count == 1
+
+
+def test_failed_analysis_saves_nothing(monkeypatch, fake_supabase):
+    analyzer = MagicMock()
+    analyzer.analyze_conversation_emotions = AsyncMock(side_effect=RuntimeError('quota'))
+    monkeypatch.setattr(daily_analysis, 'get_emotion_analyzer', lambda: analyzer)
+
+    messages = [{'id': 1, 'content': '안녕', 'sentiment': None}]
+    filled = asyncio.run(daily_analysis.fill_missing_sentiment(messages))
+    daily_analysis.save_filled_sentiment(fake_supabase, filled)
+
+    assert filled == [] and fake_supabase.upserts == []
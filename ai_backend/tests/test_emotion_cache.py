@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+from app.models.schemas import EmotionScore
+from app.services.emotion_cache import (
+    EmotionResultCache,
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    make_cache_key,
+)
+
+
+def _score(emotion='기쁨'):
+    return EmotionScore(emotion=emotion, confidence=0.9, all_scores={emotion: 0.9})
+
+
+def test_cache_key_normalizes_whitespace():
+    a = make_cache_key('  안녕   하세요 ', 'gemini', 'm', 'v1')
+    b = make_cache_key('안녕 하세요', 'gemini', 'm', 'v1')
+    assert a == b
+    assert a != make_cache_key('안녕 하세요', 'gemini', 'm', 'v2')
+
+
+def test_sqlite_backend_runs_off_event_loop(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / 'cache.db'), ttl_seconds=60)
+    threads = []
+    original = backend._get_sync
+
+    def recording_get(key):
+        threads.append(threading.current_thread())
+        return original(key)
+
+    backend._get_sync = recording_get
+
+    async def run():
+        await backend.set('k', {'a': 1})
+        value = await backend.get('k')
+        await backend.close()
+        return value
+
+    assert asyncio.run(run()) == {'a': 1}
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_sqlite_backend_expires_entries(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / 'cache.db'), ttl_seconds=-1)
+
+    async def run():
+        await backend.set('k', {'a': 1})
+        return await backend.get('k')
+
+    assert asyncio.run(run()) is None
+
+
+def test_tiered_cache_backfills_upper_levels(tmp_path):
+    memory = MemoryCacheBackend(max_entries=10, ttl_seconds=60)
+    sqlite = SQLiteCacheBackend(str(tmp_path / 'cache.db'), ttl_seconds=60)
+    cache = EmotionResultCache([memory, sqlite])
+
+    async def run():
+        await sqlite.set('k', _score().model_dump())
+        first = await cache.get('k')
+        assert await memory.get('k') is not None
+        second = await cache.get('k')
+        missing = await cache.get('other')
+        return first, second, missing
+
+    first, second, missing = asyncio.run(run())
+    assert first == second == _score()
+    assert missing is None
+    assert cache.stats()['hits'] == {'memory': 1, 'sqlite': 1}
+    assert cache.stats()['misses'] == 1
+
+
+def test_memory_backend_evicts_least_recently_used():
+    memory = MemoryCacheBackend(max_entries=2, ttl_seconds=60)
+
+    async def run():
+        await memory.set('a', {'v': 1})
+        await memory.set('b', {'v': 2})
+        await memory.get('a')
+        await memory.set('c', {'v': 3})
+        return await memory.get('a'), await memory.get('b')
+
+    assert asyncio.run(run()) == ({'v': 1}, None)
+    assert memory.evictions == 1
@@ -0,0 +1,120 @@
+import asyncio
+import json
+import re
+
+import pytest
+
+from app.core.config import get_settings
+from app.models.schemas import EmotionScore
+from app.services import emotion_hedging
+from app.services.emotion_analyzer import LLMEmotionAnalyzer
+from app.services.emotion_hedging import HedgeBudget, HedgedEmotionAnalyzer, hedging_stats
+from app.services.provider_executor import ProviderExecutor
+from app.services.rate_limiter import ProviderRateLimiter
+
+TARGET_PATTERN = re.compile(r'^\[(\d+)\]', re.MULTILINE)
+
+
+class FakeLLMAnalyzer(LLMEmotionAnalyzer):
+    """실행기를 거쳐 호출되고, 제공자마다 다른 감정을 돌려주는 가짜 LLM 분석기"""
+
+    model_name = 'fake'
+
+    def __init__(self, provider, executor, emotion, delay_for):
+        self.provider = provider
+        self.executor = executor
+        self.emotion = emotion
+        self.delay_for = delay_for
+        self.calls = 0
+
+    async def _call(self, prompt, result):
+        self.calls += 1
+
+        async def call():
+            await asyncio.sleep(self.delay_for(prompt))
+            return result
+
+        return await self.executor.run(self.provider, call)
+
+    async def analyze_emotion(self, text: str) -> EmotionScore:
+        return await self._call(text, self._build_emotion_score({self.emotion: 1.0}))
+
+    async def _generate_batch(self, prompt: str) -> str:
+        results = [{'index': int(i), self.emotion: 1.0} for i in TARGET_PATTERN.findall(prompt)]
+        return await self._call(prompt, json.dumps({'results': results}, ensure_ascii=False))
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = ProviderExecutor(
+        limits={'fake-a': 4, 'fake-b': 4},
+        default_timeout=5.0,
+        rate_limiters={
+            'fake-a': ProviderRateLimiter('fake-a', 6000, 10 ** 9),
+            'fake-b': ProviderRateLimiter('fake-b', 6000, 10 ** 9),
+        },
+    )
+    monkeypatch.setattr(emotion_hedging, 'get_provider_executor', lambda: executor)
+    hedging_stats.clear()
+    return executor
+
+
+def _hedged(executor, primary_delay, budget=10, secondary_delay=lambda prompt: 0.01):
+    primary = FakeLLMAnalyzer('fake-a', executor, '기쁨', primary_delay)
+    secondary = FakeLLMAnalyzer('fake-b', executor, '슬픔', secondary_delay)
+    hedged = HedgedEmotionAnalyzer(primary, [secondary], min_delay=0.05, budget=HedgeBudget(budget))
+    return hedged, primary, secondary
+
+
+def test_only_the_slow_window_is_hedged(executor, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, 'emotion_batch_max_items', 2)
+    monkeypatch.setattr(settings, 'emotion_context_messages', 0)
+
+    messages = [{'sender_id': 'a' if i % 2 else 'b', 'content': f'msg{i}'} for i in range(6)]
+    hedged, primary, secondary = _hedged(executor, lambda prompt: 0.3 if 'msg2' in prompt else 0.01)
+
+    scores = asyncio.run(hedged.analyze_conversation_emotions(messages))
+
+    assert [s.emotion for s in scores] == ['기쁨', '기쁨', '슬픔', '슬픔', '기쁨', '기쁨']
+    assert primary.calls == 3 and secondary.calls == 1
+    assert hedging_stats['fired'] == 1 and hedging_stats['hedge_wins'] == 1
+
+
+def test_rate_limiter_queue_wait_does_not_trigger_hedge(executor):
+    # 10/s 버킷을 비워 두면 첫 요청은 대기열에서 약 0.1초 (hedging 지연 0.05초보다 김)
+    limiter = executor.rate_limiters['fake-a'] = ProviderRateLimiter('fake-a', 600, 10 ** 9)
+    limiter.requests.tokens = 0.0
+    hedged, primary, secondary = _hedged(executor, lambda prompt: 0.01)
+
+    score = asyncio.run(hedged.analyze_emotion('안녕'))
+
+    assert score.emotion == '기쁨'
+    assert secondary.calls == 0 and hedging_stats['fired'] == 0
+
+
+def test_hedges_are_capped_per_window(executor):
+    hedged, primary, secondary = _hedged(
+        executor, lambda prompt: 0.2, budget=1, secondary_delay=lambda prompt: 0.5
+    )
+
+    async def run():
+        return await asyncio.gather(hedged.analyze_emotion('a'), hedged.analyze_emotion('b'))
+
+    scores = asyncio.run(run())
+
+    assert [s.emotion for s in scores] == ['기쁨', '기쁨']
+    assert hedging_stats['fired'] == 1 and hedging_stats['suppressed'] == 1
+
+
+def test_failure_fails_over_to_secondary(executor):
+    hedged, primary, secondary = _hedged(executor, lambda prompt: 0.01)
+
+    async def broken(text):
+        raise ValueError('provider error')
+
+    primary.analyze_emotion = broken
+
+    score = asyncio.run(hedged.analyze_emotion('안녕'))
+    assert score.emotion == '슬픔'
+    assert hedging_stats['failovers'] == 1
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+from app.services.file_processors.kakao_csv_processor import KakaoCsvProcessor
+from app.services.file_processors.kakao_txt_processor import KakaoTxtProcessor
+from app.services.file_processors.parallel_parser import (
+    parse_csv_chunk,
+    parse_in_parallel,
+    parse_txt_chunk,
+    shutdown_parse_executor,
+)
+
+KOREAN_TXT = """딱복 님과 카카오톡 대화
+저장한 날짜 : 2025년 2월 15일 오전 9:00
+
+2025년 2월 14일 오후 2:07, 딱복 🍑 : 소영님 몸은 괜찮으신가여..
+2025년 2월 14일 오후 2:08, 소영 : 네 괜찮아요
+두 번째 줄
+2025년 2월 15일 오전 12:01, 딱복 🍑 : 다행이다
+"""
+
+CSV = """Date,User,Message
+2025-02-14 14:07:00,딱복,"소영님 몸은, 괜찮으신가여.."
+2025-02-14 14:08:00,소영,"네 괜찮아요
+두 번째 줄"
+2025-02-15 00:01:00,딱복,다행이다
+"""
+
+
+@pytest.fixture
+def txt_file(tmp_path):
+    path = tmp_path / 'chat.txt'
+    path.write_text(KOREAN_TXT, encoding='utf-8')
+    return str(path)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / 'chat.csv'
+    path.write_text(CSV, encoding='utf-8')
+    return str(path)
+
+
+def test_txt_raw_text_is_opt_in(txt_file):
+    processor = KakaoTxtProcessor()
+
+    result = asyncio.run(processor.process(txt_file, parallel=False))
+    assert result.success and result.total_messages == 3
+    assert result.raw_text is None
+
+    kept = asyncio.run(processor.process(txt_file, parallel=False, keep_raw_text=True))
+    assert kept.raw_text == KOREAN_TXT
+    assert kept.conversations == result.conversations
+
+
+def test_csv_raw_text_is_opt_in(csv_file):
+    processor = KakaoCsvProcessor()
+
+    result = asyncio.run(processor.process(csv_file, parallel=False))
+    assert result.success and result.total_messages == 3
+    assert result.raw_text is None
+
+    kept = asyncio.run(processor.process(csv_file, parallel=False, keep_raw_text=True))
+    assert kept.raw_text.splitlines()[0] == '[2025-02-14 14:07:00] 딱복: 소영님 몸은, 괜찮으신가여..'
+
+
+def _large_txt(count):
+    lines = ['KakaoTalk 대화', '저장한 날짜 : 2025년 3월 1일 오전 9:00', '']
+    for i in range(count):
+        day = 1 + i // 400
+        hour = 1 + (i // 20) % 12
+        sender = ('딱복 🍑', '소영', '민수')[i % 3]
+        lines.append(f"2025년 2월 {day}일 {'오전' if i % 2 else '오후'} {hour}:{i % 60:02d}, {sender} : 메시지 {i} : 콜론 포함")
+        if i % 7 == 0:
+            lines.append(f"이어지는 줄 {i}")
+    return '\r\n'.join(lines) + '\r\n'
+
+
+def _large_csv(count):
+    rows = ['Date,User,Message']
+    for i in range(count):
+        sender = ('딱복', '소영', '민수')[i % 3]
+        message = f'"줄바꿈\n포함 {i}, ""인용""' + '"' if i % 5 == 0 else f'메시지 {i}'
+        rows.append(f"2025-02-{1 + i // 400:02d} {i % 24:02d}:{i % 60:02d}:00,{sender},{message}")
+    return '\n'.join(rows) + '\n'
+
+
+@pytest.fixture(scope='module', autouse=True)
+def parse_pool():
+    yield
+    shutdown_parse_executor()
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig'])
+def test_txt_chunked_parse_matches_serial(tmp_path, encoding):
+    path = tmp_path / 'large.txt'
+    path.write_bytes(_large_txt(3000).encode(encoding))
+    processor = KakaoTxtProcessor()
+
+    serial = asyncio.run(processor.process(str(path), encoding=encoding, parallel=False))
+    chunked = asyncio.run(processor.process(str(path), encoding=encoding, parallel=True))
+
+    assert serial.total_messages == 3000
+    assert chunked.conversations == serial.conversations
+    assert sorted(chunked.participants) == sorted(serial.participants)
+    assert chunked.date_range == serial.date_range
+
+    # 구간을 더 잘게 나눠도 같은 결과
+    fine = asyncio.run(parse_in_parallel(str(path), parse_txt_chunk, encoding, False, workers=8))
+    assert fine.messages == serial.conversations
+
+
+def test_csv_chunked_parse_matches_serial(tmp_path):
+    path = tmp_path / 'large.csv'
+    path.write_text(_large_csv(3000), encoding='utf-8')
+    processor = KakaoCsvProcessor()
+
+    serial = asyncio.run(processor.process(str(path), parallel=False))
+    chunked = asyncio.run(processor.process(str(path), parallel=True))
+
+    assert serial.total_messages == 3000
+    assert chunked.conversations == serial.conversations
+    assert sorted(chunked.participants) == sorted(serial.participants)
+    assert chunked.date_range == serial.date_range
+
+    fine = asyncio.run(parse_in_parallel(
+        str(path), parse_csv_chunk, 'utf-8-sig', ['Date', 'User', 'Message'], csv_rows=True, workers=8
+    ))
+    assert fine.messages == serial.conversations
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+from app.services.keyphrase_extractor import TextRankKeyphraseExtractor
+
+
+def _noun(form):
+    return (form, 'NNG')
+
+
+def test_build_graph_without_pairs_is_empty():
+    extractor = TextRankKeyphraseExtractor(window=2)
+    # 메시지마다 명사가 하나뿐이면 window 안의 쌍이 없음
+    vocab, tokens = extractor.candidate_tokens([[_noun('영화')], [_noun('파스타')], [_noun('여행')]])
+
+    graph = extractor.build_graph(vocab, tokens)
+    assert graph.indptr.tolist() == [0, 0, 0, 0]
+    assert len(graph.indices) == 0 and len(graph.data) == 0
+
+    scores = extractor.rank(graph)
+    assert np.allclose(scores, 1 / 3)
+    assert len(extractor.extract([[_noun('영화')], [_noun('파스타')], [_noun('여행')]], top_k=2)) <= 2
+
+
+def test_build_graph_counts_adjacent_pairs():
+    extractor = TextRankKeyphraseExtractor(window=2)
+    vocab, tokens = extractor.candidate_tokens([[_noun('강남역'), _noun('파스타')], [_noun('강남역'), _noun('파스타')]])
+
+    graph = extractor.build_graph(vocab, tokens)
+    assert graph.indptr.tolist() == [0, 1, 2]
+    assert graph.indices.tolist() == [1, 0]
+    assert graph.data.tolist() == [2.0, 2.0]
+
+
+@pytest.mark.parametrize('window', [0, 1])
+def test_window_below_two_is_rejected(window):
+    with pytest.raises(ValueError):
+        TextRankKeyphraseExtractor(window=window)
+    with pytest.raises(ValidationError):
+        Settings(textrank_window=1)
@@ -0,0 +1,108 @@
+from collections import Counter
+
+import pytest
+
+from app.services import keyword_extractor
+from app.services.keyword_extractor import GLOBAL_SCOPE, KeywordExtractor, KeywordIndexStore
+
+
+def increment_keyword_df(db, p_scope, p_n_docs, p_last_doc_key, p_df):
+    """20251120000007_keyword_df_increment.sql과 같은 병합"""
+    rows = db.tables.setdefault(KeywordIndexStore.TABLE, [])
+    row = next((row for row in rows if row['scope'] == p_scope), None)
+    if row is None:
+        rows.append({'scope': p_scope, 'n_docs': p_n_docs, 'last_doc_key': p_last_doc_key, 'df': dict(p_df)})
+        return None
+    if p_last_doc_key is not None and row['last_doc_key'] is not None and row['last_doc_key'] >= p_last_doc_key:
+        return None
+    row['n_docs'] += p_n_docs
+    row['last_doc_key'] = max(filter(None, [row['last_doc_key'], p_last_doc_key]), default=None)
+    row['df'] = dict(Counter(row['df']) + Counter(p_df))
+    return None
+
+
+@pytest.fixture
+def db(monkeypatch, fake_supabase):
+    fake_supabase.functions['increment_keyword_df'] = increment_keyword_df
+    monkeypatch.setattr(keyword_extractor, 'get_supabase_client', lambda: fake_supabase)
+    return fake_supabase
+
+
+def _tagged(*nouns):
+    return [[(noun, 'NNG') for noun in nouns]]
+
+
+def _row(db, scope):
+    return next(row for row in db.tables[KeywordIndexStore.TABLE] if row['scope'] == scope)
+
+
+def test_load_failure_is_not_cached_or_saved(db):
+    db.tables[KeywordIndexStore.TABLE] = [{'scope': GLOBAL_SCOPE, 'n_docs': 40, 'last_doc_key': None, 'df': {'영화': 30}}]
+    extractor = KeywordExtractor(KeywordIndexStore(ttl_seconds=600))
+
+    load = extractor.store._load
+    extractor.store._load = lambda scope: None
+    keywords = extractor.extract_and_update('couple', '2025-11-20', ['영화 파스타'], tagged=_tagged('영화', '파스타'))
+    extractor.flush()
+
+    # 색인 없이도 키워드는 반환하지만 DB는 건드리지 않음
+    assert sorted(keywords) == ['영화', '파스타']
+    assert db.rpc_calls == [] and db.upserts == []
+    assert _row(db, GLOBAL_SCOPE)['df'] == {'영화': 30}
+
+    # 다음 호출에서 다시 로드
+    extractor.store._load = load
+    extractor.extract_and_update('couple', '2025-11-20', ['영화 파스타'], tagged=_tagged('영화', '파스타'))
+    extractor.flush()
+    assert _row(db, GLOBAL_SCOPE) == {'scope': GLOBAL_SCOPE, 'n_docs': 41, 'last_doc_key': None, 'df': {'영화': 31, '파스타': 1}}
+    assert _row(db, 'couple')['n_docs'] == 1
+
+
+def test_concurrent_workers_keep_each_others_increments(db):
+    first = KeywordExtractor(KeywordIndexStore(ttl_seconds=600))
+    second = KeywordExtractor(KeywordIndexStore(ttl_seconds=600))
+
+    # 두 워커가 같은 전체 색인을 로드한 뒤 각자 문서를 더함
+    first.store.get(GLOBAL_SCOPE)
+    second.store.get(GLOBAL_SCOPE)
+    first.extract_and_update('a', '2025-11-20', ['영화'], tagged=_tagged('영화', '파스타'))
+    second.extract_and_update('b', '2025-11-20', ['영화'], tagged=_tagged('영화'))
+    second.flush()
+    first.flush()
+
+    assert _row(db, GLOBAL_SCOPE)['n_docs'] == 2
+    assert _row(db, GLOBAL_SCOPE)['df'] == {'영화': 2, '파스타': 1}
+
+    # 같은 날짜 재실행은 반영하지 않음
+    first.extract_and_update('a', '2025-11-20', ['영화'], tagged=_tagged('영화'))
+    first.flush()
+    assert _row(db, 'a')['n_docs'] == 1 and _row(db, GLOBAL_SCOPE)['n_docs'] == 2
+
+
+def test_clean_index_reloads_after_ttl(db):
+    reader = KeywordIndexStore(ttl_seconds=0)
+    writer = KeywordExtractor(KeywordIndexStore(ttl_seconds=600))
+    assert reader.get(GLOBAL_SCOPE).n_docs == 0
+
+    writer.extract_and_update('a', '2025-11-20', ['영화'], tagged=_tagged('영화'))
+    writer.flush()
+
+    # 다른 워커가 저장한 문서가 보임
+    assert reader.idf(GLOBAL_SCOPE, ['영화'])[1] == 1
+    assert reader.get(GLOBAL_SCOPE).document_frequencies(['영화']).tolist() == [1]
+
+
+def test_failed_save_keeps_pending_delta(db):
+    store = KeywordIndexStore(ttl_seconds=0)
+    store.add_document(GLOBAL_SCOPE, ['영화'])
+
+    db.functions['increment_keyword_df'] = lambda db, **params: (_ for _ in ()).throw(RuntimeError('timeout'))
+    with pytest.raises(RuntimeError):
+        store.flush()
+
+    # 저장 대기 색인은 TTL이 지나도 다시 로드하지 않고, 다음 flush에서 다시 보냄
+    assert store.get(GLOBAL_SCOPE).has_pending()
+    db.functions['increment_keyword_df'] = increment_keyword_df
+    store.flush()
+    assert _row(db, GLOBAL_SCOPE)['df'] == {'영화': 1}
+    assert not store.get(GLOBAL_SCOPE).has_pending()
@@ -0,0 +1,44 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.lexicon_emotion_analyzer import LexiconEmotionAnalyzer
+
+
+@pytest.fixture
+def tokenizer():
+    # Kiwi 대신 공백 토크나이저, 호출한 스레드를 기록
+    tokenizer = MagicMock()
+    tokenizer.threads = []
+
+    def tokenize_forms(texts):
+        tokenizer.threads.append(threading.current_thread())
+        return [text.split() for text in texts]
+
+    tokenizer.tokenize_forms.side_effect = tokenize_forms
+    return tokenizer
+
+
+def test_large_batch_is_scored_off_the_event_loop(tokenizer):
+    analyzer = LexiconEmotionAnalyzer(tokenizer=tokenizer)
+    texts = ['사랑 해'] * (LexiconEmotionAnalyzer.THREAD_MIN_TEXTS + 1)
+
+    async def run():
+        return threading.current_thread(), await analyzer.analyze_emotions_batch(texts)
+
+    loop_thread, results = asyncio.run(run())
+    assert tokenizer.threads and tokenizer.threads[0] is not loop_thread
+    assert [score.emotion for score in results] == ['사랑'] * len(texts)
+
+
+def test_small_batch_stays_inline(tokenizer):
+    analyzer = LexiconEmotionAnalyzer(tokenizer=tokenizer)
+
+    async def run():
+        return threading.current_thread(), await analyzer.analyze_emotions_batch(['짜증 나', '걱정 돼'])
+
+    loop_thread, results = asyncio.run(run())
+    assert tokenizer.threads == [loop_thread]
+    assert [score.emotion for score in results] == ['화남', '불안']
@@ -0,0 +1,94 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import lsm_accumulator
+from app.services.lsm_accumulator import LSMAccumulator, LSMCountStore
+from app.services.lsm_analyzer import LSMAnalyzer
+
+
+@pytest.fixture
+def analyzer():
+    # Kiwi 대신 공백 토크나이저 주입
+    tokenizer = MagicMock()
+    tokenizer.tokenize_forms.side_effect = lambda texts: [text.split() for text in texts]
+    return LSMAnalyzer(tokenizer=tokenizer)
+
+
+@pytest.fixture
+def store(monkeypatch, fake_supabase, analyzer):
+    monkeypatch.setattr(lsm_accumulator, 'get_supabase_client', lambda: fake_supabase)
+    return LSMCountStore(analyzer=analyzer)
+
+
+def _message(i, sender, content, created_at):
+    return {'id': f'00000000-0000-0000-0000-{i:012d}', 'sender_id': sender, 'content': content, 'created_at': created_at}
+
+
+MESSAGES = [
+    _message(1, 'a', '나는 우리 그리고 에', '2025-11-20T09:00:00+00:00'),
+    _message(2, 'b', '너는 그 에서 안', '2025-11-20T09:00:00+00:00'),
+    _message(3, 'c', '우리 모든 그래서', '2025-11-20T09:05:00+00:00'),
+    _message(4, 'a', '내가 그거 못 많은', '2025-11-20T10:00:00+00:00'),
+    _message(5, 'b', '나 너 하지만 으로', '2025-11-21T08:00:00+00:00'),
+    _message(6, 'c', '저는 그런데 여러', '2025-11-21T08:00:00+00:00'),
+]
+
+
+def _assert_same_score(actual, expected):
+    assert actual.lsm_score == pytest.approx(expected.lsm_score)
+    assert actual.category_breakdown == pytest.approx(expected.category_breakdown)
+    assert (actual.pairwise is None) == (expected.pairwise is None)
+    if expected.pairwise:
+        assert actual.pairwise.participants == expected.pairwise.participants
+        assert actual.pairwise.matrix == expected.pairwise.matrix
+
+
+def test_accumulator_matches_full_recompute_for_groups(analyzer):
+    accumulator = LSMAccumulator.from_messages(MESSAGES, analyzer)
+    _assert_same_score(accumulator.score(analyzer), analyzer.analyze_conversation(MESSAGES))
+
+
+def test_merged_windows_match_full_recompute(analyzer):
+    first = LSMAccumulator.from_messages(MESSAGES[:3], analyzer)
+    second = LSMAccumulator.from_messages(MESSAGES[3:], analyzer)
+    _assert_same_score((first + second).score(analyzer), analyzer.analyze_conversation(MESSAGES))
+    _assert_same_score(
+        ((first + second) - second).score(analyzer),
+        analyzer.analyze_conversation(MESSAGES[:3]),
+    )
+
+
+def test_two_senders_and_single_sender(analyzer):
+    pair = [msg for msg in MESSAGES if msg['sender_id'] != 'c']
+    _assert_same_score(LSMAccumulator.from_messages(pair, analyzer).score(analyzer), analyzer.analyze_conversation(pair))
+    assert LSMAccumulator().score(analyzer).lsm_score == 0.5
+
+
+def test_store_counts_each_message_once(store, analyzer, fake_supabase):
+    # 같은 시각(09:00) 메시지 중 하나만 먼저 들어온 경우
+    assert store.update('couple', [MESSAGES[0]]) == 1
+
+    # 재실행: 같은 시각 메시지 + 워터마크보다 이른 지연 도착 메시지 + 이미 집계한 메시지
+    late = _message(7, 'a', '그리고 몇', '2025-11-20T08:30:00+00:00')
+    assert store.update('couple', MESSAGES + [late]) == len(MESSAGES)
+    assert store.update('couple', MESSAGES + [late]) == 0
+
+    everything = MESSAGES + [late]
+    _assert_same_score(
+        store.score('couple', date(2025, 11, 20), date(2025, 11, 21)),
+        analyzer.analyze_conversation(everything),
+    )
+    day_one = [msg for msg in everything if msg['created_at'].startswith('2025-11-20')]
+    _assert_same_score(
+        store.score('couple', date(2025, 11, 20), date(2025, 11, 20)),
+        analyzer.analyze_conversation(day_one),
+    )
+
+    row = next(
+        row for row in fake_supabase.tables['lsm_daily_counts']
+        if row['sender_id'] == 'a' and row['count_date'] == '2025-11-20'
+    )
+    assert row['message_count'] == 3
+    assert row['last_message_at'] == '2025-11-20T10:00:00+00:00'
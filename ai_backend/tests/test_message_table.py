@@ -0,0 +1,63 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.services.file_processors.base_processor import ConversationMessage
+from app.services.file_processors.message_table import MessageTable, MessageTableBuilder
+
+
+MESSAGES = [
+    ConversationMessage(timestamp=datetime(2025, 2, 14, 14, 7), sender='딱복 🍑', message='소영님 몸은 괜찮으신가여..'),
+    ConversationMessage(timestamp=datetime(2025, 2, 14, 14, 8, 30, 125), sender='소영', message='네\n괜찮아요'),
+    ConversationMessage(timestamp=None, sender='', message='사진', metadata={'type': 'photo'}),
+    ConversationMessage(timestamp=datetime(2025, 2, 15, 0, 1), sender='민수', message=''),
+    ConversationMessage(timestamp=datetime(2025, 2, 15, 0, 2), sender='딱복 🍑', message='다행이다 😀'),
+]
+
+
+@pytest.fixture
+def table():
+    return MessageTable.from_messages(iter(MESSAGES))
+
+
+def test_round_trip(table):
+    assert len(table) == len(MESSAGES)
+    assert list(table) == MESSAGES
+    assert [table[i] for i in range(len(table))] == MESSAGES
+    assert table[-1] == MESSAGES[-1]
+    assert table.participants() == sorted({'딱복 🍑', '소영', '민수'})
+    assert table.date_range() == {'start': datetime(2025, 2, 14, 14, 7), 'end': datetime(2025, 2, 15, 0, 2)}
+    assert [record['timestamp'] for record in table.to_records()] == [
+        msg.timestamp.isoformat() if msg.timestamp else None for msg in MESSAGES
+    ]
+
+    rebuilt = MessageTable.from_columns(
+        np.array(table.datetimes(), dtype='datetime64[us]'), table.sender_names(), table.messages()
+    )
+    assert [(m.timestamp, m.sender, m.message) for m in rebuilt] == [
+        (m.timestamp, m.sender, m.message) for m in MESSAGES
+    ]
+
+
+@pytest.mark.parametrize('index', [slice(1, 4), slice(None, None, 2), slice(3, 1, -1), slice(4, 2), slice(None)])
+def test_slices_match_list(table, index):
+    sliced = table[index]
+    assert isinstance(sliced, MessageTable)
+    assert list(sliced) == MESSAGES[index]
+    assert sliced.senders == list(dict.fromkeys(msg.sender for msg in MESSAGES[index]))
+
+
+def test_take_and_concat(table):
+    indices = np.array([4, 0, 2, 2])
+    taken = table.take(indices)
+    assert list(taken) == [MESSAGES[i] for i in indices]
+    assert taken.lengths.tolist() == [len(MESSAGES[i].message) for i in indices]
+
+    joined = MessageTable.concat([table[:2], table[2:]])
+    assert list(joined) == MESSAGES
+    assert joined.senders == table.senders
+
+    builder = MessageTableBuilder().extend(MESSAGES[:3])
+    builder.append_message(MESSAGES[3])
+    assert list(builder.build()) == MESSAGES[:4]
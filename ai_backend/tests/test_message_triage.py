@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from app.models.schemas import EmotionScore
+from app.services.emotion_analyzer import BaseEmotionAnalyzer
+from app.services.emotion_cache import CachedEmotionAnalyzer, EmotionResultCache, MemoryCacheBackend
+from app.services.message_triage import MessageTriage, TriagedEmotionAnalyzer, triage_stats
+
+
+class RecordingAnalyzer(BaseEmotionAnalyzer):
+    provider = 'fake'
+    model_name = 'fake'
+
+    def __init__(self):
+        self.seen = []
+
+    async def analyze_emotion(self, text: str) -> EmotionScore:
+        self.seen.append(text)
+        return self._build_emotion_score({'사랑': 0.9, '중립': 0.1})
+
+
+@pytest.fixture(autouse=True)
+def reset_stats():
+    triage_stats.clear()
+
+
+@pytest.mark.parametrize('text, rule', [
+    ('사진', 'media'),
+    ('사진 3장', 'media'),
+    ('삭제된 메시지입니다.', 'deleted'),
+    ('https://example.com/a', 'url'),
+    ('ㅋㅋㅋㅋ', 'laugh'),
+    ('ㅠㅠ', 'cry'),
+    ('ㅇㅇ', 'trivial'),
+    ('ㅇ', 'trivial'),
+    ('?', 'trivial'),
+    ('...', 'trivial'),
+    ('ㅇㅋ', 'trivial'),
+    ('ㄱㄱ!', 'trivial'),
+    ('ㄴㄴ', 'trivial'),
+    ('ㅇㅇㅇ~', 'trivial'),
+    ('   ', 'empty'),
+])
+def test_rules(text, rule):
+    assert MessageTriage().classify(text) == rule
+
+
+@pytest.mark.parametrize('text', [
+    '싫', '❤', '응', '헐', '오늘 뭐해?', '사진 보내줘',
+    # 감정이 담긴 자모 / 문장부호 반응
+    'ㅡㅡ', 'ㅠ', 'ㅜ', 'ㅗ', 'ㅋㅋㅠㅠ', 'ㅎ', ';;', 'ㅡㅡ;',
+])
+def test_meaningful_messages_go_to_model(text):
+    assert MessageTriage().classify(text) is None
+
+
+def test_cache_hits_are_counted_separately():
+    inner = RecordingAnalyzer()
+    cache = EmotionResultCache([MemoryCacheBackend(max_entries=100, ttl_seconds=60)])
+    analyzer = TriagedEmotionAnalyzer(CachedEmotionAnalyzer(inner, cache), MessageTriage())
+
+    async def run():
+        await analyzer.analyze_emotions_batch(['사랑해', 'ㅋㅋㅋ'])
+        return await analyzer.analyze_emotions_batch(['사랑해', '보고싶어', '사진'])
+
+    results = asyncio.run(run())
+
+    assert inner.seen == ['사랑해', '보고싶어']
+    assert [r.emotion for r in results] == ['사랑', '사랑', '중립']
+    assert triage_stats['analyzed'] == 2
+    assert triage_stats['cache_hit'] == 1
+    assert triage_stats['laugh'] == 1 and triage_stats['media'] == 1
+
+
+def test_context_dependent_rules_are_left_to_model_in_conversations():
+    inner = RecordingAnalyzer()
+    analyzer = TriagedEmotionAnalyzer(inner, MessageTriage())
+    messages = [{'sender_id': 'a', 'content': c} for c in ['ㅋㅋㅋ', '사진', '싫']]
+
+    results = asyncio.run(analyzer.analyze_conversation_emotions(messages))
+
+    assert inner.seen == ['ㅋㅋㅋ', '싫']
+    assert results[1].emotion == '중립'
+    assert triage_stats['analyzed'] == 2
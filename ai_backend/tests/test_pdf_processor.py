@@ -0,0 +1,133 @@
+import asyncio
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import pdfplumber
+import pytest
+
+from app.core.config import get_settings
+from app.services.file_processors import pdf_processor
+from app.services.file_processors.pdf_processor import PAGES_PER_TASK, PdfProcessor, extract_page_range
+
+
+class FakePage:
+    def __init__(self, text, delay=0.0):
+        self.text = text
+        self.delay = delay
+        self.closed = False
+
+    def extract_text(self):
+        time.sleep(self.delay)
+        return self.text
+
+    def close(self):
+        self.closed = True
+
+
+class FakePdf:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class InlineExecutor(Executor):
+    """작업을 제출한 스레드(메인 스레드)에서 바로 실행 (워커 프로세스처럼 SIGALRM 제한 시간이 걸림)"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+def _english_page(day, count):
+    header = 'KakaoTalk Chats with 소영\nDate Saved : March 1, 2025 at 9:00 AM\n\n' if day == 1 else ''
+    return header + '\n'.join(
+        f"February {day}, 2025 at {1 + i % 12}:{i:02d} {'AM' if i % 2 else 'PM'}, {('딱복', '소영')[i % 2]} : {day}일 메시지 {i}"
+        for i in range(count)
+    )
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """pdfplumber.open을 메모리 페이지로 대체 (pages 인자는 1부터 시작하는 페이지 번호)"""
+    document = []
+
+    def fake_open(path, pages=None):
+        return FakePdf([document[n - 1] for n in pages] if pages else list(document))
+
+    monkeypatch.setattr(pdfplumber, 'open', fake_open)
+    return document
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, 'pdf_page_workers', 3)
+    monkeypatch.setattr(settings, 'pdf_page_timeout_seconds', 0.05)
+    return settings
+
+
+def _process(**kwargs):
+    return asyncio.run(PdfProcessor().process('chat.pdf', **kwargs))
+
+
+def test_slow_page_is_skipped_with_warning(monkeypatch, pages, settings):
+    monkeypatch.setattr(pdf_processor, 'get_parse_executor', InlineExecutor)
+    pages += [FakePage(_english_page(1, 3)), FakePage('느린 페이지', delay=1.0), FakePage(_english_page(2, 2))]
+
+    result = _process()
+
+    assert result.success
+    assert result.warnings == ['1개 페이지가 제한 시간을 넘겨 제외되었습니다 (페이지: 2)']
+    assert [msg.message for msg in result.conversations] == [
+        '1일 메시지 0', '1일 메시지 1', '1일 메시지 2', '2일 메시지 0', '2일 메시지 1',
+    ]
+    assert sorted(result.participants) == ['딱복', '소영']
+    assert all(page.closed for page in pages)
+    # 대화가 파싱되면 원본 텍스트는 요청할 때만
+    assert result.raw_text is None
+
+
+def test_page_ranges_keep_file_order(monkeypatch, pages, settings):
+    executor = ThreadPoolExecutor(max_workers=3)
+    monkeypatch.setattr(pdf_processor, 'get_parse_executor', lambda: executor)
+    # 앞 구간일수록 늦게 끝남 (2월 안에서 날짜를 쓰도록 3구간)
+    range_count = 3
+    for day in range(1, range_count * PAGES_PER_TASK + 1):
+        delay = 0.02 * (range_count - (day - 1) // PAGES_PER_TASK)
+        pages.append(FakePage(_english_page(day, 2), delay=delay / PAGES_PER_TASK))
+
+    try:
+        result = _process(keep_raw_text=True)
+    finally:
+        executor.shutdown()
+
+    assert result.success and result.warnings == []
+    assert [msg.message for msg in result.conversations] == [
+        f'{day}일 메시지 {i}' for day in range(1, len(pages) + 1) for i in range(2)
+    ]
+    assert result.raw_text == '\n'.join(page.text for page in pages)
+
+
+def test_unparsed_text_is_returned_as_raw_text(monkeypatch, pages, settings):
+    monkeypatch.setattr(pdf_processor, 'get_parse_executor', InlineExecutor)
+    pages += [FakePage('회의록\n1. 안건'), FakePage(''), FakePage('2. 결론')]
+
+    result = _process()
+
+    assert result.success and result.conversations == []
+    assert result.raw_text == '회의록\n1. 안건\n2. 결론'
+
+
+def test_extract_page_range_without_timeout(pages):
+    pages += [FakePage('a'), FakePage(None), FakePage('c', delay=0.01)]
+
+    assert extract_page_range('chat.pdf', 1, 3, page_timeout=0) == (['', 'c'], [])
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from app.services import circuit_breaker
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.provider_executor import ProviderExecutor
+from app.services.rate_limiter import ProviderRateLimiter
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    """테스트 제공자 전용 서킷 브레이커 (전역 레지스트리와 분리)"""
+    breaker = CircuitBreaker('test', failure_rate_threshold=0.5, window_size=4, min_calls=2, open_seconds=60)
+    monkeypatch.setitem(circuit_breaker._breakers, 'test', breaker)
+    return breaker
+
+
+def _executor(**kwargs) -> ProviderExecutor:
+    return ProviderExecutor(
+        limits={'test': 2},
+        default_timeout=1.0,
+        rate_limiters={'test': ProviderRateLimiter('test', 6000, 10 ** 9)},
+        **kwargs,
+    )
+
+
+def test_successful_call_records_latency_and_success(breaker):
+    executor = _executor()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        return 'ok'
+
+    async def run():
+        return [await executor.run('test', call) for _ in range(3)]
+
+    assert asyncio.run(run()) == ['ok'] * 3
+    assert breaker.stats() == {'state': 'closed', 'window_calls': 3, 'failure_rate': 0.0}
+    assert executor.latency_percentile('test', 50, min_samples=3) >= 0.01
+    assert len(executor._latencies['test']) == 3
+    assert executor._latencies['test'].maxlen == ProviderExecutor.LATENCY_WINDOW
+
+
+def test_latency_bookkeeping_error_is_not_a_provider_failure(breaker, monkeypatch):
+    executor = _executor()
+
+    def broken_record(provider, seconds):
+        raise RuntimeError('bookkeeping bug')
+
+    monkeypatch.setattr(executor, '_record_latency', broken_record)
+
+    async def call():
+        return 'ok'
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(executor.run('test', call))
+    assert breaker.stats()['failure_rate'] == 0.0
+
+
+def test_failures_open_the_circuit(breaker):
+    executor = _executor()
+
+    async def failing():
+        raise ValueError('bad response')
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await executor.run('test', failing)
+        with pytest.raises(CircuitOpenError):
+            await executor.run('test', failing)
+
+    asyncio.run(run())
+    assert breaker.state == 'open'
+
+
+def test_timeout_is_retried_then_raised(breaker):
+    executor = _executor(max_retries=1, backoff_base=0.001, backoff_max=0.001)
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(executor.run('test', slow, timeout=0.01))
+    assert len(calls) == 2
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from google.ai import generativelanguage as glm
+
+from app.core.config import get_settings
+from app.services.provider_registry import ProviderRegistry
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, 'openai_api_key', 'sk-test')
+    monkeypatch.setattr(settings, 'gemini_api_key', 'gemini-test')
+    return ProviderRegistry()
+
+
+def _in_new_loop(coro_factory):
+    """별도 스레드의 새 이벤트 루프에서 실행 (리스너 스레드와 같은 상황)"""
+    result = {}
+
+    def run():
+        result['value'] = asyncio.run(coro_factory())
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    return result['value']
+
+
+def test_clients_are_cached_per_event_loop(registry):
+    async def clients():
+        first = registry.openai_client()
+        assert registry.openai_client() is first
+        analyzer = registry.emotion_analyzer('openai')
+        assert registry.emotion_analyzer('openai') is analyzer
+        await registry.aclose()
+        return first, analyzer
+
+    main_client, main_analyzer = asyncio.run(clients())
+    thread_client, thread_analyzer = _in_new_loop(clients)
+
+    assert main_client is not thread_client
+    assert main_analyzer is not thread_analyzer
+    assert main_client._client is not thread_client._client
+
+
+def test_gemini_async_client_is_per_loop(registry):
+    async def model():
+        gemini = registry.gemini_model('gemini-1.5-flash')
+        assert registry.gemini_model('gemini-1.5-flash') is gemini
+        async_client = gemini._async_client
+        await registry.aclose()
+        return async_client
+
+    first = asyncio.run(model())
+    second = _in_new_loop(model)
+    assert first is not None and second is not None
+    assert first is not second
+
+
+def test_aclose_closes_http_pool(registry):
+    async def run():
+        client = registry.openai_client()
+        await registry.aclose()
+        return client
+
+    client = asyncio.run(run())
+    assert client._client.is_closed
+
+
+def test_local_analyzer_is_shared_across_loops(registry):
+    async def local():
+        return registry.emotion_analyzer('local')
+
+    assert asyncio.run(local()) is _in_new_loop(local)
+
+
+def test_gemini_model_uses_injected_async_client(registry):
+    # provider_registry는 GenerativeModel._async_client에 루프별 클라이언트를 넣음
+    # google-generativeai 버전을 올려 이 동작이 바뀌면 여기서 실패
+    class Injected(Exception):
+        pass
+
+    async def call():
+        gemini = registry.gemini_model('gemini-1.5-flash')
+        assert isinstance(gemini._async_client, glm.GenerativeServiceAsyncClient)
+        gemini._async_client = MagicMock()
+        gemini._async_client.generate_content = AsyncMock(side_effect=Injected)
+        try:
+            await gemini.generate_content_async('안녕')
+        finally:
+            await registry.aclose()
+
+    with pytest.raises(Injected):
+        asyncio.run(call())
@@ -0,0 +1,80 @@
+import asyncio
+
+from app.services.rate_limiter import Priority, ProviderRateLimiter, retry_with_backoff
+
+
+def _drained_limiter(requests_per_minute: int) -> ProviderRateLimiter:
+    limiter = ProviderRateLimiter('test', requests_per_minute, tokens_per_minute=10 ** 9)
+    limiter.requests.tokens = 0.0
+    return limiter
+
+
+def test_interactive_requests_jump_ahead_of_bulk():
+    limiter = _drained_limiter(requests_per_minute=6000)
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(1, priority)
+        order.append(name)
+
+    async def run():
+        bulk = [asyncio.create_task(request(f'bulk{i}', Priority.BULK)) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request('interactive', Priority.INTERACTIVE))
+        await asyncio.gather(*bulk, interactive)
+
+    asyncio.run(run())
+    assert order.index('interactive') <= 1
+    assert [name for name in order if name.startswith('bulk')] == ['bulk0', 'bulk1', 'bulk2']
+
+
+def test_queued_waiters_do_not_poll(monkeypatch):
+    limiter = _drained_limiter(requests_per_minute=6000)  # 100/s → 20건에 약 0.2초
+    sleeps = []
+    original_sleep = asyncio.sleep
+
+    async def counting_sleep(delay, *args, **kwargs):
+        sleeps.append(delay)
+        return await original_sleep(delay, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, 'sleep', counting_sleep)
+
+    async def run():
+        await asyncio.gather(*(limiter.acquire(1, Priority.BULK) for _ in range(20)))
+
+    asyncio.run(run())
+    # 맨 앞 요청만 버킷 대기로 잠듦 (10ms 폴링이면 수백 번)
+    assert len(sleeps) <= 2 * 20
+    assert limiter.stats()['queue_length'] == 0
+    assert limiter.stats()['wait_time']['BULK']['count'] == 20
+
+
+def test_cancelled_head_wakes_next_waiter():
+    limiter = _drained_limiter(requests_per_minute=600)  # 10/s
+
+    async def run():
+        head = asyncio.create_task(limiter.acquire(1, Priority.INTERACTIVE))
+        follower = asyncio.create_task(limiter.acquire(1, Priority.INTERACTIVE))
+        await asyncio.sleep(0.01)
+        head.cancel()
+        await asyncio.wait_for(follower, timeout=1.0)
+        return head.cancelled()
+
+    assert asyncio.run(run())
+    assert limiter.stats()['queue_length'] == 0
+
+
+def test_retry_with_backoff_retries_rate_limit_errors():
+    class RateLimited(Exception):
+        status_code = 429
+
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RateLimited()
+        return 'ok'
+
+    result = asyncio.run(retry_with_backoff(call, max_retries=3, base_delay=0.001, max_delay=0.01))
+    assert result == 'ok' and len(attempts) == 3
@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.services import response_latency
+from app.services.response_latency import ResponseLatencyAnalyzer, ResponseLatencyStore
+
+
+@pytest.fixture
+def store(monkeypatch, fake_supabase):
+    monkeypatch.setattr(response_latency, 'get_supabase_client', lambda: fake_supabase)
+    return ResponseLatencyStore(analyzer=ResponseLatencyAnalyzer(utc_offset_hours=9))
+
+
+def _conversations(days, start=datetime(2025, 11, 10, 7, tzinfo=timezone.utc)):
+    """하루 여러 번 주고받는 대화 (자정을 넘는 응답 포함)"""
+    rows = []
+    for day in range(days):
+        base = start + timedelta(days=day)
+        for i in range(12):
+            rows.append({
+                'couple_id': 'couple',
+                'sender_id': 'a' if (i + day) % 3 else 'b',
+                'created_at': (base + timedelta(minutes=37 * i + day)).isoformat(sep=' '),
+            })
+        # 17:00 UTC 마지막 메시지 → 다음 날 07:00 첫 메시지가 응답
+        rows.append({'couple_id': 'couple', 'sender_id': 'b', 'created_at': (base + timedelta(hours=17)).isoformat(sep=' ')})
+    return rows
+
+
+def test_incremental_refresh_matches_full_recompute(store, fake_supabase):
+    conversations = _conversations(6)
+    end_date = date(2025, 11, 15)
+
+    fetched = []
+    fetch_messages = store._fetch_messages
+    store._fetch_messages = lambda couple_id, start, end: fetched.append(start) or fetch_messages(couple_id, start, end)
+
+    # 하루씩 도착하는 메시지로 매일 갱신
+    for day in range(6):
+        current = date(2025, 11, 10) + timedelta(days=day)
+        fake_supabase.tables['conversations'] = [
+            row for row in conversations if row['created_at'] < f"{current + timedelta(days=1)}"
+        ]
+        store.refresh('couple', current, days=4)
+
+    # 기간 첫 응답은 기간 직전 마지막 메시지에 대한 응답
+    window_start = max(row['created_at'] for row in conversations if row['created_at'] < '2025-11-12')
+    full = store.analyzer.analyze([
+        {'sender_id': row['sender_id'], 'timestamp': row['created_at']}
+        for row in conversations if window_start <= row['created_at'] < f"{end_date + timedelta(days=1)}"
+    ])
+    assert store.load('couple') == full
+
+    # 첫 갱신만 기간 전체를 조회하고 이후에는 마지막 저장 날짜부터만 조회
+    assert fetched == [date(2025, 11, 7)] + [date(2025, 11, 10) + timedelta(days=day) for day in range(5)]
+
+    # 기간이 지난 표본은 정리
+    assert {row['sample_date'] for row in fake_supabase.tables['response_latency_daily_samples']} == {
+        str(end_date - timedelta(days=offset)) for offset in range(4)
+    }
+
+
+def test_late_messages_on_last_stored_day_are_included(store, fake_supabase):
+    conversations = _conversations(2)
+    fake_supabase.tables['conversations'] = conversations[:20]
+    store.refresh('couple', date(2025, 11, 11), days=2)
+
+    fake_supabase.tables['conversations'] = conversations
+    stats = store.refresh('couple', date(2025, 11, 11), days=2)
+
+    full = store.analyzer.analyze([
+        {'sender_id': row['sender_id'], 'timestamp': row['created_at']} for row in conversations
+    ])
+    assert stats == full
@@ -0,0 +1,65 @@
+import pytest
+
+from app.services import turn_taking_store
+from app.services.turn_taking_analyzer import TurnTakingAccumulator, TurnTakingAnalyzer
+from app.services.turn_taking_store import TurnTakingStateStore
+
+
+@pytest.fixture
+def store(monkeypatch, fake_supabase):
+    monkeypatch.setattr(turn_taking_store, 'get_supabase_client', lambda: fake_supabase)
+    return TurnTakingStateStore()
+
+
+def _message(i, sender, created_at):
+    return {
+        'id': f'00000000-0000-0000-0000-{i:012d}',
+        'sender_id': sender,
+        'content': '안녕' * i,
+        'created_at': created_at,
+    }
+
+
+MESSAGES = [
+    _message(1, 'a', '2025-11-20T09:00:00+00:00'),
+    _message(2, 'b', '2025-11-20T09:01:00+00:00'),
+    _message(3, 'b', '2025-11-20T09:02:00+00:00'),
+    _message(4, 'a', '2025-11-20T09:10:00+00:00'),
+    _message(5, 'b', '2025-11-20T09:10:00+00:00'),
+    _message(6, 'a', '2025-11-21T08:00:00+00:00'),
+    _message(7, 'b', '2025-11-21T08:00:30+00:00'),
+]
+
+
+def _batch(messages):
+    return TurnTakingAnalyzer().analyze_conversation(
+        [{'sender_id': msg['sender_id'], 'content': msg['content'], 'timestamp': msg['created_at']} for msg in messages]
+    )
+
+
+def test_store_resumes_accumulator_across_runs(store, fake_supabase):
+    # 첫 실행은 같은 시각(09:10) 메시지 중 하나까지만 반영
+    store.update('couple', MESSAGES[:4])
+    # 재실행: 이미 반영한 메시지는 건너뛰고 같은 시각 메시지는 ID로 구분
+    accumulator = store.update('couple', MESSAGES[:6])
+    assert accumulator.total_messages == 6
+    assert store.update('couple', MESSAGES).total_messages == len(MESSAGES)
+    assert store.update('couple', MESSAGES).total_messages == len(MESSAGES)
+
+    assert store.snapshot('couple') == _batch(MESSAGES)
+
+    row = fake_supabase.tables['turn_taking_state'][0]
+    assert row['message_count'] == len(MESSAGES)
+    assert row['last_message_at'] == MESSAGES[-1]['created_at']
+
+
+def test_restored_accumulator_keeps_response_quantiles(store):
+    store.update('couple', MESSAGES)
+    restored = store.load('couple')
+
+    direct = TurnTakingAccumulator()
+    direct.add_many(
+        {'sender_id': msg['sender_id'], 'content': msg['content'], 'timestamp': msg['created_at']} for msg in MESSAGES
+    )
+    assert restored.response_time_quantile(0.5) == direct.response_time_quantile(0.5)
+    assert restored.response_time_quantile(0.9) == direct.response_time_quantile(0.9)
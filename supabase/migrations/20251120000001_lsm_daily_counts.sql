@@ -0,0 +1,52 @@
+-- ============================================================
+-- LSM 기능어 개수 누적 테이블
+-- ============================================================
+-- 생성일: 2025-11-20
+-- 설명: 커플별 · 발신자별 · 날짜별 기능어 카테고리 개수
+--       새 메시지만 형태소 분석해 더하고, 기간 LSM은 저장된 개수 합산으로 계산
+-- 사용: ai_backend/app/services/lsm_accumulator.py
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS lsm_daily_counts (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  couple_id UUID NOT NULL,
+  sender_id UUID NOT NULL,
+  count_date DATE NOT NULL,
+
+  -- 기능어 카테고리별 개수
+  category_counts JSONB NOT NULL DEFAULT '{}',  -- {"personal_pronouns": 12, "you_pronouns": 7, ...}
+  message_count INT NOT NULL DEFAULT 0,
+
+  -- 마지막으로 집계한 메시지 시각 (재실행 시 중복 집계 방지)
+  last_message_at TIMESTAMP WITH TIME ZONE,
+
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  CONSTRAINT fk_lsm_counts_couple
+    FOREIGN KEY (couple_id)
+    REFERENCES couples(id)
+    ON DELETE CASCADE,
+
+  CONSTRAINT unique_lsm_counts_sender_date UNIQUE(couple_id, sender_id, count_date)
+);
+
+-- 인덱스 (기간 조회)
+CREATE INDEX IF NOT EXISTS idx_lsm_counts_couple_date ON lsm_daily_counts(couple_id, count_date DESC);
+
+-- RLS (AI 백엔드는 Service Role로 우회)
+ALTER TABLE lsm_daily_counts ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "LSM counts visible to couple members"
+ON lsm_daily_counts FOR SELECT
+USING (
+  EXISTS (
+    SELECT 1 FROM couples
+    WHERE id = lsm_daily_counts.couple_id
+    AND (user_a_id = auth.uid() OR user_b_id = auth.uid())
+  )
+);
+
+-- 코멘트
+COMMENT ON TABLE lsm_daily_counts IS '일별 LSM 기능어 개수 누적 (발신자별)';
+COMMENT ON COLUMN lsm_daily_counts.category_counts IS '기능어 카테고리별 개수 JSON';
+COMMENT ON COLUMN lsm_daily_counts.last_message_at IS '집계에 반영된 마지막 메시지 created_at';
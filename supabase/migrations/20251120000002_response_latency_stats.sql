@@ -0,0 +1,54 @@
+-- ============================================================
+-- 응답 지연 분포 (커플별 사전 계산 결과)
+-- ============================================================
+-- 생성일: 2025-11-20
+-- 설명: 상대 메시지에 답하기까지 걸린 시간의 분위수, 발신자별 분위수,
+--       요일 × 시간(7×24) 히트맵을 일별 배치가 계산해 저장
+-- 사용: ai_backend/app/services/response_latency.py
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS response_latency_stats (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  couple_id UUID NOT NULL,
+
+  -- 집계 기간
+  period_start DATE NOT NULL,
+  period_end DATE NOT NULL,
+
+  -- 전체 분포
+  response_count INT NOT NULL DEFAULT 0,
+  percentiles JSONB,                  -- {"p50": 42.0, "p90": 610.0, "p99": 7200.0} (초)
+  per_sender JSONB,                   -- [{"sender_id": "...", "response_count": 120, "p50": 30.0, ...}]
+
+  -- 요일 × 시간 히트맵 (길이 168, 요일(0=월) * 24 + 시 순서)
+  heatmap_counts INT[] NOT NULL DEFAULT '{}',
+  heatmap_median_seconds REAL[] NOT NULL DEFAULT '{}',
+
+  computed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  CONSTRAINT fk_latency_stats_couple
+    FOREIGN KEY (couple_id)
+    REFERENCES couples(id)
+    ON DELETE CASCADE,
+
+  CONSTRAINT unique_latency_stats_couple UNIQUE(couple_id)
+);
+
+-- RLS (AI 백엔드는 Service Role로 우회)
+ALTER TABLE response_latency_stats ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Latency stats visible to couple members"
+ON response_latency_stats FOR SELECT
+USING (
+  EXISTS (
+    SELECT 1 FROM couples
+    WHERE id = response_latency_stats.couple_id
+    AND (user_a_id = auth.uid() OR user_b_id = auth.uid())
+  )
+);
+
+-- 코멘트
+COMMENT ON TABLE response_latency_stats IS '커플별 응답 지연 분포 (차트용 사전 계산)';
+COMMENT ON COLUMN response_latency_stats.percentiles IS '응답 지연 분위수 (초, 1시간 상한 없음)';
+COMMENT ON COLUMN response_latency_stats.heatmap_counts IS '요일 × 시간 응답 수 (KST, 행 우선 168칸)';
+COMMENT ON COLUMN response_latency_stats.heatmap_median_seconds IS '요일 × 시간 응답 지연 중앙값 (초, 행 우선 168칸)';
@@ -0,0 +1,24 @@
+-- ============================================================
+-- 키워드 TF-IDF 문서 빈도 색인
+-- ============================================================
+-- 생성일: 2025-11-20
+-- 설명: 커플별 / 전체(scope = 'global') 용어 문서 빈도(df)
+--       일별 배치가 분석한 날짜의 문서만 더해 갱신 (과거 대화 재분석 없음)
+-- 사용: ai_backend/app/services/keyword_extractor.py
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS keyword_df_index (
+  scope TEXT PRIMARY KEY,             -- 'global' 또는 couple_id
+
+  n_docs INT NOT NULL DEFAULT 0,      -- 반영된 문서(커플-날짜) 수
+  last_doc_key TEXT,                  -- 마지막으로 반영한 문서 키 (커플 색인: 분석 날짜)
+  df JSONB NOT NULL DEFAULT '{}',     -- {"영화": 12, "파스타": 3, ...}
+
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- 서버 전용 데이터 (Service Role만 접근)
+ALTER TABLE keyword_df_index ENABLE ROW LEVEL SECURITY;
+
+COMMENT ON TABLE keyword_df_index IS '키워드 추출용 누적 문서 빈도 색인 (커플별 + 전체)';
+COMMENT ON COLUMN keyword_df_index.df IS '용어별 문서 빈도 JSON';
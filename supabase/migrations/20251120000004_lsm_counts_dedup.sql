@@ -0,0 +1,32 @@
+-- ============================================================
+-- LSM 기능어 개수 누적 테이블 - 메시지 ID 기준 중복 방지 / updated_at 갱신
+-- ============================================================
+-- 생성일: 2025-11-20
+-- 설명: last_message_at 워터마크(>)는 같은 시각의 메시지나 늦게 도착한 메시지를 빠뜨리므로
+--       집계에 반영한 메시지 ID를 저장해 메시지마다 한 번씩만 집계
+--       upsert로 갱신될 때 updated_at이 바뀌도록 트리거 추가
+-- 사용: ai_backend/app/services/lsm_accumulator.py
+-- ============================================================
+
+ALTER TABLE lsm_daily_counts
+  ADD COLUMN IF NOT EXISTS counted_message_ids UUID[] NOT NULL DEFAULT '{}';
+
+-- updated_at 자동 갱신
+CREATE OR REPLACE FUNCTION set_lsm_daily_counts_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.updated_at = NOW();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_lsm_daily_counts_updated_at ON lsm_daily_counts;
+
+CREATE TRIGGER trg_lsm_daily_counts_updated_at
+BEFORE UPDATE ON lsm_daily_counts
+FOR EACH ROW
+EXECUTE FUNCTION set_lsm_daily_counts_updated_at();
+
+-- 코멘트
+COMMENT ON COLUMN lsm_daily_counts.counted_message_ids IS '집계에 반영된 메시지(conversations.id) 목록 (재실행 / 지연 도착 시 중복 집계 방지)';
+COMMENT ON COLUMN lsm_daily_counts.last_message_at IS '집계에 반영된 가장 늦은 메시지 created_at (참고용, 중복 판단에는 counted_message_ids 사용)';
@@ -0,0 +1,50 @@
+-- ============================================================
+-- 턴테이킹 누적 상태 (커플별)
+-- ============================================================
+-- 생성일: 2025-11-20
+-- 설명: TurnTakingAccumulator 상태(발신자별 개수 / 응답 시간 합 / 분위수 스케치)를 저장하고
+--       일별 배치가 새 메시지만 이어서 반영 (과거 메시지 재조회 없음)
+-- 사용: ai_backend/app/services/turn_taking_store.py
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS turn_taking_state (
+  couple_id UUID PRIMARY KEY,
+
+  state JSONB NOT NULL DEFAULT '{}',          -- TurnTakingAccumulator.to_dict()
+  message_count INT NOT NULL DEFAULT 0,       -- 반영된 메시지 수
+
+  -- 마지막으로 반영한 메시지 시각과 그 시각의 메시지 ID (재실행 시 중복 반영 방지)
+  last_message_at TIMESTAMP WITH TIME ZONE,
+  last_message_ids UUID[] NOT NULL DEFAULT '{}',
+
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  CONSTRAINT fk_turn_taking_state_couple
+    FOREIGN KEY (couple_id)
+    REFERENCES couples(id)
+    ON DELETE CASCADE
+);
+
+-- updated_at 자동 갱신
+CREATE OR REPLACE FUNCTION set_turn_taking_state_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.updated_at = NOW();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_turn_taking_state_updated_at ON turn_taking_state;
+
+CREATE TRIGGER trg_turn_taking_state_updated_at
+BEFORE UPDATE ON turn_taking_state
+FOR EACH ROW
+EXECUTE FUNCTION set_turn_taking_state_updated_at();
+
+-- 서버 전용 데이터 (Service Role만 접근)
+ALTER TABLE turn_taking_state ENABLE ROW LEVEL SECURITY;
+
+-- 코멘트
+COMMENT ON TABLE turn_taking_state IS '커플별 스트리밍 턴테이킹 누적 상태';
+COMMENT ON COLUMN turn_taking_state.state IS 'TurnTakingAccumulator 상태 JSON (응답 시간 분위수 스케치 포함)';
+COMMENT ON COLUMN turn_taking_state.last_message_ids IS 'last_message_at 시각에 반영된 메시지 ID';
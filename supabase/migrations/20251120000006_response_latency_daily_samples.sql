@@ -0,0 +1,61 @@
+-- ============================================================
+-- 응답 지연 일별 표본 (커플별)
+-- ============================================================
+-- 생성일: 2025-11-20
+-- 설명: 응답 날짜별 응답 지연 표본을 저장해 두고, 일별 배치는 마지막으로 저장한 날짜부터의
+--       메시지만 조회 (기간 분포는 저장된 표본을 합쳐 계산, 전체 기간 메시지 재조회 없음)
+-- 사용: ai_backend/app/services/response_latency.py
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS response_latency_daily_samples (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  couple_id UUID NOT NULL,
+  sample_date DATE NOT NULL,               -- 응답 메시지의 날짜 (UTC, created_at 기준)
+
+  sender_ids UUID[] NOT NULL DEFAULT '{}',         -- 그 날 메시지 발신자 (등장 순서)
+
+  -- 응답 1건 = 같은 위치의 배열 원소
+  responder_ids UUID[] NOT NULL DEFAULT '{}',
+  gaps DOUBLE PRECISION[] NOT NULL DEFAULT '{}',   -- 응답 지연 (초)
+  cells SMALLINT[] NOT NULL DEFAULT '{}',          -- 요일(0=월) * 24 + 시 (KST)
+
+  -- 그 날 마지막 메시지 (다음 날 첫 응답의 지연 계산용)
+  message_count INT NOT NULL DEFAULT 0,
+  last_sender_id UUID,
+  last_message_at TIMESTAMP WITH TIME ZONE,
+
+  updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+  CONSTRAINT fk_latency_samples_couple
+    FOREIGN KEY (couple_id)
+    REFERENCES couples(id)
+    ON DELETE CASCADE,
+
+  CONSTRAINT unique_latency_samples_couple_date UNIQUE(couple_id, sample_date)
+);
+
+-- 인덱스 (기간 조회)
+CREATE INDEX IF NOT EXISTS idx_latency_samples_couple_date ON response_latency_daily_samples(couple_id, sample_date DESC);
+
+-- updated_at 자동 갱신
+CREATE OR REPLACE FUNCTION set_response_latency_daily_samples_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+  NEW.updated_at = NOW();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_response_latency_daily_samples_updated_at ON response_latency_daily_samples;
+
+CREATE TRIGGER trg_response_latency_daily_samples_updated_at
+BEFORE UPDATE ON response_latency_daily_samples
+FOR EACH ROW
+EXECUTE FUNCTION set_response_latency_daily_samples_updated_at();
+
+-- 서버 전용 데이터 (Service Role만 접근)
+ALTER TABLE response_latency_daily_samples ENABLE ROW LEVEL SECURITY;
+
+-- 코멘트
+COMMENT ON TABLE response_latency_daily_samples IS '커플별 응답 지연 일별 표본 (response_latency_stats 증분 계산용)';
+COMMENT ON COLUMN response_latency_daily_samples.cells IS '응답 시각의 요일 × 시간 칸 (KST, 0~167)';
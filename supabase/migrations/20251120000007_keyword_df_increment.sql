@@ -0,0 +1,47 @@
+-- ============================================================
+-- 키워드 df 색인 - 서버 측 원자적 증분 갱신
+-- ============================================================
+-- 생성일: 2025-11-20
+-- 설명: 행 전체를 upsert하면 여러 워커가 동시에 저장할 때 서로의 증가분을 덮어쓰므로
+--       워커는 마지막 저장 이후 늘어난 문서 수 / 용어별 df만 보내고 DB에서 더함
+--       (ON CONFLICT 행 잠금으로 같은 scope 갱신은 직렬화)
+--       last_doc_key가 있는 증분은 저장된 키보다 클 때만 반영 (같은 날짜 재실행 시 중복 방지)
+-- 사용: ai_backend/app/services/keyword_extractor.py (KeywordIndexStore.save)
+-- ============================================================
+
+CREATE OR REPLACE FUNCTION increment_keyword_df(
+  p_scope TEXT,
+  p_n_docs INT,
+  p_last_doc_key TEXT,
+  p_df JSONB
+)
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO keyword_df_index AS idx (scope, n_docs, last_doc_key, df, updated_at)
+  VALUES (p_scope, p_n_docs, p_last_doc_key, COALESCE(p_df, '{}'::jsonb), NOW())
+  ON CONFLICT (scope) DO UPDATE SET
+    n_docs = idx.n_docs + EXCLUDED.n_docs,
+    last_doc_key = GREATEST(idx.last_doc_key, EXCLUDED.last_doc_key),
+    df = (
+      SELECT COALESCE(jsonb_object_agg(term, total), '{}'::jsonb)
+      FROM (
+        SELECT merged.key AS term, SUM(merged.value::BIGINT) AS total
+        FROM (
+          SELECT key, value FROM jsonb_each_text(idx.df)
+          UNION ALL
+          SELECT key, value FROM jsonb_each_text(EXCLUDED.df)
+        ) AS merged
+        GROUP BY merged.key
+      ) AS summed
+    ),
+    updated_at = NOW()
+  WHERE EXCLUDED.last_doc_key IS NULL
+     OR idx.last_doc_key IS NULL
+     OR idx.last_doc_key < EXCLUDED.last_doc_key;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 서버 전용 (Service Role만 호출)
+REVOKE EXECUTE ON FUNCTION increment_keyword_df(TEXT, INT, TEXT, JSONB) FROM PUBLIC, anon, authenticated;
+
+COMMENT ON FUNCTION increment_keyword_df(TEXT, INT, TEXT, JSONB) IS '키워드 df 색인에 문서 수 / 용어별 df 증가분을 원자적으로 더함';